@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Measure the validation of a dynamic port namespace with many values.
+
+Run as::
+
+    python benchmarks/dynamic_ports.py [--keys 10 100 1000 10000 100000] [--repeat 3]
+
+For each number of keys a dynamic namespace is validated that contains that many values, half of them directly in the
+namespace and half of them in nested dictionaries, both with ``PortNamespace.validate`` and with the validator compiled
+for a sealed specification. The validation of a namespace with unexpected ports is measured as well, which includes
+formatting the error message. The reported numbers are the best time per key, which should be independent of the
+number of keys.
+"""
+
+import argparse
+import time
+import timeit
+from typing import Any, Callable, Dict
+
+from plumpy import PortNamespace
+
+
+def create_values(keys: int) -> Dict[str, Any]:
+    """Return port values with the given number of keys, half of which are nested."""
+    values: Dict[str, Any] = {f'key_{index}': index for index in range(keys - keys // 2)}
+    values['nested'] = {f'group_{index}': {'value': index} for index in range(keys // 2)}
+    return values
+
+
+def measure(validate: Callable[[], Any], keys: int, repeat: int) -> float:
+    """Return the best time in seconds per key."""
+    number = max(1, 100000 // keys)
+    return min(timeit.repeat(validate, timer=time.perf_counter, number=number, repeat=repeat)) / (number * keys)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--keys', type=int, nargs='+', default=[10, 100, 1000, 10000, 100000], help='the numbers of keys'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='the number of repetitions, the best one is reported')
+    args = parser.parse_args()
+
+    dynamic = PortNamespace('inputs', valid_type=int)
+    static = PortNamespace('inputs')
+    compiled = dynamic.compile_validator()
+
+    for keys in args.keys:
+        values = create_values(keys)
+        assert dynamic.validate(values) is None
+        assert compiled(values) is None
+        assert static.validate(values) is not None
+
+        plain = measure(lambda: dynamic.validate(values), keys, args.repeat)
+        fast = measure(lambda: compiled(values), keys, args.repeat)
+        unexpected = measure(lambda: static.validate(values), keys, args.repeat)
+        print(
+            f'{keys:>8} keys  validate {plain * 1e9:>8.1f}ns  compiled {fast * 1e9:>8.1f}ns  '
+            f'unexpected {unexpected * 1e9:>8.1f}ns per key'
+        )
+
+
+if __name__ == '__main__':
+    main()
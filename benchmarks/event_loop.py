@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Compare the stock asyncio event loop with uvloop for typical process workloads.
+
+Run as::
+
+    python benchmarks/event_loop.py [--number 2000] [--repeat 3]
+
+For each available event loop implementation the following is timed:
+
+* creating processes
+* stepping processes until they terminate
+* RPC round-trips to a waiting process, through a local communicator
+* launching processes through a :class:`plumpy.ProcessLauncher` task subscriber, through a local communicator
+
+Implementations that are not installed, typically ``uvloop``, are skipped. The implementation is selected through
+``plumpy.settings.event_loop``, exactly as it would be in production.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Callable, Dict
+
+import kiwipy
+
+import plumpy
+from plumpy import settings
+
+
+class SteppingProcess(plumpy.Process):
+    """A process that goes through a few steps before finishing."""
+
+    NUM_STEPS = 5
+
+    def run(self):
+        self._remaining = self.NUM_STEPS
+        return plumpy.Continue(self.next_step)
+
+    def next_step(self):
+        self._remaining -= 1
+        if self._remaining:
+            return plumpy.Continue(self.next_step)
+
+
+class WaitingProcess(plumpy.Process):
+    """A process that waits until it is resumed."""
+
+    def run(self):
+        return plumpy.Wait(self.finish)
+
+    def finish(self):
+        pass
+
+
+async def create(number: int) -> None:
+    for _ in range(number):
+        SteppingProcess()
+
+
+async def step(number: int) -> None:
+    processes = [SteppingProcess() for _ in range(number)]
+    await asyncio.gather(*(process.step_until_terminated() for process in processes))
+
+
+async def rpc(number: int) -> None:
+    communicator = kiwipy.LocalCommunicator()
+    controller = plumpy.RemoteProcessController(communicator)
+    process = WaitingProcess(communicator=communicator)
+    task = asyncio.ensure_future(process.step_until_terminated())
+
+    while process.state != plumpy.ProcessState.WAITING:
+        await asyncio.sleep(0)
+
+    for _ in range(number):
+        await controller.get_status(str(process.pid))
+
+    process.resume()
+    await task
+
+
+async def launch(number: int) -> None:
+    # The launcher is a coroutine function, so the local communicator has to be wrapped to schedule it on the loop
+    communicator = plumpy.wrap_communicator(kiwipy.LocalCommunicator(), asyncio.get_running_loop())
+    communicator.add_task_subscriber(plumpy.ProcessLauncher())
+    controller = plumpy.RemoteProcessController(communicator)
+
+    for _ in range(number):
+        await controller.launch_process(SteppingProcess, nowait=False)
+
+
+BENCHMARKS: Dict[str, Callable[[int], 'asyncio.Future[None]']] = {
+    'create': create,
+    'step': step,
+    'rpc': rpc,
+    'launch': launch,
+}
+
+
+def run(implementation: str, number: int, repeat: int) -> Dict[str, float]:
+    """Return the best time in seconds per benchmark for the given event loop implementation."""
+    settings.event_loop = implementation
+    results = {}
+
+    for name, benchmark in BENCHMARKS.items():
+        timings = []
+        for _ in range(repeat):
+            asyncio.set_event_loop(None)
+            loop = plumpy.get_or_create_event_loop()
+            start = time.perf_counter()
+            loop.run_until_complete(benchmark(number))
+            timings.append(time.perf_counter() - start)
+            loop.close()
+        results[name] = min(timings)
+
+    asyncio.set_event_loop(None)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=2000, help='the number of operations per benchmark')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of repetitions, the best one is reported')
+    args = parser.parse_args()
+
+    results = {}
+    for implementation in plumpy.events.EVENT_LOOP_IMPLEMENTATIONS:
+        try:
+            results[implementation] = run(implementation, args.number, args.repeat)
+        except ImportError:
+            print(f'skipping `{implementation}`: not installed')
+
+    print(f'{"benchmark":<10}' + ''.join(f'{implementation:>12}' for implementation in results))
+    for name in BENCHMARKS:
+        timings = ''.join(f'{result[name] * 1e6 / args.number:>10.1f}us' for result in results.values())
+        print(f'{name:<10}{timings}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Measure the construction and lookups of ``AttributesFrozendict`` compared to a plain dictionary.
+
+Run as::
+
+    python benchmarks/frozendict.py [--keys 10] [--number 200000] [--repeat 3]
+
+The reported numbers are the best time per operation on a mapping with ``keys`` keys.
+"""
+
+import argparse
+import time
+import timeit
+from typing import Any, Callable, Dict
+
+from plumpy.utils import AttributesFrozendict
+
+
+def measure(function: Callable[[], Any], number: int, repeat: int) -> float:
+    """Return the best time in seconds per call of the function."""
+    return min(timeit.repeat(function, timer=time.perf_counter, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--keys', type=int, default=10, help='the number of keys of the mapping')
+    parser.add_argument('--number', type=int, default=200000, help='the number of operations per repetition')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of repetitions, the best one is reported')
+    args = parser.parse_args()
+
+    values = {f'key_{index}': index for index in range(args.keys)}
+    frozen = AttributesFrozendict(values)
+    key = f'key_{args.keys // 2}'
+
+    operations: Dict[str, Dict[str, Callable[[], Any]]] = {
+        'construct': {'dict': lambda: dict(values), 'frozendict': lambda: AttributesFrozendict(values)},
+        'getitem': {'dict': lambda: values[key], 'frozendict': lambda: frozen[key]},
+        'get': {'dict': lambda: values.get(key), 'frozendict': lambda: frozen.get(key)},
+        'contains': {'dict': lambda: key in values, 'frozendict': lambda: key in frozen},
+        'items': {'dict': lambda: list(values.items()), 'frozendict': lambda: list(frozen.items())},
+        'getattr': {'frozendict': lambda: getattr(frozen, key)},
+    }
+
+    for name, functions in operations.items():
+        timings = ' '.join(
+            f'{label} {measure(function, args.number, args.repeat) * 1e9:>8.1f}ns'
+            for label, function in functions.items()
+        )
+        print(f'{name:<10} {timings}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Compare running small sub-workchains as child processes with inlining them in the outline of the parent.
+
+Run as::
+
+    python benchmarks/inline_workchains.py [--number 1000] [--repeat 3]
+
+A parent workchain runs the same sub-workchain ``number`` times in a loop, either by launching it as a child process
+and waiting for it through ``ToContext``, or through ``inline_``. The reported number is the best time per
+sub-workchain.
+"""
+
+import argparse
+import time
+
+from plumpy import ToContext, WorkChain, inline_, while_
+
+
+class Sub(WorkChain):
+    """A small reusable workchain of a few steps."""
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.input('value', default=1)
+        spec.output('value')
+        spec.outline(cls.setup, cls.double, cls.finalize)
+
+    def setup(self):
+        self.ctx.value = self.inputs.value
+
+    def double(self):
+        self.ctx.value *= 2
+
+    def finalize(self):
+        self.out('value', self.ctx.value)
+
+
+class Nested(WorkChain):
+    """Runs the sub-workchain as a child process."""
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.input('number')
+        spec.outline(cls.setup, while_(cls.not_done)(cls.launch_sub, cls.inspect_sub))
+
+    def setup(self):
+        self.ctx.remaining = self.inputs.number
+
+    def not_done(self):
+        return self.ctx.remaining > 0
+
+    def launch_sub(self):
+        return ToContext(sub=self.launch(Sub))
+
+    def inspect_sub(self):
+        assert self.ctx.sub['value'] == 2
+        self.ctx.remaining -= 1
+
+
+class Inlined(Nested):
+    """Runs the sub-workchain inlined in its own outline."""
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.expose_inputs(Sub, namespace='sub')
+        spec.expose_outputs(Sub, namespace='sub')
+        spec.outline(cls.setup, while_(cls.not_done)(inline_(Sub, namespace='sub'), cls.inspect_sub))
+
+    def inspect_sub(self):
+        assert self.ctx.sub.value == 2
+        self.ctx.remaining -= 1
+
+
+def measure(workchain_class: type, number: int, repeat: int) -> float:
+    """Return the best time in seconds per sub-workchain."""
+    timings = []
+    for _ in range(repeat):
+        workchain = workchain_class(inputs={'number': number})
+        start = time.perf_counter()
+        workchain.execute()
+        timings.append(time.perf_counter() - start)
+        assert workchain.is_successful
+
+    return min(timings) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=1000, help='the number of sub-workchains per parent')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of repetitions, the best one is reported')
+    args = parser.parse_args()
+
+    nested = measure(Nested, args.number, args.repeat)
+    inlined = measure(Inlined, args.number, args.repeat)
+
+    print(f'nested   {nested * 1e6:>10.1f}us per sub-workchain')
+    print(f'inlined  {inlined * 1e6:>10.1f}us per sub-workchain ({nested / inlined:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
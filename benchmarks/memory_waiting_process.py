@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Report the memory footprint of idle processes in the WAITING state.
+
+Run as::
+
+    python benchmarks/memory_waiting_process.py [--number 10000]
+
+The reported number is the memory allocated per process, measured with ``tracemalloc``, after all processes have been
+created and stepped until they are waiting.
+"""
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+
+import plumpy
+
+
+class WaitingProcess(plumpy.Process):
+    """A process that does nothing but wait to be resumed."""
+
+    def run(self):
+        return plumpy.Wait(self.finish)
+
+    def finish(self):
+        pass
+
+
+def measure(number: int) -> float:
+    """Return the number of bytes allocated per process in the WAITING state."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    # Create one process up front such that one-off allocations, e.g. building the spec, are not counted
+    WaitingProcess(loop=loop)
+
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+
+    processes = [WaitingProcess(loop=loop) for _ in range(number)]
+    for process in processes:
+        # The first step goes from CREATED to RUNNING, the second from RUNNING to WAITING
+        loop.run_until_complete(process.step())
+        loop.run_until_complete(process.step())
+    assert all(process.state == plumpy.ProcessState.WAITING for process in processes)
+
+    gc.collect()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    loop.close()
+
+    return (end - start) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=10000, help='the number of processes to create')
+    args = parser.parse_args()
+
+    print(f'{measure(args.number):.0f} bytes per WAITING process ({args.number} processes)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Measure the validation of a port namespace with many validated ports.
+
+Run as::
+
+    python benchmarks/port_validation.py [--ports 500] [--number 200] [--repeat 3]
+
+A namespace with ``ports`` input ports is created, each with a type and a validator, and a complete set of inputs is
+validated ``number`` times, both with ``PortNamespace.validate`` and with the validator compiled for a sealed
+specification. The reported number is the best time per validated port.
+"""
+
+import argparse
+import time
+import timeit
+from typing import Any, Callable
+
+from plumpy import InputPort, PortNamespace
+
+
+def validate_positive(value, _port):
+    if value < 0:
+        return 'the value should be positive'
+    return None
+
+
+def create_namespace(ports: int) -> PortNamespace:
+    """Return a namespace with the given number of validated input ports."""
+    namespace = PortNamespace('inputs')
+    for index in range(ports):
+        namespace[f'port_{index}'] = InputPort(f'port_{index}', valid_type=int, validator=validate_positive)
+    return namespace
+
+
+def measure(validate: Callable[[Any], Any], ports: int, number: int, repeat: int) -> float:
+    """Return the best time in seconds per validated port."""
+    inputs = {f'port_{index}': index for index in range(ports)}
+    assert validate(inputs) is None
+
+    timings = timeit.repeat(lambda: validate(inputs), timer=time.perf_counter, number=number, repeat=repeat)
+    return min(timings) / (number * ports)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ports', type=int, default=500, help='the number of validated ports in the namespace')
+    parser.add_argument('--number', type=int, default=200, help='the number of validations per repetition')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of repetitions, the best one is reported')
+    args = parser.parse_args()
+
+    namespace = create_namespace(args.ports)
+    plain = measure(namespace.validate, args.ports, args.number, args.repeat)
+    compiled = measure(namespace.compile_validator(), args.ports, args.number, args.repeat)
+
+    print(f'validate {plain * 1e6:>10.2f}us per port ({args.ports} ports)')
+    print(f'compiled {compiled * 1e6:>10.2f}us per port ({plain / compiled:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Measure emitting many dynamic outputs from a process.
+
+Run as::
+
+    python benchmarks/process_outputs.py [--outputs 1000 10000] [--repeat 3]
+
+For each number of outputs a process is run that emits that many outputs in a nested dynamic output namespace, either
+one by one through ``out`` or at once through ``out_many``, with a listener attached. The reported number is the best
+time per emitted output, which should be independent of the number of outputs.
+"""
+
+import argparse
+import time
+from typing import List, Type
+
+from plumpy import Process, ProcessListener
+
+
+class Listener(ProcessListener):
+    """Counts the emitted outputs."""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def on_output_emitted(self, process, output_port, value, dynamic):
+        self.count += 1
+
+    def on_outputs_emitted(self, process, outputs):
+        self.count += len(outputs)
+
+
+class EmitOutputs(Process):
+    """Emits the requested number of outputs in a dynamic namespace."""
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.input('number', valid_type=int)
+        spec.output_namespace('results', dynamic=True, valid_type=int)
+
+    def run(self):
+        for index in range(self.inputs.number):
+            self.out(f'results.nested.value_{index}', index)
+
+
+class EmitOutputsBatched(EmitOutputs):
+    """Emits the requested number of outputs in a dynamic namespace in a single batch."""
+
+    def run(self):
+        self.out_many({f'results.nested.value_{index}': index for index in range(self.inputs.number)})
+
+
+def measure(process_class: Type[EmitOutputs], number: int, repeat: int) -> float:
+    """Return the best time in seconds per emitted output."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        listener = Listener()
+        process = process_class(inputs={'number': number})
+        process.add_process_listener(listener)
+        start = time.perf_counter()
+        process.execute()
+        timings.append(time.perf_counter() - start)
+        assert len(process.outputs['results']['nested']) == number
+        assert listener.count == number
+
+    return min(timings) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--outputs', type=int, nargs='+', default=[1000, 10000], help='the numbers of outputs')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of repetitions, the best one is reported')
+    args = parser.parse_args()
+
+    for number in args.outputs:
+        single = measure(EmitOutputs, number, args.repeat)
+        batched = measure(EmitOutputsBatched, number, args.repeat)
+        print(f'{number:>8} outputs  out {single * 1e6:>8.2f}us  out_many {batched * 1e6:>8.2f}us per output')
+
+
+if __name__ == '__main__':
+    main()
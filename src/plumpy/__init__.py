@@ -7,8 +7,10 @@ import logging
 from .communications import *
 from .events import *
 from .exceptions import *
+from .executors import *
 from .futures import *
 from .greenback_bridge import *
+from .listener_queue import *
 from .loaders import *
 from .mixins import *
 from .persistence import *
@@ -23,6 +25,7 @@ from .workchains import *
 __all__ = (
     events.__all__
     + exceptions.__all__
+    + executors.__all__
     + processes.__all__
     + utils.__all__
     + futures.__all__
@@ -36,6 +39,7 @@ __all__ = (
     + ports.__all__
     + process_states.__all__
     + greenback_bridge.__all__
+    + listener_queue.__all__
 )
 
 
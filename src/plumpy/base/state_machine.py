@@ -128,6 +128,8 @@ def event(
 
 
 class State:
+    __slots__ = ('_called', 'in_state', 'state_machine')
+
     LABEL: LABEL_TYPE = None
     # A set containing the labels of states that can be entered
     # from this one
@@ -269,7 +271,9 @@ class StateMachine(metaclass=StateMachineMeta):
         self._exception_handler = None  # Note this appears to never be used
         self.set_debug((not sys.flags.ignore_environment and bool(os.environ.get('PYTHONSMDEBUG'))))
         self._transitioning = False
-        self._event_callbacks: Dict[Hashable, List[EVENT_CALLBACK_TYPE]] = {}
+        self._transition_failing = False
+        # Allocated on first use since most state machines never register any callbacks
+        self._event_callbacks: Optional[Dict[Hashable, List[EVENT_CALLBACK_TYPE]]] = None
 
     @super_check
     def init(self) -> None:
@@ -295,6 +299,8 @@ class StateMachine(metaclass=StateMachineMeta):
         :param hook: The state event hook
         :param callback: The callback function
         """
+        if self._event_callbacks is None:
+            self._event_callbacks = {}
         self._event_callbacks.setdefault(hook, []).append(callback)
 
     def remove_state_event_callback(self, hook: Hashable, callback: EVENT_CALLBACK_TYPE) -> None:
@@ -302,13 +308,14 @@ class StateMachine(metaclass=StateMachineMeta):
             # if the process is closed, then all callbacks have already been removed
             return None
         try:
-            self._event_callbacks[hook].remove(callback)
-        except (KeyError, ValueError):
+            self._event_callbacks[hook].remove(callback)  # type: ignore[index]
+        except (KeyError, ValueError, TypeError):
             raise ValueError(f"Callback not set for hook '{hook}'")
 
     def _fire_state_event(self, hook: Hashable, state: Optional[State]) -> None:
-        for callback in self._event_callbacks.get(hook, []):
-            callback(self, hook, state)
+        if self._event_callbacks:
+            for callback in self._event_callbacks.get(hook, []):
+                callback(self, hook, state)
 
     @super_check
     def on_terminated(self) -> None:
@@ -1,38 +1,116 @@
 # -*- coding: utf-8 -*-
+import copy
 import logging
-from typing import TYPE_CHECKING, Any, Callable
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet
 
 from . import persistence
+from .utils import SAVED_STATE_TYPE, protected
 
 if TYPE_CHECKING:
-    from typing import Set, Type
+    from typing import Optional, Set, Tuple, Type
 
     from .process_listener import ProcessListener
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@persistence.auto_persist('_listeners', '_listener_type')
+# Caches of the hooks by class, which are weakly keyed such that listener classes that are created dynamically, for
+# example in tests, can still be garbage collected
+_EVENT_HOOKS: 'weakref.WeakKeyDictionary[type, FrozenSet[str]]' = weakref.WeakKeyDictionary()
+_OVERRIDDEN_HOOKS: 'weakref.WeakKeyDictionary[type, Dict[type, FrozenSet[str]]]' = weakref.WeakKeyDictionary()
+
+
+def _event_hooks(listener_type: type) -> FrozenSet[str]:
+    """Return the names of the event hooks defined by the listener base class."""
+    try:
+        return _EVENT_HOOKS[listener_type]
+    except KeyError:
+        hooks = _EVENT_HOOKS[listener_type] = frozenset(name for name in dir(listener_type) if name.startswith('on_'))
+        return hooks
+
+
+def _overridden_hooks(cls: type, listener_type: type) -> FrozenSet[str]:
+    """Return the names of the event hooks of the listener base class that are overridden by the given class.
+
+    A hook whose default implementation calls other hooks, as declared by ``DELEGATING_HOOKS`` of the listener base
+    class, is considered overridden if any of those other hooks is.
+    """
+    by_listener_type = _OVERRIDDEN_HOOKS.setdefault(cls, {})
+    try:
+        return by_listener_type[listener_type]
+    except KeyError:
+        pass
+
+    overridden = {
+        name for name in _event_hooks(listener_type) if getattr(cls, name, None) is not getattr(listener_type, name)
+    }
+    for name, delegates in getattr(listener_type, 'DELEGATING_HOOKS', {}).items():
+        if overridden.intersection(delegates):
+            overridden.add(name)
+
+    hooks = by_listener_type[listener_type] = frozenset(overridden)
+    return hooks
+
+
+@persistence.auto_persist('_listener_type')
 class EventHelper(persistence.Savable):
+    __slots__ = ('_called', '_dispatch', '_listener_type', '_listeners')
+
+    LISTENERS = '_listeners'
+
     def __init__(self, listener_type: 'Type[ProcessListener]'):
         assert listener_type is not None, 'Must provide valid listener type'
 
         self._listener_type = listener_type
-        self._listeners: 'Set[ProcessListener]' = set()
+        # Allocated when the first listener is added since most processes never have any
+        self._listeners: 'Optional[Set[ProcessListener]]' = None
+        # The listeners that handle each event, built on demand and reset whenever the listeners change
+        self._dispatch: 'Optional[Dict[str, Tuple[ProcessListener, ...]]]' = None
+
+    @protected
+    def load_instance_state(
+        self, saved_state: SAVED_STATE_TYPE, load_context: 'Optional[persistence.LoadSaveContext]'
+    ) -> None:
+        super().load_instance_state(saved_state, load_context)
+        self._listeners = saved_state[self.LISTENERS]
+        self._dispatch = None
+
+    def save_instance_state(
+        self, out_state: SAVED_STATE_TYPE, save_context: 'Optional[persistence.LoadSaveContext]'
+    ) -> None:
+        super().save_instance_state(out_state, save_context)
+
+        # Listeners that are marked as transient are bound to the runtime, such as a listener queue, and are not saved
+        listeners = self._listeners
+        if listeners is not None:
+            listeners = {listener for listener in listeners if not getattr(listener, 'transient', False)}
+        out_state[self.LISTENERS] = copy.deepcopy(listeners)
 
     def add_listener(self, listener: 'ProcessListener') -> None:
+        """Add a listener.
+
+        Only the event hooks that the listener overrides at the time it is added are called: those overridden by its
+        class and those assigned as attributes on the listener instance itself.
+        """
         assert isinstance(listener, self._listener_type), 'Listener is not of right type'
+        if self._listeners is None:
+            self._listeners = set()
         self._listeners.add(listener)
+        self._dispatch = None
 
     def remove_listener(self, listener: 'ProcessListener') -> None:
-        self._listeners.discard(listener)
+        if self._listeners is not None:
+            self._listeners.discard(listener)
+            self._dispatch = None
 
     def remove_all_listeners(self) -> None:
-        self._listeners.clear()
+        self._listeners = None
+        self._dispatch = None
 
     @property
     def listeners(self) -> 'Set[ProcessListener]':
-        return self._listeners
+        return self._listeners if self._listeners is not None else set()
 
     def fire_event(self, event_function: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
         """Call an event method on all listeners.
@@ -45,9 +123,38 @@ class EventHelper(persistence.Savable):
         if event_function is None:
             raise ValueError('Must provide valid event method')
 
-        # Make a copy of the list for iteration just in case it changes in a callback
-        for listener in list(self.listeners):
+        if not self._listeners:
+            return
+
+        name = event_function.__name__
+
+        if self._dispatch is None:
+            self._dispatch = {}
+
+        try:
+            listeners = self._dispatch[name]
+        except KeyError:
+            listeners = self._dispatch[name] = self._get_listeners_for_event(name)
+
+        # The tuple is immutable, so it is safe to iterate even if the listeners change in a callback
+        for listener in listeners:
             try:
-                getattr(listener, event_function.__name__)(*args, **kwargs)
+                getattr(listener, name)(*args, **kwargs)
             except Exception as exception:
                 _LOGGER.error("Listener '%s' produced an exception:\n%s", listener, exception)
+
+    def _get_listeners_for_event(self, name: str) -> 'Tuple[ProcessListener, ...]':
+        """Return the listeners that override the event hook with the given name."""
+        assert self._listeners is not None
+
+        if name not in _event_hooks(self._listener_type):
+            return tuple(self._listeners)
+
+        hooks = (name, *getattr(self._listener_type, 'DELEGATING_HOOKS', {}).get(name, ()))
+
+        return tuple(
+            listener
+            for listener in self._listeners
+            if name in _overridden_hooks(type(listener), self._listener_type)
+            or any(hook in getattr(listener, '__dict__', ()) for hook in hooks)
+        )
@@ -2,18 +2,61 @@
 """Event and loop related classes and functions"""
 
 import asyncio
+import os
 import sys
 from typing import TYPE_CHECKING, Any, Callable, Dict, Sequence
 
-__all__: list[str] = ['get_or_create_event_loop']
+from . import settings
+
+__all__: list[str] = ['create_event_loop', 'get_event_loop_implementation', 'get_or_create_event_loop']
+
+EVENT_LOOP_ENVIRONMENT_VARIABLE = 'PLUMPY_EVENT_LOOP'
+EVENT_LOOP_IMPLEMENTATIONS = ('asyncio', 'uvloop')
 
 if TYPE_CHECKING:
     from .processes import Process
 
 
+def get_event_loop_implementation() -> str:
+    """Return the name of the configured event loop implementation.
+
+    The implementation is taken from ``plumpy.settings.event_loop`` or, if that is not set, from the
+    ``PLUMPY_EVENT_LOOP`` environment variable and defaults to ``'asyncio'``.
+
+    :raises ValueError: if the configured implementation is not supported
+    """
+    implementation = settings.event_loop or os.environ.get(EVENT_LOOP_ENVIRONMENT_VARIABLE) or 'asyncio'
+    implementation = implementation.lower()
+
+    if implementation not in EVENT_LOOP_IMPLEMENTATIONS:
+        raise ValueError(
+            f'unsupported event loop implementation `{implementation}`, choose from {EVENT_LOOP_IMPLEMENTATIONS}'
+        )
+
+    return implementation
+
+
+def create_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop of the configured implementation, see :func:`get_event_loop_implementation`.
+
+    :raises ImportError: if ``uvloop`` is configured but not installed
+    """
+    if get_event_loop_implementation() == 'uvloop':
+        try:
+            import uvloop
+        except ImportError as exception:
+            raise ImportError('the `uvloop` event loop is configured but `uvloop` is not installed') from exception
+        return uvloop.new_event_loop()
+
+    return asyncio.new_event_loop()
+
+
 def get_or_create_event_loop() -> asyncio.AbstractEventLoop:
     """Get the running event loop, or the current set loop, or create and set a new one.
     Note: aiida should never call on asyncio.get_event_loop() directly.
+
+    A new loop is created with :func:`create_event_loop`, so it is of the configured implementation. A loop that is
+    already running or set is returned as is.
     """
     try:
         return asyncio.get_running_loop()
@@ -26,7 +69,7 @@ def get_or_create_event_loop() -> asyncio.AbstractEventLoop:
             return loop
     except RuntimeError:
         pass
-    loop = asyncio.new_event_loop()
+    loop = create_event_loop()
     asyncio.set_event_loop(loop)
     return loop
 
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Executors to run blocking process code off the event loop thread.
+
+Synchronous code that performs blocking I/O or heavy computation would otherwise run on the event loop thread and
+freeze every other process on the same loop. Such code can be offloaded to a thread pool, either for all synchronous
+run functions of a process by setting :attr:`plumpy.processes.Process.EXECUTOR`, or for individual functions, such as
+a workchain step, with the :func:`blocking` decorator.
+
+Code running in an executor is not on the event loop thread, so it should not use the event loop directly. The methods
+of a process that schedule work on the loop, such as :meth:`plumpy.processes.Process.launch` and
+:meth:`plumpy.processes.Process.call_soon`, hand the scheduling over to the thread of the loop themselves. Listeners of
+the process are called on the thread in which the event occurs.
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import inspect
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional, TypeVar
+
+from .greenback_bridge import has_portal, sync_await
+
+__all__ = ['DEFAULT_EXECUTOR', 'ExecutorStats', 'blocking', 'executor_stats', 'register_executor', 'run_in_executor']
+
+_T = TypeVar('_T')
+
+DEFAULT_EXECUTOR = 'default'
+
+EXECUTOR_ATTRIBUTE = '_plumpy_executor'
+# Attribute of functions that have to run on the event loop thread, even if the process has an executor
+ON_LOOP_ATTRIBUTE = '_plumpy_on_loop'
+
+
+class ExecutorStats(NamedTuple):
+    """Snapshot of the load of a named executor."""
+
+    name: str
+    max_workers: Optional[int]
+    queued: int
+    active: int
+    completed: int
+
+
+class _TrackedExecutor:
+    """A thread pool executor that keeps count of the queued and active calls."""
+
+    def __init__(self, name: str, max_workers: Optional[int] = None) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix=f'plumpy-{name}')
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+
+    def submit(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> 'concurrent.futures.Future[_T]':
+        with self._lock:
+            self._queued += 1
+        return self._executor.submit(self._run, fn, *args, **kwargs)
+
+    def _run(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(self.name, self.max_workers, self._queued, self._active, self._completed)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+_EXECUTORS: Dict[str, _TrackedExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+
+def register_executor(name: str, max_workers: Optional[int] = None) -> None:
+    """Register a named thread pool executor.
+
+    :param name: the name with which processes and steps can refer to the executor
+    :param max_workers: the maximum number of threads, if ``None`` the default of ``ThreadPoolExecutor`` is used
+    :raises ValueError: if an executor with the given name was already registered
+    """
+    with _EXECUTORS_LOCK:
+        if name in _EXECUTORS:
+            raise ValueError(f"executor '{name}' is already registered")
+        _EXECUTORS[name] = _TrackedExecutor(name, max_workers)
+
+
+def unregister_executor(name: str) -> None:
+    """Shut down and remove a named executor, calls that are still queued will still be run."""
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.pop(name, None)
+    if executor is not None:
+        executor.shutdown()
+
+
+def get_executor(name: Optional[str] = None) -> _TrackedExecutor:
+    """Return the executor with the given name, the default executor is created on first use.
+
+    :raises ValueError: if no executor with the given name was registered
+    """
+    name = name or DEFAULT_EXECUTOR
+    with _EXECUTORS_LOCK:
+        try:
+            return _EXECUTORS[name]
+        except KeyError:
+            if name != DEFAULT_EXECUTOR:
+                raise ValueError(f"executor '{name}' is not registered")
+            executor = _EXECUTORS[name] = _TrackedExecutor(name)
+            return executor
+
+
+def executor_stats() -> Dict[str, ExecutorStats]:
+    """Return the statistics of all executors that are currently registered, keyed on their name."""
+    with _EXECUTORS_LOCK:
+        executors = list(_EXECUTORS.values())
+    return {executor.name: executor.stats() for executor in executors}
+
+
+async def run_in_executor(executor: Optional[str], fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run the function in the given executor and wait for the result without blocking the event loop.
+
+    The function is run in a copy of the current context, such that ``Process.current()`` still works.
+
+    :param executor: the name of the executor, ``None`` for the default executor
+    :param fn: the synchronous function to run
+    """
+    context = contextvars.copy_context()
+    future = get_executor(executor).submit(context.run, fn, *args, **kwargs)
+    return await asyncio.wrap_future(future)
+
+
+def on_loop(fn: Callable[..., _T]) -> Callable[..., _T]:
+    """Decorator to mark a run function of a process that has to run on the event loop thread.
+
+    Such functions are not run in the executor of the process, see :attr:`plumpy.processes.Process.EXECUTOR`.
+    """
+    setattr(fn, ON_LOOP_ATTRIBUTE, True)
+    return fn
+
+
+def blocking(executor: Optional[str] = None) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
+    """Decorator to mark a synchronous function, for example a workchain step, as blocking.
+
+    When called from within a running process, the function is run in the given executor while the process waits for
+    it through its portal, such that the event loop remains responsive. When called anywhere else, the function is
+    simply called directly.
+
+    :param executor: the name of the executor, ``None`` for the default executor
+    """
+
+    def decorator(wrapped: Callable[..., _T]) -> Callable[..., _T]:
+        @functools.wraps(wrapped)
+        def wrapper(*args: Any, **kwargs: Any) -> _T:
+            if has_portal():
+                return sync_await(run_in_executor(executor, wrapped, *args, **kwargs))
+            return wrapped(*args, **kwargs)
+
+        # Expose the signature of the wrapped function, which is inspected when it is used as a workchain step
+        wrapper.__signature__ = inspect.signature(wrapped)  # type: ignore[attr-defined]
+        setattr(wrapper, EXECUTOR_ATTRIBUTE, executor or DEFAULT_EXECUTOR)
+        return wrapper
+
+    return decorator
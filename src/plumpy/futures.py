@@ -31,6 +31,8 @@ class CancellableAction(Future):
     An action that can be launched and potentially cancelled
     """
 
+    __slots__ = ('_action', '_cookie')
+
     def __init__(self, action: Callable[..., Any], cookie: Any = None):
         super().__init__()
         self._action = action
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""Asynchronous, batched delivery of process listener events.
+
+Process listeners are normally called synchronously during the state transitions of a process, so a slow listener adds
+latency to every step. A :class:`ListenerQueue` decouples the two: listeners that are added to a process through
+:meth:`ListenerQueue.wrap` only have their events put on a bounded queue, which is drained by a background task on the
+event loop. A single queue is typically shared by all processes of a worker. Events that are fired on another thread,
+such as that of the executor of a process, are handed over to the thread of the event loop.
+"""
+
+import asyncio
+import collections
+import enum
+import functools
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from . import events
+from .event_helper import _event_hooks, _overridden_hooks
+from .process_listener import ProcessListener
+
+if TYPE_CHECKING:
+    from .processes import Process
+
+__all__ = ['BatchedProcessListener', 'ListenerEvent', 'ListenerQueue', 'ListenerQueueStats', 'OverflowPolicy']
+
+_LOGGER = logging.getLogger(__name__)
+
+# The number of leading arguments of an event that identify it when coalescing, by default only the process. Events
+# that are never coalesced, as each of them carries different information, are mapped to ``None``.
+_COALESCE_KEY_ARGS: Dict[str, Optional[int]] = {'on_output_emitted': 2, 'on_outputs_emitted': None}
+
+
+class OverflowPolicy(enum.Enum):
+    """What to do when an event is put on a full :class:`ListenerQueue`."""
+
+    #: Deliver the oldest batch of events synchronously to make room, no events are lost
+    BLOCK = 'block'
+    #: Drop the oldest queued event
+    DROP_OLDEST = 'drop_oldest'
+    #: Replace a queued event for the same listener, hook and process, dropping the oldest event if there is none
+    COALESCE = 'coalesce'
+
+
+class ListenerEvent(NamedTuple):
+    """An event as it is queued for a listener."""
+
+    name: str
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    timestamp: float
+
+    @property
+    def process(self) -> Optional['Process']:
+        """Return the process that fired the event."""
+        return self.args[0] if self.args else None
+
+
+class ListenerQueueStats(NamedTuple):
+    """Snapshot of the state of a :class:`ListenerQueue`, all lags are in seconds."""
+
+    size: int
+    maxsize: int
+    enqueued: int
+    delivered: int
+    dropped: int
+    coalesced: int
+    batches: int
+    lag: float
+    max_lag: float
+
+
+class BatchedProcessListener(ProcessListener):
+    """A process listener that receives its events in batches when added to a process through a queue.
+
+    All events are delivered to :meth:`on_process_events`, so the individual hooks do not have to be overridden.
+    """
+
+    def on_process_events(self, events: Sequence[ListenerEvent]) -> None:
+        """
+        Called with a batch of events, in the order in which they were fired
+
+        :param events: the events
+
+        """
+
+
+class _QueuedListener(ProcessListener):
+    """Stand-in for a listener that puts the events of the hooks that it handles on a queue.
+
+    The queue is a runtime service, so queued listeners are not saved with the process.
+    """
+
+    transient = True
+
+    def __init__(self, queue: 'ListenerQueue', listener: ProcessListener) -> None:
+        super().__init__()
+        self.listener = listener
+
+        if isinstance(listener, BatchedProcessListener):
+            hooks = _event_hooks(ProcessListener)
+        else:
+            hooks = _overridden_hooks(type(listener), ProcessListener) | _event_hooks(ProcessListener).intersection(
+                getattr(listener, '__dict__', ())
+            )
+
+        # Hooks are set on the instance such that the event helper only dispatches the events that the listener handles
+        for name in hooks:
+            setattr(self, name, functools.partial(queue.put, listener, name))
+
+
+class ListenerQueue:
+    """A bounded queue of listener events that is drained in batches by a background task.
+
+    :param maxsize: the maximum number of queued events, when exceeded the ``overflow`` policy applies
+    :param batch_size: the maximum number of events delivered before yielding to the event loop
+    :param overflow: the policy to apply when the queue is full
+    :param loop: the event loop to run the background task on, by default the current one when the queue is created
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        batch_size: int = 100,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError('maxsize should be at least one')
+        if batch_size < 1:
+            raise ValueError('batch_size should be at least one')
+
+        self._maxsize = maxsize
+        self._batch_size = batch_size
+        self._overflow = OverflowPolicy(overflow)
+        self._loop = loop or events.get_or_create_event_loop()
+        self._queue: Deque[Tuple[ProcessListener, ListenerEvent]] = collections.deque()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._enqueued = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._batches = 0
+        self._max_lag = 0.0
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'ListenerQueue':
+        # The queue is a runtime service shared by processes, it should never be copied when a process is saved
+        return self
+
+    def wrap(self, listener: ProcessListener) -> ProcessListener:
+        """Return a listener to add to a process instead of the given one, such that its events go through the queue.
+
+        Only the hooks that the listener overrides when it is wrapped are queued. Instances of
+        :class:`BatchedProcessListener` receive all events in batches through ``on_process_events``.
+        """
+        return _QueuedListener(self, listener)
+
+    def put(self, listener: ProcessListener, name: str, *args: Any, **kwargs: Any) -> None:
+        """Queue an event for the given listener.
+
+        If called from another thread than that of the event loop of the queue while the loop is running, the event is
+        queued on the thread of the loop, such that the queue is only ever modified by a single thread.
+
+        :param listener: the listener to deliver the event to
+        :param name: the name of the hook
+        """
+        event = ListenerEvent(name, args, kwargs, time.monotonic())
+
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is not self._loop and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._put, listener, event)
+        else:
+            self._put(listener, event)
+
+    def _put(self, listener: ProcessListener, event: ListenerEvent) -> None:
+        if len(self._queue) >= self._maxsize:
+            if self._overflow is OverflowPolicy.COALESCE and self._coalesce(listener, event):
+                return
+            if self._overflow is OverflowPolicy.BLOCK:
+                self._deliver(self._pop_batch())
+            else:
+                self._queue.popleft()
+                self._dropped += 1
+
+        self._queue.append((listener, event))
+        self._enqueued += 1
+
+        if self._task is None:
+            self._task = self._loop.create_task(self._drain())
+
+    def stats(self) -> ListenerQueueStats:
+        """Return the current statistics of the queue, the lag is the age of the oldest queued event."""
+        lag = time.monotonic() - self._queue[0][1].timestamp if self._queue else 0.0
+        return ListenerQueueStats(
+            len(self._queue),
+            self._maxsize,
+            self._enqueued,
+            self._delivered,
+            self._dropped,
+            self._coalesced,
+            self._batches,
+            lag,
+            max(self._max_lag, lag),
+        )
+
+    async def join(self) -> None:
+        """Wait until all queued events have been delivered."""
+        while self._task is not None:
+            await self._task
+
+    def _coalesce(self, listener: ProcessListener, event: ListenerEvent) -> bool:
+        """Replace the most recent queued event with the same key by the given event and return whether one existed."""
+        num_args = _COALESCE_KEY_ARGS.get(event.name, 1)
+        if num_args is None:
+            return False
+
+        key = event.args[:num_args]
+
+        for index in range(len(self._queue) - 1, -1, -1):
+            queued_listener, queued = self._queue[index]
+            if (
+                queued_listener is listener
+                and queued.name == event.name
+                and all(a is b or a == b for a, b in zip(queued.args[:num_args], key))
+            ):
+                del self._queue[index]
+                self._queue.append((listener, event))
+                self._coalesced += 1
+                return True
+
+        return False
+
+    def _pop_batch(self) -> List[Tuple[ProcessListener, ListenerEvent]]:
+        return [self._queue.popleft() for _ in range(min(self._batch_size, len(self._queue)))]
+
+    def _deliver(self, batch: List[Tuple[ProcessListener, ListenerEvent]]) -> None:
+        """Deliver a batch of events, batched listeners receive all their events of the batch in a single call."""
+        now = time.monotonic()
+        batched: Dict[BatchedProcessListener, List[ListenerEvent]] = {}
+
+        for listener, event in batch:
+            self._max_lag = max(self._max_lag, now - event.timestamp)
+            if isinstance(listener, BatchedProcessListener):
+                batched.setdefault(listener, []).append(event)
+                continue
+            try:
+                getattr(listener, event.name)(*event.args, **event.kwargs)
+            except Exception as exception:
+                _LOGGER.error("Listener '%s' produced an exception:\n%s", listener, exception)
+
+        for listener, listener_events in batched.items():
+            try:
+                listener.on_process_events(listener_events)
+            except Exception as exception:
+                _LOGGER.error("Listener '%s' produced an exception:\n%s", listener, exception)
+
+        self._delivered += len(batch)
+        self._batches += 1
+
+    async def _drain(self) -> None:
+        try:
+            while self._queue:
+                self._deliver(self._pop_batch())
+                await asyncio.sleep(0)
+        finally:
+            self._task = None
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-from typing import Any, Optional
+import itertools
+from typing import Any, Optional, Set, Tuple
 
 from . import persistence
 from .utils import SAVED_STATE_TYPE, AttributesDict
@@ -7,6 +8,34 @@ from .utils import SAVED_STATE_TYPE, AttributesDict
 __all__ = ['ContextMixin']
 
 
+# Revisions are drawn from a counter shared by all tracked dictionaries, so a dictionary that is created later, e.g. by
+# loading a process, only has revisions that are more recent than any revision returned before
+_REVISIONS = itertools.count(1)
+
+
+class _TrackedAttributesDict(AttributesDict):
+    """An attributes dictionary that records the revision at which each key was last assigned or deleted."""
+
+    __slots__ = ('_revisions',)
+
+    def __init__(self, **kwargs: Any) -> None:
+        object.__setattr__(self, '_revisions', dict.fromkeys(kwargs, next(_REVISIONS)))
+        super().__init__(**kwargs)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        self._revisions[key] = next(_REVISIONS)
+        super().__setattr__(key, value)
+
+    def __delattr__(self, key: str) -> None:
+        self._revisions[key] = next(_REVISIONS)
+        super().__delattr__(key)
+
+    def setdefault(self, key: str, value: Any) -> Any:
+        if key not in self.__dict__:
+            self._revisions[key] = next(_REVISIONS)
+        return super().setdefault(key, value)
+
+
 class ContextMixin(persistence.Savable):
     """
     Add a context to a Process.  The contents of the context will be saved
@@ -17,12 +46,31 @@ class ContextMixin(persistence.Savable):
 
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
-        self._context: Optional[AttributesDict] = AttributesDict()
+        self._context: Optional[AttributesDict] = _TrackedAttributesDict()
 
     @property
     def ctx(self) -> Optional[AttributesDict]:
         return self._context
 
+    def get_context_changes(self, revision: Optional[int] = None) -> Tuple[int, Set[str]]:
+        """Return the current revision of the context and the keys that were assigned or deleted after a revision.
+
+        Changes that are made in place to a value in the context, e.g. appending to a list, are not tracked. To have
+        them tracked, assign the key again, e.g. ``self.ctx.results = self.ctx.results``.
+
+        :param revision: a revision returned by an earlier call, if ``None`` all keys of the context are returned
+        :return: the current revision, to pass to a later call, and the keys that changed since ``revision``
+        """
+        current = next(_REVISIONS)
+
+        if self._context is None:
+            return current, set()
+
+        if revision is None or not isinstance(self._context, _TrackedAttributesDict):
+            return current, set(vars(self._context))
+
+        return current, {key for key, changed in self._context._revisions.items() if changed > revision}
+
     def save_instance_state(
         self, out_state: SAVED_STATE_TYPE, save_context: Optional[persistence.LoadSaveContext]
     ) -> None:
@@ -39,6 +87,6 @@ class ContextMixin(persistence.Savable):
     def load_instance_state(self, saved_state: SAVED_STATE_TYPE, load_context: persistence.LoadSaveContext) -> None:
         super().load_instance_state(saved_state, load_context)
         try:
-            self._context = AttributesDict(**saved_state[self.CONTEXT])
+            self._context = _TrackedAttributesDict(**saved_state[self.CONTEXT])
         except KeyError:
             pass
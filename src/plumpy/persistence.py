@@ -5,6 +5,7 @@ import collections
 import copy
 import errno
 import fnmatch
+import hashlib
 import inspect
 import os
 import pickle
@@ -33,6 +34,7 @@ __all__ = [
 PersistedCheckpoint = collections.namedtuple('PersistedCheckpoint', ['pid', 'tag'])
 
 if TYPE_CHECKING:
+    from .mixins import ContextMixin
     from .processes import Process
 
 
@@ -161,8 +163,15 @@ class Persister(metaclass=abc.ABCMeta):
         """
 
 
-PersistedPickle = collections.namedtuple('PersistedPickle', ['checkpoint', 'bundle'])
+# The key of the context in the bundle, if any of its values were spilled to separate files
+PersistedPickle = collections.namedtuple('PersistedPickle', ['checkpoint', 'bundle', 'spilled'], defaults=(None,))
+# Reference to a value of the context that is stored in a separate file, by its filename
+SpilledValue = collections.namedtuple('SpilledValue', ['filename'])
 _PICKLE_SUFFIX = 'pickle'
+_SPILL_SUFFIX = 'spill'
+# The spilled values of the last checkpoint of a process by context key, ``None`` for values kept inline, with the
+# identity of the process instance and the revision of its context at the time of the checkpoint
+_SpilledContext = collections.namedtuple('_SpilledContext', ['process_id', 'revision', 'values'])
 
 
 class PicklePersister(Persister):
@@ -171,13 +180,21 @@ class PicklePersister(Persister):
     in pickles on a filesystem.
     """
 
-    def __init__(self, pickle_directory: str):
+    def __init__(self, pickle_directory: str, spill_threshold: Optional[int] = None):
         """
         Instantiate a PicklePersister object that will persist processes by
         writing their bundles to a pickle in a directory specified by the
         argument 'pickle_directory'
 
+        Values in the context of a process, see :class:`plumpy.ContextMixin`, whose pickle is at least
+        ``spill_threshold`` bytes are written to separate files, which are shared by all checkpoints in which the
+        value did not change. A spilled value is only pickled again once its key in the context is assigned, so the
+        cost of a checkpoint is proportional to what was assigned since the previous checkpoint of the process by this
+        persister. Spilled values are therefore copy-on-write: a change in place, e.g. appending to a list, cannot be
+        detected and is only persisted once the key is assigned again, e.g. ``self.ctx.results = self.ctx.results``.
+
         :param pickle_directory: the full path to the directory where pickles will be written
+        :param spill_threshold: the size in bytes from which context values are spilled, ``None`` to never spill
         """
         super().__init__()
 
@@ -187,6 +204,9 @@ class PicklePersister(Persister):
             raise ValueError(f'failed to create the pickle directory at {pickle_directory}')
 
         self._pickle_directory = pickle_directory
+        self._spill_threshold = spill_threshold
+        # The spilled values of the last checkpoint by process id
+        self._spilled: Dict[PID_TYPE, _SpilledContext] = {}
 
     @staticmethod
     def ensure_pickle_directory(dirpath: str) -> None:
@@ -244,7 +264,14 @@ class PicklePersister(Persister):
         """
         bundle = Bundle(process)
         checkpoint = PersistedCheckpoint(process.pid, tag)
-        persisted_pickle = PersistedPickle(checkpoint, bundle)
+
+        from .mixins import ContextMixin
+
+        if self._spill_threshold is not None and isinstance(process, ContextMixin) and process.CONTEXT in bundle:
+            bundle[process.CONTEXT] = self._spill_context(process.pid, process, bundle[process.CONTEXT])
+            persisted_pickle = PersistedPickle(checkpoint, bundle, process.CONTEXT)
+        else:
+            persisted_pickle = PersistedPickle(checkpoint, bundle)
 
         with open(self._pickle_filepath(process.pid, tag), 'w+b') as handle:
             pickle.dump(persisted_pickle, handle)
@@ -261,8 +288,65 @@ class PicklePersister(Persister):
         """
         filepath = self._pickle_filepath(pid, tag)
         checkpoint = PicklePersister.load_pickle(filepath)
+        bundle = checkpoint.bundle
+
+        if checkpoint.spilled is not None:
+            bundle[checkpoint.spilled] = {
+                key: self._load_spilled(value) if isinstance(value, SpilledValue) else value
+                for key, value in bundle[checkpoint.spilled].items()
+            }
+
+        return bundle
 
-        return checkpoint.bundle
+    def _spill_context(self, pid: PID_TYPE, process: 'ContextMixin', context: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the context with its large values replaced by references to the files they are spilled to.
+
+        Values that were not assigned since the previous checkpoint of the same process instance keep the same
+        reference, without being pickled again.
+        """
+        assert self._spill_threshold is not None
+        previous = self._spilled.get(pid)
+
+        if previous is not None and previous.process_id == id(process):
+            revision, changed = process.get_context_changes(previous.revision)
+            previous_values = previous.values
+        else:
+            revision, changed = process.get_context_changes()
+            previous_values = {}
+
+        spilled: Dict[str, Optional[SpilledValue]] = {}
+        result = {}
+
+        for key, value in context.items():
+            if key in previous_values and key not in changed:
+                spilled[key] = previous_values[key]
+            elif isinstance(value, utils.AttributesDict):
+                # A nested namespace is typically changed in place, so it is always kept inline
+                spilled[key] = None
+            else:
+                data = pickle.dumps(value)
+                spilled[key] = self._write_spilled(pid, data) if len(data) >= self._spill_threshold else None
+
+            spilled_value = spilled[key]
+            result[key] = value if spilled_value is None else spilled_value
+
+        self._spilled[pid] = _SpilledContext(id(process), revision, spilled)
+        return result
+
+    def _write_spilled(self, pid: PID_TYPE, data: bytes) -> SpilledValue:
+        spilled_value = SpilledValue(f'{pid}.{hashlib.sha1(data).hexdigest()}.{_SPILL_SUFFIX}')
+        filepath = os.path.join(self._pickle_directory, spilled_value.filename)
+
+        # Files are addressed by their content, so an existing file does not have to be written again
+        if not os.path.exists(filepath):
+            with open(filepath, 'w+b') as handle:
+                handle.write(data)
+
+        return spilled_value
+
+    def _load_spilled(self, spilled_value: SpilledValue) -> Any:
+        with open(os.path.join(self._pickle_directory, spilled_value.filename), 'r+b') as handle:
+            return pickle.load(handle)
 
     def get_checkpoints(self) -> List[PersistedCheckpoint]:
         """
@@ -318,6 +402,14 @@ class PicklePersister(Persister):
         for checkpoint in self.get_process_checkpoints(pid):
             self.delete_checkpoint(checkpoint.pid, checkpoint.tag)
 
+        # Spilled values may be shared by several checkpoints, so they are only deleted with all of them
+        self._spilled.pop(pid, None)
+        for filename in fnmatch.filter(os.listdir(self._pickle_directory), f'{pid}.*.{_SPILL_SUFFIX}'):
+            try:
+                os.remove(os.path.join(self._pickle_directory, filename))
+            except OSError:
+                pass
+
 
 class InMemoryPersister(Persister):
     """Mainly to be used in testing/debugging"""
@@ -441,6 +533,9 @@ META__TYPE__SAVABLE: str = 'S'
 
 
 class Savable:
+    # Allow subclasses to define ``__slots__`` such that they do not need an instance dictionary
+    __slots__ = ()
+
     CLASS_NAME: str = 'class_name'
 
     _auto_persist: Optional[Set[str]] = None
@@ -549,9 +644,11 @@ class Savable:
             setattr(self, member, self._get_value(saved_state, member, load_context))
 
     def _ensure_persist_configured(self) -> None:
-        if not self._persist_configured:
-            self.persist()
-            self._persist_configured = True
+        # The configuration is tracked per class, looking only at the class itself since ``persist`` is not inherited
+        cls = type(self)
+        if not cls.__dict__.get('_persist_configured', False):
+            cls.persist()
+            cls._persist_configured = True
 
     # region Metadata getter/setters
 
@@ -615,6 +712,8 @@ class SavableFuture(futures.Future, Savable):
     .. note: This does not save any assigned done callbacks.
     """
 
+    __slots__ = ('_called',)
+
     def save_instance_state(self, out_state: SAVED_STATE_TYPE, save_context: LoadSaveContext) -> None:
         super().save_instance_state(out_state, save_context)
         if self.done() and self.exception() is not None:
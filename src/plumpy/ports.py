@@ -3,11 +3,27 @@
 
 import collections
 import copy
+import functools
 import inspect
+import itertools
 import json
 import logging
 import warnings
-from typing import Any, Callable, Dict, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Type, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from plumpy.utils import AttributesFrozendict, is_mutable_property, type_check
 
@@ -21,6 +37,64 @@ VALIDATOR_SIGNATURE_DEPRECATION_WARNING = """the validator `{}` has a signature
     port instance to which the validator has been assigned."""
 
 VALIDATOR_TYPE = Callable[[Any, 'Port'], Optional[str]]
+COMPILED_VALIDATOR_TYPE = Callable[[Any], Optional['PortValidationError']]
+COMPILED_PRE_PROCESS_TYPE = Callable[[MutableMapping[str, Any]], AttributesFrozendict]
+
+_MISSING = object()
+# The maximum number of port values that are formatted in a validation error message
+MAX_FORMATTED_PORT_VALUES = 10
+_revision = 0
+
+
+def get_revision() -> int:
+    """Return a counter that is incremented whenever a port is modified in a way that can affect its validation.
+
+    This is used to determine whether a compiled validator of a port namespace is still up to date.
+    """
+    return _revision
+
+
+def _increment_revision() -> None:
+    global _revision  # noqa: PLW0603
+    _revision += 1
+
+
+def pure(validator: VALIDATOR_TYPE) -> VALIDATOR_TYPE:
+    """Mark a validator as pure, meaning that its result only depends on the value and the port it validates.
+
+    The validation of a port namespace is only cached, see ``settings.validation_cache_size``, if all its validators are
+    pure. Can be used as a decorator.
+
+    :param validator: the validator function
+    :return: the same validator function
+    """
+    validator._plumpy_pure = True  # type: ignore[attr-defined]
+    return validator
+
+
+def is_pure(validator: Optional[VALIDATOR_TYPE]) -> bool:
+    """Return whether the validator is absent or was marked as pure with :func:`pure`."""
+    return validator is None or getattr(validator, '_plumpy_pure', False)
+
+
+def _normalize_validator(validator: Optional[VALIDATOR_TYPE]) -> Optional[VALIDATOR_TYPE]:
+    """Return the validator as a callable that takes the value and the port, resolving its signature only once."""
+    if validator is None:
+        return None
+
+    try:
+        args = inspect.getfullargspec(validator)[0]
+    except TypeError:
+        return validator
+
+    if len(args) != 1:
+        return validator
+
+    def validate(value: Any, _port: 'Port') -> Optional[str]:
+        warnings.warn(VALIDATOR_SIGNATURE_DEPRECATION_WARNING.format(validator.__name__))
+        return validator(value)  # type: ignore[call-arg]
+
+    return validate
 
 
 class PortValidationError(Exception):
@@ -63,6 +137,10 @@ class Port:
     properties like whether it is required, valid types, the help string, etc.
     """
 
+    # Ports are created in large numbers for the specifications of all loaded processes, so they define slots.
+    # Subclasses that do not define slots themselves still have a ``__dict__`` for their own attributes.
+    __slots__ = ('_help', '_name', '_normalized_validator', '_required', '_valid_type', '_validator')
+
     def __init__(
         self,
         name: str,
@@ -75,7 +153,7 @@ class Port:
         self._valid_type = valid_type
         self._help = help
         self._required = required
-        self._validator = validator
+        self.validator = validator
 
     def __str__(self) -> str:
         """Get the string representing this port.
@@ -124,6 +202,7 @@ class Port:
 
         """
         self._valid_type = valid_type
+        _increment_revision()
 
     @property
     def help(self) -> Optional[str]:
@@ -160,6 +239,7 @@ class Port:
 
         """
         self._required = required
+        _increment_revision()
 
     @property
     def validator(self) -> Optional[VALIDATOR_TYPE]:
@@ -178,6 +258,8 @@ class Port:
 
         """
         self._validator = validator
+        self._normalized_validator = _normalize_validator(validator)
+        _increment_revision()
 
     def validate(self, value: Any, breadcrumbs: Sequence[str] = ()) -> Optional[PortValidationError]:
         """Validate a value to see if it is valid for this port
@@ -195,13 +277,8 @@ class Port:
                 f"value '{self.name}' is not of the right type. Got '{type(value)}', expected '{self._valid_type}'"
             )
 
-        if not validation_error and self.validator is not None and value is not UNSPECIFIED:
-            spec = inspect.getfullargspec(self.validator)
-            if len(spec[0]) == 1:
-                warnings.warn(VALIDATOR_SIGNATURE_DEPRECATION_WARNING.format(self.validator.__name__))
-                result = self.validator(value)  # type: ignore
-            else:
-                result = self.validator(value, self)
+        if not validation_error and self._normalized_validator is not None and value is not UNSPECIFIED:
+            result = self._normalized_validator(value, self)
             if result is not None:
                 assert isinstance(result, str), 'Validator returned non string type'
                 validation_error = result
@@ -212,12 +289,59 @@ class Port:
 
         return None
 
+    def has_pure_validation(self) -> bool:
+        """Return whether the result of :meth:`validate` only depends on the value, such that it can be cached.
+
+        This is the case if the validator of the port is pure, see :func:`pure`, and the port class does not override
+        the ``validate`` method.
+        """
+        return type(self).validate is Port.validate and is_pure(self._validator)
+
+    def compile_validator(
+        self, breadcrumbs: Sequence[str] = (), values_validated: bool = False
+    ) -> COMPILED_VALIDATOR_TYPE:
+        """Return a function that validates a value for this port, equivalent to calling :meth:`validate`.
+
+        The properties of the port are resolved once, so the returned function is only valid as long as the port is not
+        modified. The checks that succeed are done inline and :meth:`validate` is only called to build the error.
+
+        :param breadcrumbs: a tuple of the path to having reached this point in validation
+        :param values_validated: if ``True``, the value is assumed to have already been validated against the port, as
+            is the case for outputs emitted with :meth:`plumpy.Process.out`, so only whether it is required is checked
+        """
+        if type(self).validate is not Port.validate:
+            return functools.partial(self.validate, breadcrumbs=breadcrumbs)
+
+        required = self._required
+        valid_type = None if values_validated else self._valid_type
+        validator = None if values_validated else self._normalized_validator
+        location = breadcrumbs_to_port((*breadcrumbs, self.name))
+
+        def validate(value: Any) -> Optional[PortValidationError]:
+            if value is UNSPECIFIED:
+                return self.validate(value, breadcrumbs) if required else None
+
+            if valid_type is not None and not isinstance(value, valid_type):
+                return self.validate(value, breadcrumbs)
+
+            if validator is not None:
+                result = validator(value, self)
+                if result is not None:
+                    assert isinstance(result, str), 'Validator returned non string type'
+                    return PortValidationError(result, location)
+
+            return None
+
+        return validate
+
 
 class InputPort(Port):
     """
     A simple input port for a value being received by a process
     """
 
+    __slots__ = ('_default',)
+
     @staticmethod
     def required_override(required: bool, default: Any) -> bool:
         """
@@ -274,6 +398,7 @@ class InputPort(Port):
     @default.setter
     def default(self, default: Any) -> None:
         self._default = default
+        _increment_revision()
 
     def get_description(self) -> Dict[str, str]:
         """
@@ -290,7 +415,7 @@ class InputPort(Port):
 
 
 class OutputPort(Port):
-    pass
+    __slots__ = ()
 
 
 class PortNamespace(collections.abc.MutableMapping, Port):
@@ -301,6 +426,8 @@ class PortNamespace(collections.abc.MutableMapping, Port):
 
     NAMESPACE_SEPARATOR = '.'
 
+    __slots__ = ('_default', '_dynamic', '_populate_defaults', '_ports')
+
     def __init__(
         self,
         name: str = '',  # Note this was set to None, but that would fail if you tried to compute breadcrumbs
@@ -348,6 +475,7 @@ class PortNamespace(collections.abc.MutableMapping, Port):
 
     def __delitem__(self, key: str) -> None:
         del self._ports[key]
+        _increment_revision()
 
     def __getitem__(self, key: str) -> Union[Port, 'PortNamespace']:
         return self._ports[key]
@@ -356,6 +484,7 @@ class PortNamespace(collections.abc.MutableMapping, Port):
         if not isinstance(port, Port):
             raise TypeError('port needs to be an instance of Port')
         self._ports[key] = port
+        _increment_revision()
 
     @property
     def ports(self) -> Dict[str, Union[Port, 'PortNamespace']]:
@@ -371,6 +500,7 @@ class PortNamespace(collections.abc.MutableMapping, Port):
     @default.setter
     def default(self, default: Any) -> None:
         self._default = default
+        _increment_revision()
 
     @property
     def dynamic(self) -> bool:
@@ -379,6 +509,7 @@ class PortNamespace(collections.abc.MutableMapping, Port):
     @dynamic.setter
     def dynamic(self, dynamic: bool) -> None:
         self._dynamic = dynamic
+        _increment_revision()
 
     @property
     def valid_type(self) -> Optional[Type[Any]]:
@@ -405,6 +536,7 @@ class PortNamespace(collections.abc.MutableMapping, Port):
     @populate_defaults.setter
     def populate_defaults(self, populate_defaults: bool) -> None:
         self._populate_defaults = populate_defaults
+        _increment_revision()
 
     def get_description(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -633,44 +765,152 @@ class PortNamespace(collections.abc.MutableMapping, Port):
             message = f'specified value is of type {type(port_values)} which is not sub class of `Mapping`'
             return PortValidationError(message, breadcrumbs_to_port(breadcrumbs_local))
 
-        # Turn the port values into a normal dictionary and create a shallow copy. The `validate_ports` method to which
-        # the `port_values` will be passed, will pop the values corresponding to explicit ports. This is necessary for
-        # the `validate_dynamic_ports` to correctly detect any implicit ports. However, the `validator` will expect the
-        # entire original input namespace to be there. Since the latter has to be called after the ports have been
-        # validated, we need to create a clone of the port values here.
-        port_values = dict(port_values)
-        port_values_clone = port_values.copy()
-
         # If the namespace is not required and there are no port_values specified, consider it valid
         if not port_values and not self.required:
             return None
 
+        # Turn the port values into a normal dictionary, which is a shallow copy. The `validate_ports` method to which
+        # it will be passed, will pop the values corresponding to explicit ports. This is necessary for the
+        # `validate_dynamic_ports` to correctly detect any implicit ports. The original `port_values` are left intact,
+        # since the `validator` will expect the entire original input namespace to be there.
+        remaining_values = dict(port_values)
+
         # In all other cases, validate all input ports explicitly specified in this port namespace
-        validation_error = self.validate_ports(port_values, breadcrumbs_local)
+        validation_error = self.validate_ports(remaining_values, breadcrumbs_local)
         if validation_error:
             return validation_error
 
         # If any port_values remain, validate against the dynamic properties of the namespace
-        validation_error = self.validate_dynamic_ports(port_values, breadcrumbs)
+        validation_error = self.validate_dynamic_ports(remaining_values, breadcrumbs)
         if validation_error:
             return validation_error
 
         # Validate the validator after the ports themselves, as it most likely will rely on the port values
-        if self.validator is not None:
-            spec = inspect.getfullargspec(self.validator)
-            if len(spec[0]) == 1:
-                warnings.warn(VALIDATOR_SIGNATURE_DEPRECATION_WARNING.format(self.validator.__name__))
-                message = self.validator(port_values_clone)  # type: ignore
-            else:
-                message = self.validator(port_values_clone, self)
+        if self._normalized_validator is not None:
+            message = self._normalized_validator(dict(port_values), self)
             if message is not None:
-                assert isinstance(
-                    message, str
-                ), f"Validator returned something other than None or str: '{type(message)}'"
+                assert isinstance(message, str), (
+                    f"Validator returned something other than None or str: '{type(message)}'"
+                )
                 return PortValidationError(message, breadcrumbs_to_port(breadcrumbs_local))
 
         return None
 
+    def has_pure_validation(self) -> bool:
+        """Return whether the result of :meth:`validate` only depends on the port values, such that it can be cached.
+
+        This is the case if the validator of the namespace and those of all its ports are pure, see :func:`pure`, and
+        none of the port classes override the validation methods.
+        """
+        cls = type(self)
+        return (
+            cls.validate is PortNamespace.validate
+            and cls.validate_ports is PortNamespace.validate_ports
+            and cls.validate_dynamic_ports is PortNamespace.validate_dynamic_ports
+            and is_pure(self._validator)
+            and all(port.has_pure_validation() for port in self._ports.values())
+        )
+
+    def compile_validator(
+        self, breadcrumbs: Sequence[str] = (), values_validated: bool = False
+    ) -> COMPILED_VALIDATOR_TYPE:
+        """Return a function that validates port values for this namespace, equivalent to calling :meth:`validate`.
+
+        The ports of the namespace are resolved once into a flat sequence of compiled checks, so the port values do not
+        have to be copied and the breadcrumbs are only built when validation fails. The returned function is only valid
+        as long as neither the namespace nor any of its ports is modified, see :func:`get_revision`.
+
+        :param breadcrumbs: a tuple of the path to having reached this point in validation
+        :param values_validated: if ``True``, the values are assumed to have already been validated against their ports
+            individually, as is the case for outputs emitted with :meth:`plumpy.Process.out`. Only the constraints that
+            span multiple values are then checked: that required ports are specified and the validators of namespaces.
+            This makes the cost independent of the number of values in dynamic namespaces.
+        """
+        cls = type(self)
+        if (
+            cls.validate is not PortNamespace.validate
+            or cls.validate_ports is not PortNamespace.validate_ports
+            or cls.validate_dynamic_ports is not PortNamespace.validate_dynamic_ports
+        ):
+            return functools.partial(self.validate, breadcrumbs=breadcrumbs)
+
+        breadcrumbs_local = (*breadcrumbs, self.name)
+        checks: List[
+            Tuple[str, Port, Optional[COMPILED_VALIDATOR_TYPE], bool, Optional[type], Optional[VALIDATOR_TYPE]]
+        ] = []
+
+        # The checks of plain ports are inlined in the loop below, as a function call per port would cost about as much
+        # as the validation itself. Only namespaces and ports that override ``validate`` get a compiled validator.
+        for name, port in self._ports.items():
+            if isinstance(port, PortNamespace) or type(port).validate is not Port.validate:
+                checks.append(
+                    (name, port, port.compile_validator(breadcrumbs_local, values_validated), False, None, None)
+                )
+            elif values_validated:
+                checks.append((name, port, None, port.required, None, None))
+            else:
+                checks.append((name, port, None, port.required, port.valid_type, port._normalized_validator))
+
+        checks_tuple = tuple(checks)
+        names = frozenset(self._ports)
+        required = self._required
+        validator = self._normalized_validator
+        location = breadcrumbs_to_port(breadcrumbs_local)
+
+        def validate(port_values: Optional[Mapping[str, Any]]) -> Optional[PortValidationError]:
+            if not port_values:
+                port_values = {}
+
+            if not isinstance(port_values, collections.abc.Mapping):
+                message = f'specified value is of type {type(port_values)} which is not sub class of `Mapping`'
+                return PortValidationError(message, location)
+
+            if not port_values and not required:
+                return None
+
+            get = port_values.get
+            matched = 0
+
+            for name, port, check, port_required, valid_type, port_validator in checks_tuple:
+                value = get(name, _MISSING)
+                if value is _MISSING:
+                    value = UNSPECIFIED
+                else:
+                    matched += 1
+
+                if check is not None:
+                    validation_error = check(value)
+                    if validation_error:
+                        return validation_error
+                elif value is UNSPECIFIED:
+                    if port_required:
+                        return port.validate(value, breadcrumbs_local)
+                elif valid_type is not None and not isinstance(value, valid_type):
+                    return port.validate(value, breadcrumbs_local)
+                elif port_validator is not None:
+                    result = port_validator(value, port)
+                    if result is not None:
+                        assert isinstance(result, str), 'Validator returned non string type'
+                        return PortValidationError(result, breadcrumbs_to_port((*breadcrumbs_local, port.name)))
+
+            if matched < len(port_values) and not values_validated:
+                dynamic_values = {key: value for key, value in port_values.items() if key not in names}
+                validation_error = self.validate_dynamic_ports(dynamic_values, breadcrumbs)
+                if validation_error:
+                    return validation_error
+
+            if validator is not None:
+                message = validator(dict(port_values), self)
+                if message is not None:
+                    assert isinstance(message, str), (
+                        f"Validator returned something other than None or str: '{type(message)}'"
+                    )
+                    return PortValidationError(message, location)
+
+            return None
+
+        return validate
+
     def pre_process(self, port_values: MutableMapping[str, Any]) -> AttributesFrozendict:
         """Map port values onto the port namespace, filling in values for ports with a default.
 
@@ -706,6 +946,54 @@ class PortNamespace(collections.abc.MutableMapping, Port):
 
         return AttributesFrozendict(port_values)
 
+    def compile_pre_process(self) -> COMPILED_PRE_PROCESS_TYPE:
+        """Return a function that pre-processes port values, equivalent to calling :meth:`pre_process`.
+
+        The ports of the namespace are resolved once into a plan of the nested namespaces and the ports that provide a
+        value when none is specified, i.e. those with a static or callable default and the namespaces that populate
+        their defaults. Pre-processing then only costs a pass over the specified values and the defaulted ports. The
+        returned function is only valid as long as neither the namespace nor any of its ports is modified, see
+        :func:`get_revision`.
+        """
+        if type(self).pre_process is not PortNamespace.pre_process:
+            return self.pre_process
+
+        namespaces: Dict[str, COMPILED_PRE_PROCESS_TYPE] = {}
+        defaults: List[Tuple[str, Any, bool, Optional[COMPILED_PRE_PROCESS_TYPE]]] = []
+
+        for name, port in self._ports.items():
+            namespace_plan: Optional[COMPILED_PRE_PROCESS_TYPE] = None
+
+            if isinstance(port, PortNamespace):
+                namespace_plan = port.compile_pre_process()
+                namespaces[name] = namespace_plan
+
+                if not port.populate_defaults:
+                    continue
+
+            if isinstance(port, (InputPort, PortNamespace)) and port.has_default():
+                defaults.append((name, port.default, callable(port.default), namespace_plan))
+            elif isinstance(port, PortNamespace) and port.ports:
+                defaults.append((name, dict, True, namespace_plan))
+
+        defaults_tuple = tuple(defaults)
+
+        def pre_process(port_values: MutableMapping[str, Any]) -> AttributesFrozendict:
+            if namespaces:
+                for name, value in port_values.items():
+                    namespace_pre_process = namespaces.get(name)
+                    if namespace_pre_process is not None:
+                        port_values[name] = namespace_pre_process(value)
+
+            for name, default, is_callable, namespace_pre_process in defaults_tuple:
+                if name not in port_values:
+                    value = default() if is_callable else default
+                    port_values[name] = value if namespace_pre_process is None else namespace_pre_process(value)
+
+            return AttributesFrozendict(port_values)
+
+        return pre_process
+
     def validate_ports(
         self, port_values: MutableMapping[str, Any], breadcrumbs: Sequence[str]
     ) -> Optional[PortValidationError]:
@@ -741,21 +1029,40 @@ class PortNamespace(collections.abc.MutableMapping, Port):
         :rtype: typing.Optional[str]
         """
         if port_values and not self.dynamic:
-            msg = f'Unexpected ports {port_values}, for a non dynamic namespace'
+            msg = f'Unexpected ports {format_port_values(port_values)}, for a non dynamic namespace'
             return PortValidationError(msg, breadcrumbs_to_port((*breadcrumbs, self.name)))
 
-        if self.valid_type is None:
+        valid_type = self.valid_type
+
+        if valid_type is None:
             return None
 
-        if isinstance(port_values, dict):
-            for key, value in port_values.items():
-                result = self.validate_dynamic_ports(value, (*breadcrumbs, self.name, key))
-                if result is not None:
-                    return result
-        elif not isinstance(port_values, self.valid_type):
-            msg = f'Invalid type {type(port_values)} for dynamic port value: expected {self.valid_type}'
+        if not isinstance(port_values, dict):
+            if isinstance(port_values, valid_type):
+                return None
+            msg = f'Invalid type {type(port_values)} for dynamic port value: expected {valid_type}'
             return PortValidationError(msg, breadcrumbs_to_port(breadcrumbs))
 
+        # Walk the nested dictionaries depth first with a stack of iterators instead of recursing, such that validating
+        # a value only costs the type check. The keys of the dictionaries on the stack are tracked to build the
+        # breadcrumbs of the value that fails validation.
+        stack = [iter(port_values.items())]
+        keys: List[str] = []
+
+        while stack:
+            for key, value in stack[-1]:
+                if isinstance(value, dict):
+                    keys.append(key)
+                    stack.append(iter(value.items()))
+                    break
+                if not isinstance(value, valid_type):
+                    msg = f'Invalid type {type(value)} for dynamic port value: expected {valid_type}'
+                    return PortValidationError(msg, breadcrumbs_to_port((*breadcrumbs, self.name, *keys, key)))
+            else:
+                stack.pop()
+                if keys:
+                    keys.pop()
+
         return None
 
     @staticmethod
@@ -791,6 +1098,20 @@ class PortNamespace(collections.abc.MutableMapping, Port):
         return stripped
 
 
+def format_port_values(port_values: Any) -> str:
+    """Format port values for an error message, only including the first ones if there are many.
+
+    :param port_values: the port values, typically a mapping
+    :return: the formatted port values
+    """
+    if isinstance(port_values, collections.abc.Mapping) and len(port_values) > MAX_FORMATTED_PORT_VALUES:
+        items = itertools.islice(port_values.items(), MAX_FORMATTED_PORT_VALUES)
+        formatted = ', '.join(f'{key!r}: {value!r}' for key, value in items)
+        return f'{{{formatted}, ...}} ({len(port_values)} in total)'
+
+    return f'{port_values}'
+
+
 def breadcrumbs_to_port(breadcrumbs: Sequence[str]) -> str:
     """Convert breadcrumbs to a string representing the port
 
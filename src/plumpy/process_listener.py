@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 import abc
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Sequence, Tuple
 
 from . import persistence
 from .utils import SAVED_STATE_TYPE, protected
@@ -13,6 +13,10 @@ if TYPE_CHECKING:
 
 @persistence.auto_persist('_params')
 class ProcessListener(persistence.Savable, metaclass=abc.ABCMeta):
+    # The hooks whose default implementation calls other hooks, such that they should also be dispatched to listeners
+    # that only override one of those other hooks
+    DELEGATING_HOOKS: ClassVar[Dict[str, Tuple[str, ...]]] = {'on_outputs_emitted': ('on_output_emitted',)}
+
     # region Persistence methods
 
     def __init__(self) -> None:
@@ -82,6 +86,19 @@ class ProcessListener(persistence.Savable, metaclass=abc.ABCMeta):
 
         """
 
+    def on_outputs_emitted(self, process: 'Process', outputs: Sequence[Tuple[str, Any, bool]]) -> None:
+        """
+        Called when the process has emitted multiple output values at once
+
+        By default :meth:`on_output_emitted` is called for each output, override this to handle them as a batch.
+
+        :param process: The process
+        :param outputs: The outputs as tuples of the output port, the value and whether the port is dynamic
+
+        """
+        for output_port, value, dynamic in outputs:
+            self.on_output_emitted(process, output_port, value, dynamic)
+
     def on_process_finished(self, process: 'Process', outputs: Any) -> None:
         """
         Called when the process has finished successfully
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 import collections
+import functools
 import json
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Type, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Mapping, Optional, Sequence, Tuple, Type, Union, cast
 
+from . import ports, settings, utils
 from .ports import InputPort, OutputPort, Port, PortNamespace
 
 if TYPE_CHECKING:
@@ -40,6 +42,12 @@ class ProcessSpec:
         self._ports.create_port_namespace(self.NAME_OUTPUTS_PORT_NAMESPACE)
         self._exposed_inputs: EXPOSED_TYPE = collections.defaultdict(lambda: collections.defaultdict(list))
         self._exposed_outputs: EXPOSED_TYPE = collections.defaultdict(lambda: collections.defaultdict(list))
+        self._compiled: Dict[Tuple[str, int], Tuple[int, Port, Callable[..., Any]]] = {}
+        self._validation_cache: collections.OrderedDict[Hashable, None] = collections.OrderedDict()
+        self._validation_cache_revision: Optional[int] = None
+        self._output_ports: Dict[str, Tuple[Tuple[str, ...], str, PortNamespace, Optional[Port]]] = {}
+        self._output_namespaces: Dict[str, Tuple[Tuple[str, ...], PortNamespace]] = {}
+        self._output_index_revision: Optional[int] = None
 
     def __str__(self) -> str:
         return json.dumps(self.get_description(), sort_keys=True, indent=4)
@@ -68,6 +76,152 @@ class ProcessSpec:
         """
         return self._sealed
 
+    def get_validator(self, port: Port, values_validated: bool = False) -> ports.COMPILED_VALIDATOR_TYPE:
+        """
+        Return a function that validates a value for the given port or port namespace of this specification
+
+        Once the specification is sealed, the validator is compiled with :meth:`plumpy.ports.Port.compile_validator`
+        and cached, until any port is modified. Before that, the ``validate`` method of the port is returned.
+
+        :param port: the port or port namespace
+        :param values_validated: if ``True``, only check the constraints that span multiple values, as the values have
+            already been validated against their ports individually, see :meth:`plumpy.ports.Port.compile_validator`
+        :return: a function that takes the value and returns ``None`` or a ``PortValidationError``
+        """
+        if not self._sealed:
+            return port.validate
+
+        if values_validated:
+            return self._get_compiled(
+                'validator_values_validated', port, functools.partial(port.compile_validator, values_validated=True)
+            )
+
+        return self._get_compiled('validator', port, port.compile_validator)
+
+    def get_pre_process(self, port_namespace: PortNamespace) -> ports.COMPILED_PRE_PROCESS_TYPE:
+        """
+        Return a function that pre-processes values for the given port namespace of this specification
+
+        Once the specification is sealed, the function is compiled with
+        :meth:`plumpy.ports.PortNamespace.compile_pre_process` and cached, until any port is modified. Before that, the
+        ``pre_process`` method of the port namespace is returned.
+
+        :param port_namespace: the port namespace
+        :return: a function that takes the mutable mapping of values and returns the pre-processed values
+        """
+        if not self._sealed:
+            return port_namespace.pre_process
+
+        return self._get_compiled('pre_process', port_namespace, port_namespace.compile_pre_process)
+
+    def resolve_output_port(self, output_port: str) -> Tuple[Tuple[str, ...], str, PortNamespace, Optional[Port]]:
+        """
+        Resolve the full name of an output port to the port namespace that contains it and the port itself
+
+        Port namespaces that do not exist yet are created dynamically. Once the specification is sealed, explicit ports
+        and port namespaces are cached by their full name, such that resolving them costs a single lookup. The port of
+        a dynamic output is not cached but looked up in the cached namespace, such that emitting many outputs with
+        different names does not grow the cache.
+
+        :param output_port: the full name of the output port, can be namespaced
+        :return: tuple of the namespace of the port as a tuple of names, the port name, the port namespace containing
+            the port and the port itself, which is ``None`` if the output is dynamic
+        :raises: ValueError if a namespace does not exist and cannot be created dynamically
+        """
+        revision = ports.get_revision()
+        if revision != self._output_index_revision:
+            self._output_ports.clear()
+            self._output_namespaces.clear()
+            self._output_index_revision = revision
+
+        resolved = self._output_ports.get(output_port)
+        if resolved is not None:
+            return resolved
+
+        separator = self.namespace_separator
+        namespace, _, port_name = output_port.rpartition(separator)
+        cached = self._output_namespaces.get(namespace)
+
+        if cached is None:
+            if namespace:
+                port_namespace = cast(PortNamespace, self.outputs.get_port(namespace, create_dynamically=True))
+                cached = (tuple(namespace.split(separator)), port_namespace)
+            else:
+                cached = ((), self.outputs)
+
+            if self._sealed:
+                # Creating a dynamic namespace only adds ports where none were resolved, so the cache remains valid
+                self._output_index_revision = ports.get_revision()
+                self._output_namespaces[namespace] = cached
+
+        namespace_parts, port_namespace = cached
+        port = port_namespace.ports.get(port_name)
+        resolved = (namespace_parts, port_name, port_namespace, port)
+
+        if port is not None and self._sealed:
+            self._output_ports[output_port] = resolved
+
+        return resolved
+
+    def validate_inputs(self, inputs: Mapping[str, Any]) -> Optional[ports.PortValidationError]:
+        """
+        Validate parsed inputs against the input port namespace of this specification
+
+        If ``settings.validation_cache_size`` is set and the spec is sealed and only has pure validators, successful
+        validations are cached with the fingerprint of the inputs as key, see ``settings.validation_fingerprint``, such
+        that validating equal inputs again is skipped. Inputs whose fingerprint is not hashable are always validated.
+
+        :param inputs: the parsed inputs
+        :return: ``None`` or a ``PortValidationError``
+        """
+        validator = self.get_validator(self.inputs)
+        size = settings.validation_cache_size
+
+        if not size or not self._sealed or not self._get_compiled('pure', self.inputs, self.inputs.has_pure_validation):
+            return validator(inputs)
+
+        try:
+            key = (settings.validation_fingerprint or utils.fingerprint)(inputs)
+            hash(key)
+        except TypeError:
+            return validator(inputs)
+
+        revision = ports.get_revision()
+        if revision != self._validation_cache_revision:
+            self._validation_cache.clear()
+            self._validation_cache_revision = revision
+
+        if key in self._validation_cache:
+            self._validation_cache.move_to_end(key)
+            return None
+
+        validation_error = validator(inputs)
+
+        if validation_error is None:
+            self._validation_cache[key] = None
+            while len(self._validation_cache) > size:
+                self._validation_cache.popitem(last=False)
+
+        return validation_error
+
+    def _get_compiled(self, kind: str, port: Port, compiler: Callable[[], Any]) -> Any:
+        """Return the cached result of ``compiler`` for the port, calling it again if any port was modified since."""
+        key = (kind, id(port))
+        revision = ports.get_revision()
+
+        try:
+            compiled_revision, compiled_port, compiled = self._compiled[key]
+        except KeyError:
+            pass
+        else:
+            if compiled_revision == revision and compiled_port is port:
+                return compiled
+
+        compiled = compiler()
+        self._compiled[key] = (revision, port, compiled)
+
+        return compiled
+
     def get_description(self) -> Dict[str, Any]:
         """
         Get a description of this process specification
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import functools
+import inspect
 import sys
+import time
 import traceback
 from enum import Enum
 from types import TracebackType
@@ -19,7 +22,7 @@ try:
 except ImportError:
     _HAS_TBLIB = False
 
-from . import exceptions, futures, persistence, utils
+from . import exceptions, executors, futures, persistence, utils
 from .base import state_machine
 from .lang import NULL
 from .persistence import auto_persist
@@ -72,22 +75,26 @@ class PauseInterruption(Interruption):
 
 
 class Command(persistence.Savable):
-    pass
+    __slots__ = ('_called',)
 
 
 @auto_persist('msg')
 class Kill(Command):
+    __slots__ = ('msg',)
+
     def __init__(self, msg: Optional[MessageType] = None):
         super().__init__()
         self.msg = msg
 
 
 class Pause(Command):
-    pass
+    __slots__ = ()
 
 
 @auto_persist('msg', 'data')
 class Wait(Command):
+    __slots__ = ('continue_fn', 'data', 'msg')
+
     def __init__(
         self,
         continue_fn: Optional[Callable[..., Any]] = None,
@@ -102,6 +109,8 @@ class Wait(Command):
 
 @auto_persist('result')
 class Stop(Command):
+    __slots__ = ('result', 'successful')
+
     def __init__(self, result: Any, successful: bool) -> None:
         super().__init__()
         self.result = result
@@ -110,6 +119,8 @@ class Stop(Command):
 
 @auto_persist('args', 'kwargs')
 class Continue(Command):
+    __slots__ = ('args', 'continue_fn', 'kwargs')
+
     CONTINUE_FN = 'continue_fn'
 
     def __init__(self, continue_fn: Callable[..., Any], *args: Any, **kwargs: Any):
@@ -151,6 +162,8 @@ class ProcessState(Enum):
 
 @auto_persist('in_state')
 class State(state_machine.State, persistence.Savable):
+    __slots__ = ()
+
     @property
     def process(self) -> state_machine.StateMachine:
         """
@@ -168,6 +181,8 @@ class State(state_machine.State, persistence.Savable):
 
 @auto_persist('args', 'kwargs')
 class Created(State):
+    __slots__ = ('args', 'kwargs', 'run_fn')
+
     LABEL = ProcessState.CREATED
     ALLOWED = {ProcessState.RUNNING, ProcessState.KILLED, ProcessState.EXCEPTED}
 
@@ -194,6 +209,8 @@ class Created(State):
 
 @auto_persist('args', 'kwargs')
 class Running(State):
+    __slots__ = ('_command', '_run_handle', '_running', 'args', 'kwargs', 'run_fn')
+
     LABEL = ProcessState.RUNNING
     ALLOWED = {
         ProcessState.RUNNING,
@@ -206,23 +223,20 @@ class Running(State):
     RUN_FN = 'run_fn'  # The key used to store the function to run
     COMMAND = 'command'  # The key used to store an upcoming command
 
-    # Class level defaults
-    _command: Union[None, Kill, Stop, Wait, Continue] = None
-    _running: bool = False
-    _run_handle = None
-
     def __init__(
         self, process: 'Process', run_fn: Callable[..., Union[Awaitable[Any], Any]], *args: Any, **kwargs: Any
     ) -> None:
         super().__init__(process)
         assert run_fn is not None
-        self.run_fn = ensure_coroutine(run_fn)
+        self.run_fn = self._ensure_coroutine(run_fn)
         # We wrap `run_fn` to a coroutine so we can apply await on it,
         # even it if it was not a coroutine in the first place.
         # This allows the same usage of async and non-async function
         # with the await syntax while not changing the program logic.
         self.args = args
         self.kwargs = kwargs
+        self._command: Union[None, Kill, Stop, Wait, Continue] = None
+        self._running: bool = False
         self._run_handle = None
 
     def save_instance_state(self, out_state: SAVED_STATE_TYPE, save_context: persistence.LoadSaveContext) -> None:
@@ -233,7 +247,10 @@ class Running(State):
 
     def load_instance_state(self, saved_state: SAVED_STATE_TYPE, load_context: persistence.LoadSaveContext) -> None:
         super().load_instance_state(saved_state, load_context)
-        self.run_fn = ensure_coroutine(getattr(self.process, saved_state[self.RUN_FN]))
+        self.run_fn = self._ensure_coroutine(getattr(self.process, saved_state[self.RUN_FN]))
+        self._command = None
+        self._running = False
+        self._run_handle = None
         if self.COMMAND in saved_state:
             self._command = persistence.Savable.load(saved_state[self.COMMAND], load_context)  # type: ignore
 
@@ -244,19 +261,33 @@ class Running(State):
         if self._command is not None:
             command = self._command
         else:
-            try:
+            started = time.monotonic()
+            fused = 0
+
+            while True:
                 try:
-                    self._running = True
-                    result = await self.run_fn(*self.args, **self.kwargs)
-                finally:
-                    self._running = False
-            except Interruption:
-                # Let this bubble up to the caller
-                raise
-            except Exception:
-                excepted = self.create_state(ProcessState.EXCEPTED, *sys.exc_info()[1:])
-                return cast(State, excepted)
-            else:
+                    try:
+                        self._running = True
+                        result = await self.run_fn(*self.args, **self.kwargs)
+                    finally:
+                        self._running = False
+                except Interruption:
+                    # Let this bubble up to the caller
+                    raise
+                except Exception:
+                    excepted = self.create_state(ProcessState.EXCEPTED, *sys.exc_info()[1:])
+                    return cast(State, excepted)
+
+                if isinstance(result, Continue) and self._can_fuse(fused, started):
+                    fused += 1
+                    # Run the next step within this state instead of transitioning to a new ``Running`` state. The
+                    # state is updated in place such that a checkpoint taken from here on resumes at the new step.
+                    self.run_fn = self._ensure_coroutine(result.continue_fn)
+                    self.args = result.args
+                    self.kwargs = {}
+                    self.process.on_step_fused()  # type: ignore[attr-defined]
+                    continue
+
                 if not isinstance(result, Command):
                     if isinstance(result, exceptions.UnsuccessfulResult):
                         result = Stop(result.result, False)
@@ -265,10 +296,56 @@ class Running(State):
                         result = Stop(result, True)
 
                 command = result
+                break
 
         next_state = self._action_command(command)
         return next_state
 
+    def _ensure_coroutine(self, run_fn: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+        """Wrap the run function in a coroutine, running it in the executor of the process if it is synchronous.
+
+        Functions decorated with :func:`plumpy.executors.blocking` already take care of this themselves and functions
+        decorated with :func:`plumpy.executors.on_loop` always run on the event loop thread.
+        """
+        executor = cast('Process', self.process).EXECUTOR
+        if (
+            executor is None
+            or inspect.iscoroutinefunction(run_fn)
+            or inspect.iscoroutinefunction(getattr(run_fn, '__call__', None))
+            or hasattr(run_fn, executors.EXECUTOR_ATTRIBUTE)
+            or getattr(run_fn, executors.ON_LOOP_ATTRIBUTE, False)
+        ):
+            return ensure_coroutine(run_fn)
+
+        @functools.wraps(run_fn)
+        async def run_in_executor(*args: Any, **kwargs: Any) -> Any:
+            return await executors.run_in_executor(executor, run_fn, *args, **kwargs)
+
+        return run_in_executor
+
+    def _can_fuse(self, fused: int, started: float) -> bool:
+        """Return whether a ``Continue`` can be executed within this state instead of transitioning.
+
+        This is only the case if the process opted in to fused stepping and there is no pending pause or kill, which
+        need an actual state transition to be honored. The chain of fused steps is also cut once it exhausts the
+        ``STEP_BUDGET`` or ``STEP_TIME_BUDGET`` of the process, such that ``step_until_terminated`` can yield.
+
+        :param fused: the number of steps that were fused in this state so far
+        :param started: the monotonic time at which this state started running its steps
+        """
+        process = cast('Process', self.process)
+        budget = process.STEP_BUDGET
+        time_budget = process.STEP_TIME_BUDGET
+        return (
+            process.FUSE_CONTINUE_STEPS
+            and process._interrupt_action is None
+            and process._pausing is None
+            and process._killing is None
+            and not process.paused
+            and (budget is None or fused + 1 < budget)
+            and (time_budget is None or time.monotonic() - started < time_budget)
+        )
+
     def _action_command(self, command: Union[Kill, Stop, Wait, Continue]) -> State:
         if isinstance(command, Kill):
             state = self.create_state(ProcessState.KILLED, command.msg)
@@ -288,6 +365,8 @@ class Running(State):
 
 @auto_persist('msg', 'data')
 class Waiting(State):
+    __slots__ = ('_waiting_future', 'data', 'done_callback', 'msg')
+
     LABEL = ProcessState.WAITING
     ALLOWED = {
         ProcessState.RUNNING,
@@ -299,8 +378,6 @@ class Waiting(State):
 
     DONE_CALLBACK = 'DONE_CALLBACK'
 
-    _interruption = None
-
     def __str__(self) -> str:
         state_info = super().__str__()
         if self.msg is not None:
@@ -372,6 +449,8 @@ class Excepted(State):
     :param trace_back: An optional exception traceback
     """
 
+    __slots__ = ('exception', 'traceback')
+
     LABEL = ProcessState.EXCEPTED
 
     EXC_VALUE = 'ex_value'
@@ -434,6 +513,8 @@ class Finished(State):
     :param successful: Boolean for the exit code is ``0`` the process is successful.
     """
 
+    __slots__ = ('result', 'successful')
+
     LABEL = ProcessState.FINISHED
 
     def __init__(self, process: 'Process', result: Any, successful: bool) -> None:
@@ -453,6 +534,8 @@ class Killed(State):
     :param msg: An optional message explaining the reason for the process termination.
     """
 
+    __slots__ = ('msg',)
+
     LABEL = ProcessState.KILLED
 
     def __init__(self, process: 'Process', msg: Optional[MessageType]):
@@ -19,10 +19,12 @@ from typing import (
     Any,
     Awaitable,
     Callable,
+    Coroutine,
     Dict,
     Generator,
     Hashable,
     List,
+    Mapping,
     Optional,
     Sequence,
     Tuple,
@@ -41,7 +43,6 @@ from . import (
     exceptions,
     futures,
     persistence,
-    ports,
     process_comms,
     process_states,
     utils,
@@ -149,6 +150,18 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
 
     # Static class stuff ######################
     _spec_class = ProcessSpec
+    # If True, consecutive ``Continue`` commands are executed within a single RUNNING state, see ``on_step_fused``
+    FUSE_CONTINUE_STEPS: bool = False
+    # Name of the executor in which synchronous run functions are called instead of on the event loop thread, see the
+    # ``plumpy.executors`` module. Pause and kill requests are honored as soon as the running function returns. The
+    # steps of a ``WorkChain`` always run on the event loop thread, unless they are decorated with ``blocking``.
+    EXECUTOR: Optional[str] = None
+    # Maximum number of consecutive steps, and maximum time in seconds spent stepping, after which
+    # ``step_until_terminated`` yields control to the event loop. Steps that do not suspend would otherwise starve other
+    # processes and tasks on the same loop. A chain of fused ``Continue`` commands counts as a single step, but the
+    # chain itself is cut once it exhausts either budget.
+    STEP_BUDGET: Optional[int] = None
+    STEP_TIME_BUDGET: Optional[float] = None
     # Default placeholders, will be populated in init()
     _stepping = False
     _pausing: Optional[futures.CancellableAction] = None
@@ -156,7 +169,7 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
     _killing: Optional[futures.CancellableAction] = None
     _interrupt_action: Optional[futures.CancellableAction] = None
     _closed = False
-    _cleanups: Optional[List[Callable[[], None]]] = None
+    _cleanups: Optional[List[Callable[[], None]]] = None  # functions to be run when closed, allocated on first use
 
     __called: bool = False
 
@@ -284,13 +297,13 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
         """
         super().__init__()
 
+        self._init_runtime_attributes()
+
         # Don't allow the spec to be changed anymore
         self.spec().seal()
 
         self._loop = loop if loop is not None else events.get_or_create_event_loop()
 
-        self._setup_event_hooks()
-
         self._status: Optional[str] = None  # May hold a current status message
         self._pre_paused_status: Optional[str] = (
             None  # Save status when a pause message replaces it, such that it can be restored
@@ -302,6 +315,7 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
         self._pid = pid
         self._parsed_inputs: Optional[utils.AttributesFrozendict] = None
         self._outputs: Dict[str, Any] = {}
+        self._outputs_validated = True
         self._uuid: Optional[uuid.UUID] = None
         self._creation_time: Optional[float] = None
 
@@ -311,14 +325,28 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
         self._logger = logger
         self._communicator = communicator
 
+    def _init_runtime_attributes(self) -> None:
+        """Initialise the runtime attributes that are not persisted.
+
+        All instances should define the same attributes in the same order, such that the instance dictionaries can
+        share their keys, which considerably reduces the memory footprint of each process.
+        """
+        self._stepping = False
+        self._pausing = None
+        self._killing = None
+        self._interrupt_action = None
+        self._closed = False
+        self._cleanups = None
+        self._preemptions = 0
+        # Whether all outputs were validated against their port when they were emitted by this instance
+        self._outputs_validated = False
+
     @super_check
     def init(self) -> None:
         """Common initialisation logic, after create or load, goes here.
 
         This method is called in :class:`plumpy.base.state_machine.StateMachineMeta`
         """
-        self._cleanups = []  # a list of functions to be ran on terminated
-
         if self._communicator is not None:
             try:
                 identifier = self._communicator.add_rpc_subscriber(self.message_receive, identifier=str(self.pid))
@@ -338,30 +366,31 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
                 )
 
         if not self._future.done():
+            self._future.add_done_callback(self._try_killing)
+
+    def _try_killing(self, future: futures.Future) -> None:
+        """Kill the process if its future was cancelled."""
+        if future.cancelled():
+            if not self.kill('Killed by future being cancelled'):
+                self.logger.warning(
+                    'Process<%s>: Failed to kill process on future cancel',
+                    self.pid,
+                )
 
-            def try_killing(future: futures.Future) -> None:
-                if future.cancelled():
-                    if not self.kill('Killed by future being cancelled'):
-                        self.logger.warning(
-                            'Process<%s>: Failed to kill process on future cancel',
-                            self.pid,
-                        )
-
-            self._future.add_done_callback(try_killing)
-
-    def _setup_event_hooks(self) -> None:
-        """Set the event hooks to process, when it is created or loaded(recreated)."""
-        event_hooks = {
-            state_machine.StateEventHook.ENTERING_STATE: lambda _s, _h, state: self.on_entering(
-                cast(process_states.State, state)
-            ),
-            state_machine.StateEventHook.ENTERED_STATE: lambda _s, _h, from_state: self.on_entered(
-                cast(Optional[process_states.State], from_state)
-            ),
-            state_machine.StateEventHook.EXITING_STATE: lambda _s, _h, _state: self.on_exiting(),
-        }
-        for hook, callback in event_hooks.items():
-            self.add_state_event_callback(hook, callback)
+    def _fire_state_event(self, hook: Hashable, state: Optional[state_machine.State]) -> None:
+        """Map the state event hooks onto the process event methods before calling any registered callbacks.
+
+        The process methods are called directly, instead of being registered as callbacks, such that they do not have
+        to be allocated for each instance. Just like registered callbacks, they are no longer called once closed.
+        """
+        if not self._closed:
+            if hook == state_machine.StateEventHook.ENTERING_STATE:
+                self.on_entering(cast(process_states.State, state))
+            elif hook == state_machine.StateEventHook.ENTERED_STATE:
+                self.on_entered(cast(Optional[process_states.State], state))
+            elif hook == state_machine.StateEventHook.EXITING_STATE:
+                self.on_exiting()
+        super()._fire_state_event(hook, state)
 
     @property
     def creation_time(self) -> Optional[float]:
@@ -425,6 +454,11 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
         """Set the status message of the process."""
         self._status = status
 
+    @property
+    def preemptions(self) -> int:
+        """Return how often ``step_until_terminated`` yielded to the event loop as the step budget ran out."""
+        return self._preemptions
+
     @property
     def paused(self) -> bool:
         """Return whether the process was being paused."""
@@ -456,7 +490,7 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
             loop=self.loop,
             communicator=self._communicator,
         )
-        self.loop.create_task(process.step_until_terminated())
+        self._create_task(process.step_until_terminated())
         return process
 
     # region State introspection methods
@@ -555,9 +589,25 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
         """
         args = (callback,) + args
         handle = events.ProcessCallback(self, self._run_task, args, kwargs)
-        self.loop.create_task(handle.run())
+        self._create_task(handle.run())
         return handle
 
+    def _create_task(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """Schedule the coroutine on the event loop of the process.
+
+        If called from another thread, such as that of the executor of the process, while the loop is running, the
+        task is created on the thread of the loop.
+        """
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is not self._loop and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.create_task, coro)
+        else:
+            self._loop.create_task(coro)
+
     def callback_excepted(
         self,
         _callback: Callable[..., Any],
@@ -643,8 +693,7 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
         """
         # First make sure the state machine constructor is called
         super().__init__()
-
-        self._setup_event_hooks()
+        self._init_runtime_attributes()
 
         # Runtime variables, set initial states
         self._future = persistence.SavableFuture()
@@ -782,8 +831,9 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
         # dictionaries, so we don't use ``copy.deepcopy`` (which might seem like the obvious choice) as that will also
         # create a clone of the values, which we don't want.
         raw_inputs = recursively_copy_dictionaries(dict(self._raw_inputs)) if self._raw_inputs else {}
-        self._parsed_inputs = self.spec().inputs.pre_process(raw_inputs)
-        result = self.spec().inputs.validate(self._parsed_inputs)
+        spec = self.spec()
+        self._parsed_inputs = spec.get_pre_process(spec.inputs)(raw_inputs)
+        result = spec.validate_inputs(self._parsed_inputs)
 
         if result is not None:
             raise ValueError(result)
@@ -810,12 +860,33 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
         """Entered the RUNNING state."""
         self._fire_event(ProcessListener.on_process_running)
 
+    def on_step_fused(self) -> None:
+        """Called between two steps that are executed within the same RUNNING state.
+
+        This only happens if ``FUSE_CONTINUE_STEPS`` is enabled, in which case a ``Continue`` command returned by a
+        step does not cause a transition, so none of the state hooks or state change broadcasts are triggered. The
+        running state already refers to the next step when this is called, so the ``on_process_running`` event is fired
+        again, such that listeners that create a checkpoint on entering the RUNNING state still see every step.
+        """
+        self._fire_event(ProcessListener.on_process_running)
+
     def on_output_emitting(self, output_port: str, value: Any) -> None:
         """Output is about to be emitted."""
 
     def on_output_emitted(self, output_port: str, value: Any, dynamic: bool) -> None:
         self._event_helper.fire_event(ProcessListener.on_output_emitted, self, output_port, value, dynamic)
 
+    def on_outputs_emitted(self, outputs: Sequence[Tuple[str, Any, bool]]) -> None:
+        """Multiple outputs were emitted at once through :meth:`out_many`.
+
+        :param outputs: the emitted outputs as tuples of the output port, the value and whether the port is dynamic
+        """
+        if type(self).on_output_emitted is not Process.on_output_emitted:
+            for output_port, value, dynamic in outputs:
+                self.on_output_emitted(output_port, value, dynamic)
+        else:
+            self._event_helper.fire_event(ProcessListener.on_outputs_emitted, self, outputs)
+
     @super_check
     def on_wait(self, awaitables: Sequence[Awaitable]) -> None:
         """Entering the WAITING state."""
@@ -861,7 +932,10 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
     def on_finish(self, result: Any, successful: bool) -> None:
         """Entering the FINISHED state."""
         if successful:
-            validation_error = self.spec().outputs.validate(self.outputs)
+            # The outputs emitted through ``out`` were already validated individually, so unless the outputs were
+            # restored from a saved state, only the constraints that span multiple outputs have to be validated
+            spec = self.spec()
+            validation_error = spec.get_validator(spec.outputs, self._outputs_validated)(self.outputs)
             if validation_error:
                 state_cls = self.get_states_map()[process_states.ProcessState.FINISHED]
                 finished_state = state_cls(self, result=result, successful=False)
@@ -930,7 +1004,7 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
                     self.logger.exception('Process<%s>: Exception calling cleanup method %s', self.pid, cleanup)
             self._cleanups = None
         finally:
-            self._event_callbacks = {}
+            self._event_callbacks = None
             self._closed = True
 
     def _fire_event(self, evt: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
@@ -1062,7 +1136,8 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
     @ensure_not_closed
     def add_cleanup(self, cleanup: Callable[[], None]) -> None:
         """Add callback, which will be run when the process is being closed."""
-        assert self._cleanups is not None
+        if self._cleanups is None:
+            self._cleanups = []
         self._cleanups.append(cleanup)
 
     def close(self) -> None:
@@ -1364,9 +1439,33 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
 
         This is the function run by the event loop (not ``step``).
 
+        If ``STEP_BUDGET`` or ``STEP_TIME_BUDGET`` is set, control is yielded to the event loop each time the budget is
+        exhausted, even if the steps themselves never suspend.
         """
+        budget = self.STEP_BUDGET
+        time_budget = self.STEP_TIME_BUDGET
+
+        if budget is None and time_budget is None:
+            while not self.has_terminated():
+                await self.step()
+            return
+
+        steps = 0
+        start = time.monotonic()
+
         while not self.has_terminated():
             await self.step()
+            steps += 1
+
+            if (budget is not None and steps >= budget) or (
+                time_budget is not None and time.monotonic() - start >= time_budget
+            ):
+                if self.has_terminated():
+                    break
+                self._preemptions += 1
+                await asyncio.sleep(0)
+                steps = 0
+                start = time.monotonic()
 
     # endregion
 
@@ -1384,40 +1483,65 @@ class Process(StateMachine, persistence.Savable, metaclass=ProcessStateMachineMe
         :raises: ValueError if the output value is not validated against the port
         """
         self.on_output_emitting(output_port, value)
+        namespace, port_name, dynamic = self._validate_output(output_port, value)
+        self._record_output(namespace, port_name, value)
+        self.on_output_emitted(output_port, value, dynamic)
 
-        namespace_separator = self.spec().namespace_separator
+    @ensure_not_closed
+    @protected
+    def out_many(self, outputs: Mapping[str, Any]) -> None:
+        """
+        Record the output values for multiple output ports at once.
 
-        namespace = output_port.split(namespace_separator)
-        port_name = namespace.pop()
+        This is equivalent to calling :meth:`out` for each item of the mapping, except that all values are validated
+        before any of them is recorded and that listeners receive a single ``on_outputs_emitted`` event.
 
-        if namespace:
-            port_namespace = cast(
-                ports.PortNamespace,
-                self.spec().outputs.get_port(namespace_separator.join(namespace), create_dynamically=True),
-            )
-        else:
-            port_namespace = self.spec().outputs
+        :param outputs: mapping of the names of the output ports, which can be namespaced, onto the output values
+        :raises: ValueError if any of the output values is not validated against its port, in which case none of the
+            values are recorded
+        """
+        validated = []
 
-        validation_error = None
-        try:
-            port = port_namespace[port_name]
+        for output_port, value in outputs.items():
+            self.on_output_emitting(output_port, value)
+            validated.append((output_port, value, *self._validate_output(output_port, value)))
+
+        for _, value, namespace, port_name, _ in validated:
+            self._record_output(namespace, port_name, value)
+
+        self.on_outputs_emitted([(output_port, value, dynamic) for output_port, value, _, _, dynamic in validated])
+
+    def _validate_output(self, output_port: str, value: Any) -> Tuple[Tuple[str, ...], str, bool]:
+        """Validate an output value against its port.
+
+        :param output_port: the name of the output port, can be namespaced
+        :param value: the value for the output port
+        :return: tuple of the namespace of the port, the port name and whether the port is dynamic
+        :raises: ValueError if the output value is not validated against the port
+        """
+        spec = self.spec()
+        namespace, port_name, port_namespace, port = spec.resolve_output_port(output_port)
+
+        if port is not None:
             dynamic = False
-            validation_error = port.validate(value)
-        except KeyError:
-            port = port_namespace
+            validation_error = spec.get_validator(port)(value)
+        else:
             dynamic = True
-            validation_error = port.validate_dynamic_ports({port_name: value})
+            validation_error = port_namespace.validate_dynamic_ports({port_name: value})
 
         if validation_error:
             msg = f"Error validating output '{value}' for port '{validation_error.port}': {validation_error.message}"
             raise ValueError(msg)
 
+        return namespace, port_name, dynamic
+
+    def _record_output(self, namespace: Tuple[str, ...], port_name: str, value: Any) -> None:
+        """Record a validated output value in the outputs of the process."""
         output_namespace = self._outputs
         for sub_space in namespace:
             output_namespace = output_namespace.setdefault(sub_space, {})
 
         output_namespace[port_name] = value
-        self.on_output_emitted(output_port, value, dynamic)
 
     @protected
     def encode_input_args(self, inputs: Any) -> Any:
@@ -1,3 +1,18 @@
 # -*- coding: utf-8 -*-
+from typing import Any, Callable, Hashable, Optional
+
 check_protected: bool = False
 check_override: bool = False
+# The event loop implementation used when plumpy creates a new loop, either ``'asyncio'`` or ``'uvloop'``. When ``None``
+# the ``PLUMPY_EVENT_LOOP`` environment variable is used, falling back to ``'asyncio'``.
+event_loop: Optional[str] = None
+# Whether steps that declare their context access with ``workchains.context_access`` are checked to only read and write
+# the keys that they declare, which is useful to test the declarations
+check_context_access: bool = False
+# The maximum number of successful validations of parsed inputs that are cached per process specification, such that
+# launching a process with inputs that were validated before skips the validation. Only the validation of specifications
+# whose validators are all marked with ``ports.pure`` is cached. The cache is disabled when set to zero.
+validation_cache_size: int = 0
+# The function that turns the parsed inputs into the hashable key of the validation cache. Two inputs with keys that are
+# equal are assumed to give the same validation result. When ``None`` the ``utils.fingerprint`` function is used.
+validation_fingerprint: Optional[Callable[[Any], Hashable]] = None
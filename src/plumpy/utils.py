@@ -10,13 +10,17 @@ from typing import (
     Any,
     Awaitable,
     Callable,
+    Dict,
     Hashable,
+    ItemsView,
     Iterator,
+    KeysView,
     List,
     MutableMapping,
     Optional,
     Tuple,
     Type,
+    ValuesView,
 )
 
 from . import lang
@@ -38,9 +42,15 @@ class Frozendict(Mapping):
     An immutable wrapper around dictionaries that implements the complete :py:class:`collections.abc.Mapping`
     interface. It can be used as a drop-in replacement for dictionaries where immutability is desired.
 
+    The class defines ``__slots__`` and delegates the methods of the mapping interface directly to the wrapped
+    dictionary instead of relying on the generic implementations of :py:class:`collections.abc.Mapping`, as many
+    instances of it are created, for example one for each namespace of the inputs of every process.
+
     Adapted from: slezica/python-frozendict
     """
 
+    __slots__ = ('_dict', '_hash')
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self._dict = dict(*args, **kwargs)
         self._hash: Optional[int] = None
@@ -51,8 +61,20 @@ class Frozendict(Mapping):
     def __contains__(self, key: Any) -> bool:
         return key in self._dict
 
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._dict.get(key, default)
+
+    def keys(self) -> KeysView[str]:
+        return self._dict.keys()
+
+    def items(self) -> ItemsView[str, Any]:
+        return self._dict.items()
+
+    def values(self) -> ValuesView[Any]:
+        return self._dict.values()
+
     def copy(self, **add_or_replace: Any) -> 'Frozendict':
-        return self.__class__(self, **add_or_replace)
+        return self.__class__(self._dict, **add_or_replace)
 
     def __iter__(self) -> Iterator[str]:
         return iter(self._dict)
@@ -60,6 +82,13 @@ class Frozendict(Mapping):
     def __len__(self) -> int:
         return len(self._dict)
 
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Frozendict):
+            return self._dict == other._dict
+        if isinstance(other, Mapping):
+            return self._dict == dict(other.items())
+        return NotImplemented
+
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__} {self._dict!r}>'
 
@@ -71,24 +100,30 @@ class Frozendict(Mapping):
             self._hash = hashed
         return self._hash
 
+    def __reduce__(self) -> Tuple[Type['Frozendict'], Tuple[Dict[str, Any]]]:
+        return self.__class__, (self._dict,)
+
+    def __setstate__(self, state: Any) -> None:
+        """Restore the state of instances that were pickled before the class defined ``__slots__``."""
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **state[1]}
+        self._dict = state['_dict']
+        self._hash = None
+
 
 class AttributesFrozendict(Frozendict):
-    def __init__(self, *args: Any, **kwargs: Any):
-        super().__init__(*args, **kwargs)
-        self._initialised: bool = True
+    __slots__ = ()
 
     def __getattr__(self, attr: str) -> Any:
         """
         Read a key as an attribute. Raise AttributeError on missing key.
         Called only for attributes that do not exist.
         """
-        # This attribute is looked for by pickle when deserialising.  At this point
-        # the object is not yet constructed and so accessing any members is
-        # dangerous and often causes infinite recursion so I have to guard like this.
-        if attr == '__setstate__':
-            raise AttributeError()
+        # The wrapped dictionary is not yet set while unpickling, so guard against infinite recursion
+        if attr == '_dict':
+            raise AttributeError(attr)
         try:
-            return self[attr]
+            return self._dict[attr]
         except KeyError:
             errmsg = f"'{self.__class__.__name__}' object has no attribute '{attr}'"
             raise AttributeError(errmsg)
@@ -98,7 +133,7 @@ class AttributesFrozendict(Frozendict):
         So we get tab completion.
         :return: The keys of the dict
         """
-        return list(self.keys())
+        return list(self._dict)
 
 
 class AttributesDict(types.SimpleNamespace):
@@ -180,6 +215,22 @@ def load_module(fullname: str) -> Tuple[types.ModuleType, deque]:
     return mod, remainder
 
 
+def fingerprint(value: Any) -> Hashable:
+    """Return a hashable fingerprint of a (nested) mapping of values.
+
+    Mappings are turned into tuples of their items and every value is paired with its type, such that for example
+    ``True`` and ``1`` do not produce the same fingerprint even though they compare equal. Values are compared by
+    equality, so values that hash by identity are assumed not to be modified in place. The fingerprint is only hashable
+    if all values are hashable.
+
+    :param value: the value to fingerprint
+    :return: the fingerprint
+    """
+    if isinstance(value, Mapping):
+        return type(value), tuple((key, fingerprint(subvalue)) for key, subvalue in value.items())
+    return type(value), value
+
+
 def type_check(obj: Any, expected_type: Type) -> None:
     if not isinstance(obj, expected_type):
         raise TypeError(f"Got object of type '{type(obj)}' when expecting '{expected_type}'")
@@ -4,17 +4,23 @@ from __future__ import annotations
 import abc
 import asyncio
 import collections
+import copy
+import functools
 import inspect
 import logging
 import re
 from typing import (
     Any,
+    Awaitable,
     Callable,
     Dict,
+    FrozenSet,
     Hashable,
+    Iterable,
     List,
     Mapping,
     MutableSequence,
+    NamedTuple,
     Optional,
     Sequence,
     Tuple,
@@ -25,15 +31,36 @@ from typing import (
 
 import kiwipy
 
-from . import lang, mixins, persistence, process_states, processes
-from .utils import PID_TYPE, SAVED_STATE_TYPE
-
-__all__ = ['ToContext', 'WorkChain', 'WorkChainSpec', 'if_', 'return_', 'while_']
+from . import events, executors, futures, lang, mixins, persistence, process_states, processes, settings
+from .greenback_bridge import ensure_portal
+from .utils import PID_TYPE, SAVED_STATE_TYPE, AttributesDict, AttributesFrozendict
+
+__all__ = [
+    'FanIn',
+    'ToContext',
+    'WorkChain',
+    'WorkChainSpec',
+    'as_completed_',
+    'context_access',
+    'if_',
+    'inline_',
+    'map_',
+    'parallel_',
+    'return_',
+    'while_',
+]
 
 ToContext = dict
 
 PREDICATE_TYPE = Callable[['WorkChain'], bool]
 WC_COMMAND_TYPE = Callable[['WorkChain'], Any]
+MAP_FUNCTION_TYPE = Callable[['WorkChain', Any], Union[Awaitable, processes.Process]]
+LAUNCH_FUNCTION_TYPE = Callable[
+    ['WorkChain'],
+    Union[Sequence[Union[Awaitable, processes.Process]], Mapping[Hashable, Union[Awaitable, processes.Process]]],
+]
+RESULTS_FUNCTION_TYPE = Callable[['WorkChain', Dict[Hashable, Any]], Any]
+BRANCH_TYPE = Union['_Instruction', WC_COMMAND_TYPE, Sequence[Union['_Instruction', WC_COMMAND_TYPE]]]
 EXIT_CODE_TYPE = int
 
 
@@ -41,6 +68,7 @@ class WorkChainSpec(processes.ProcessSpec):
     def __init__(self) -> None:
         super().__init__()
         self._outline: Optional[Union['_Instruction', '_FunctionCall']] = None
+        self._program: Optional['_Program'] = None
 
     def get_description(self) -> Dict[str, str]:
         description = super().get_description()
@@ -63,28 +91,70 @@ class WorkChainSpec(processes.ProcessSpec):
             # There are multiple instructions
             self._outline = _Block(commands)
 
+        self._program = None
+
     def get_outline(self) -> Union['_Instruction', '_FunctionCall']:
         assert self._outline is not None, 'outline not yet loaded'
         return self._outline
 
+    def get_program(self) -> '_Program':
+        """Return the outline compiled into a flat program, which is compiled once and then cached."""
+        if self._program is None:
+            self._program = _Program(self.get_outline())
+        return self._program
+
 
-@persistence.auto_persist('_awaiting')
 class Waiting(process_states.Waiting):
     """Overwrite the waiting state"""
 
+    __slots__ = ('_awaiting',)
+
+    AWAITING = '_awaiting'
+
+    # The awaitables are passed as ``data`` such that they reach ``on_wait``, but they are saved as ``_awaiting`` as
+    # ``data`` would be deep copied, which is not supported by every awaitable
+    _auto_persist = {'msg'}
+
     def __init__(
         self,
         process: 'WorkChain',
         done_callback: Optional[Callable[..., Any]],
         msg: Optional[str] = None,
-        awaiting: Optional[Dict[Union[asyncio.Future, processes.Process], str]] = None,
+        awaiting: Optional[Dict[Union[asyncio.Future, processes.Process], Optional[str]]] = None,
     ) -> None:
         super().__init__(process, done_callback, msg, awaiting)
-        self._awaiting: Dict[asyncio.Future, str] = {}
+        self._awaiting: Dict[asyncio.Future, Optional[str]] = {}
         for awaitable, key in (awaiting or {}).items():
             resolved_awaitable = awaitable.future() if isinstance(awaitable, processes.Process) else awaitable
             self._awaiting[resolved_awaitable] = key
 
+    def save_instance_state(self, out_state: SAVED_STATE_TYPE, save_context: persistence.LoadSaveContext) -> None:
+        super().save_instance_state(out_state, save_context)
+
+        # Savable awaitables, such as a ``FanIn``, save themselves, any other awaitable is copied
+        awaiting: List[Tuple[Any, Optional[str], bool]] = []
+        for awaitable, key in self._awaiting.items():
+            if isinstance(awaitable, persistence.Savable):
+                awaiting.append((awaitable.save(), key, True))
+            else:
+                awaiting.append((copy.deepcopy(awaitable), key, False))
+        out_state[self.AWAITING] = awaiting
+
+    def load_instance_state(self, saved_state: SAVED_STATE_TYPE, load_context: persistence.LoadSaveContext) -> None:
+        super().load_instance_state(saved_state, load_context)
+        awaiting = saved_state[self.AWAITING]
+
+        # States saved before savable awaitables were supported contain the awaitables as a dictionary
+        if isinstance(awaiting, dict):
+            self._awaiting = awaiting
+        else:
+            self._awaiting = {
+                cast(asyncio.Future, persistence.Savable.load(awaitable, load_context)) if savable else awaitable: key
+                for awaitable, key, savable in awaiting
+            }
+
+        self.data = self._awaiting
+
     def enter(self) -> None:
         super().enter()
         for awaitable in self._awaiting:
@@ -98,7 +168,10 @@ class Waiting(process_states.Waiting):
     def _awaitable_done(self, awaitable: asyncio.Future) -> None:
         key = self._awaiting.pop(awaitable)
         try:
-            self.process.ctx[key] = awaitable.result()  # type: ignore
+            result = awaitable.result()
+            # Awaitables without a key are only waited for, see ``WorkChain._wait_for``
+            if key is not None:
+                self.process.ctx[key] = result  # type: ignore
         except Exception as exception:
             self._waiting_future.set_exception(exception)
         else:
@@ -132,7 +205,7 @@ class WorkChain(mixins.ContextMixin, processes.Process):
     ) -> None:
         super().__init__(inputs=inputs, pid=pid, logger=logger, loop=loop, communicator=communicator)
         self._stepper: Optional[Stepper] = None
-        self._awaitables: Dict[Union[asyncio.Future, processes.Process], str] = {}
+        self._awaitables: Dict[Union[asyncio.Future, processes.Process], Optional[str]] = {}
 
     @classmethod
     def spec(cls) -> WorkChainSpec:
@@ -140,7 +213,7 @@ class WorkChain(mixins.ContextMixin, processes.Process):
 
     def on_create(self) -> None:
         super().on_create()
-        self._stepper = self.spec().get_outline().create_stepper(self)
+        self._stepper = self.spec().get_program().create_stepper(self)
 
     def save_instance_state(
         self, out_state: SAVED_STATE_TYPE, save_context: Optional[persistence.LoadSaveContext]
@@ -158,22 +231,36 @@ class WorkChain(mixins.ContextMixin, processes.Process):
         self._stepper = None
         stepper_state = saved_state.get(self._STEPPER_STATE, None)
         if stepper_state is not None:
-            self._stepper = self.spec().get_outline().recreate_stepper(stepper_state, self)
+            if _ProgramStepper.PC in stepper_state:
+                self._stepper = self.spec().get_program().recreate_stepper(stepper_state, self)
+            else:
+                # The stepper was saved before outlines were compiled, as a tree of nested steppers
+                self._stepper = self.spec().get_outline().recreate_stepper(stepper_state, self)
 
     def to_context(self, **kwargs: Union[asyncio.Future, processes.Process]) -> None:
         """
         This is a convenience method that provides syntactic sugar, for
         a user to add multiple intersteps that will assign a certain value
         to the corresponding key in the context of the workchain
+
+        To wait for many awaitables at once and collect their results under a single key, pass a :class:`FanIn`.
         """
         for key, awaitable in kwargs.items():
             resolved_awaitable = awaitable.future() if isinstance(awaitable, processes.Process) else awaitable
 
             self._awaitables[resolved_awaitable] = key
 
+    def _wait_for(self, awaitable: asyncio.Future) -> None:
+        """Wait for the awaitable before the next step, without assigning its result to the context."""
+        self._awaitables[awaitable] = None
+
     async def run(self) -> Any:
+        # Steps decorated with ``executors.blocking`` are called synchronously and need a portal to hop to the executor
+        if self.spec().get_program().has_blocking_steps():
+            await ensure_portal()
         return self._do_step()
 
+    @executors.on_loop
     def _do_step(self) -> Any:
         assert self._stepper is not None
         self._awaitables = {}
@@ -195,6 +282,120 @@ class WorkChain(mixins.ContextMixin, processes.Process):
         return return_value
 
 
+AWAITABLE_TYPE = Union[asyncio.Future, processes.Process]
+
+
+@persistence.auto_persist('_keys', '_results', '_size')
+class FanIn(futures.Future, persistence.Savable):
+    """A future that resolves once all its children are done, with their results collected in a list or dict.
+
+    This is a counter based barrier meant for large fan-outs, that can be assigned to the context with a single key::
+
+        return ToContext(results=FanIn([self.launch(Child) for _ in range(10000)]))
+
+    Each child costs a single done callback and counter update, and the context is assigned once, in bulk, when the
+    last child is done. If a child excepts, the fan-in excepts with the same exception.
+
+    The saved state is compact: only the size, the keys and the results that were already collected. After loading,
+    the children that were still pending, see :meth:`pending`, can be reconnected with :meth:`attach`.
+
+    :param children: a sequence of awaitables, whose results are collected in a list in the same order, or a mapping
+        of awaitables, whose results are collected in a dict with the same keys
+    :param loop: the event loop of the future
+    """
+
+    __slots__ = ('_called', '_index', '_keys', '_pending', '_results', '_size')
+
+    def __init__(
+        self,
+        children: Union[Sequence[AWAITABLE_TYPE], Mapping[Hashable, AWAITABLE_TYPE]],
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        super().__init__(loop=loop or events.get_or_create_event_loop())
+
+        if isinstance(children, Mapping):
+            self._keys: Optional[List[Hashable]] = list(children.keys())
+            awaitables = list(children.values())
+        else:
+            self._keys = None
+            awaitables = list(children)
+
+        self._size = len(awaitables)
+        # Results of the children that are done, by index
+        self._results: Dict[int, Any] = {}
+
+        self._init_lookup()
+
+        for index, awaitable in enumerate(awaitables):
+            self._attach(index, awaitable)
+
+        self._resolve_if_complete()
+
+    def load_instance_state(self, saved_state: SAVED_STATE_TYPE, load_context: persistence.LoadSaveContext) -> None:
+        loop = load_context.loop if 'loop' in load_context else events.get_or_create_event_loop()
+        futures.Future.__init__(self, loop=loop)
+        super().load_instance_state(saved_state, load_context)
+        self._init_lookup()
+        self._resolve_if_complete()
+
+    def _init_lookup(self) -> None:
+        """Build the index of each key, for a mapping, and the set of indices of the children that are not yet done."""
+        self._index: Optional[Dict[Hashable, int]] = None
+        if self._keys is not None:
+            self._index = {key: index for index, key in enumerate(self._keys)}
+        self._pending = set(range(self._size)).difference(self._results)
+
+    def pending(self) -> List[Hashable]:
+        """Return the indices, or keys for a mapping, of the children that are not yet done."""
+        indices = sorted(self._pending)
+        if self._keys is None:
+            return cast(List[Hashable], indices)
+        return [self._keys[index] for index in indices]
+
+    def attach(self, key: Hashable, awaitable: AWAITABLE_TYPE) -> None:
+        """Attach an awaitable for a pending child, for example after the fan-in was loaded from a saved state.
+
+        :param key: the index, or key for a mapping, of the child
+        :param awaitable: the awaitable whose result to collect for the child
+        :raises ValueError: if the child is unknown or no longer pending
+        """
+        index = key if self._index is None else self._index.get(key)
+        if index not in self._pending:
+            raise ValueError(f'`{key}` is not a pending child of this fan-in')
+        self._attach(cast(int, index), awaitable)
+
+    def _attach(self, index: int, awaitable: AWAITABLE_TYPE) -> None:
+        future = awaitable.future() if isinstance(awaitable, processes.Process) else awaitable
+        future.add_done_callback(functools.partial(self._child_done, index))
+
+    def _child_done(self, index: int, future: asyncio.Future) -> None:
+        if self.done():
+            return
+
+        if future.cancelled():
+            self.cancel()
+            return
+
+        exception = future.exception()
+        if exception is not None:
+            self.set_exception(exception)
+            return
+
+        self._results[index] = future.result()
+        self._pending.discard(index)
+        self._resolve_if_complete()
+
+    def _resolve_if_complete(self) -> None:
+        if self.done() or len(self._results) < self._size:
+            return
+
+        results = [self._results[index] for index in range(self._size)]
+        if self._keys is None:
+            self.set_result(results)
+        else:
+            self.set_result(dict(zip(self._keys, results)))
+
+
 class Stepper(persistence.Savable, metaclass=abc.ABCMeta):
     def __init__(self, workchain: 'WorkChain') -> None:
         self._workchain = workchain
@@ -594,6 +795,540 @@ class _While(_Conditional, _Instruction, collections.abc.Sequence):
         return {f'while({self.predicate.__name__})': self.body.get_description()}
 
 
+@persistence.auto_persist('_cursor', '_in_flight', '_results')
+class _MapStepper(Stepper):
+    def __init__(self, map_instruction: '_Map', workchain: 'WorkChain') -> None:
+        super().__init__(workchain)
+        self._map_instruction = map_instruction
+        # Index of the next item to launch
+        self._cursor = 0
+        # Pids of the processes that are in flight by item index, ``None`` for other awaitables
+        self._in_flight: Dict[int, Optional[PID_TYPE]] = {}
+        # Results of the completed items by item index
+        self._results: Dict[int, Any] = {}
+        self._futures: Dict[int, asyncio.Future] = {}
+        self._wakeup: Optional[asyncio.Future] = None
+
+    def load_instance_state(self, saved_state: SAVED_STATE_TYPE, load_context: persistence.LoadSaveContext) -> None:
+        super().load_instance_state(saved_state, load_context)
+        self._map_instruction = load_context.map_instruction
+        self._futures = {}
+        self._wakeup = None
+
+    def step(self) -> Tuple[bool, Any]:
+        items = self._map_instruction.get_items(self._workchain)
+
+        for index, future in list(self._futures.items()):
+            if future.done():
+                del self._futures[index]
+                del self._in_flight[index]
+                # This raises if the child excepted, which will except the workchain
+                self._results[index] = future.result()
+
+        # Awaitables that were in flight when the workchain was saved did not survive it, so they are launched again.
+        # Child processes may still be running or have finished though, so launching them again would duplicate them.
+        for index, pid in list(self._in_flight.items()):
+            if index in self._futures:
+                continue
+            if pid is not None:
+                raise RuntimeError(
+                    f'{self._map_instruction} cannot reattach the child process `{pid}` of item {index}, which was '
+                    'running when the workchain was saved'
+                )
+            self._launch(index, items[index])
+
+        max_concurrent = self._map_instruction.max_concurrent
+        while self._cursor < len(items) and (max_concurrent is None or len(self._in_flight) < max_concurrent):
+            self._launch(self._cursor, items[self._cursor])
+            self._cursor += 1
+
+        if not self._in_flight:
+            results = [self._results[index] for index in range(len(items))]
+            self._workchain.ctx[self._map_instruction.target] = results  # type: ignore[index]
+            return True, None
+
+        # Wait until any of the children in flight is done, at which point more items can be launched
+        self._wakeup = self._workchain.loop.create_future()
+        self._workchain._wait_for(self._wakeup)
+        return False, None
+
+    def _launch(self, index: int, item: Any) -> None:
+        awaitable = self._map_instruction.fn(self._workchain, item)
+
+        future: asyncio.Future
+        if isinstance(awaitable, processes.Process):
+            self._in_flight[index] = awaitable.pid
+            future = awaitable.future()
+        else:
+            self._in_flight[index] = None
+            future = asyncio.ensure_future(awaitable, loop=self._workchain.loop)
+
+        future.add_done_callback(self._child_done)
+        self._futures[index] = future
+
+    def _child_done(self, _future: asyncio.Future) -> None:
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    def __str__(self) -> str:
+        return f'{self._map_instruction}[{len(self._results)} done, {len(self._in_flight)} running]'
+
+
+class _Map(_Instruction):
+    def __init__(self, items: str, fn: MAP_FUNCTION_TYPE, target: str, max_concurrent: Optional[int] = None) -> None:
+        super().__init__()
+        try:
+            args = inspect.getfullargspec(fn)[0]
+        except TypeError:
+            raise TypeError(f'fn is not a function, got {type(fn)}')
+        if len(args) != 2:
+            raise TypeError('Map function must take two arguments: self and the item')
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError('max_concurrent should be at least one')
+
+        self.items = items
+        self.fn = fn
+        self.target = target
+        self.max_concurrent = max_concurrent
+
+    def get_items(self, workchain: 'WorkChain') -> Sequence[Any]:
+        """Return the items to map over, which are indexed by position so they have to be a sequence.
+
+        :raises TypeError: if the items in the context are not a sequence
+        """
+        items = workchain.ctx[self.items]  # type: ignore[index]
+        if not isinstance(items, collections.abc.Sequence):
+            raise TypeError(f'{self} can only map over a sequence, but `ctx.{self.items}` is a {type(items)}')
+        return items
+
+    def create_stepper(self, workchain: 'WorkChain') -> _MapStepper:
+        return _MapStepper(self, workchain)
+
+    def recreate_stepper(self, saved_state: SAVED_STATE_TYPE, workchain: 'WorkChain') -> _MapStepper:
+        load_context = persistence.LoadSaveContext(workchain=workchain, map_instruction=self)
+        return cast(_MapStepper, _MapStepper.recreate_from(saved_state, load_context))
+
+    def __str__(self) -> str:
+        return f'{map_.__name__}({self.fn.__name__})'
+
+    def get_description(self) -> str:
+        """
+        Get a text description of these instructions.
+        :return: The description
+
+        """
+        return f'{map_.__name__}({self.fn.__name__}) over ctx.{self.items} into ctx.{self.target}'
+
+
+class _ParallelStepper(Stepper):
+    BRANCHES = 'branches'
+    WAITING = 'waiting'
+
+    def __init__(self, parallel_instruction: '_Parallel', workchain: 'WorkChain') -> None:
+        super().__init__(workchain)
+        self._parallel_instruction = parallel_instruction
+        # The stepper of each branch, ``None`` once the branch has finished
+        self._branches: List[Optional[_ProgramStepper]] = [
+            program.create_stepper(workchain) for program in parallel_instruction.programs
+        ]
+        self._init_waiting()
+
+    def _init_waiting(self) -> None:
+        # The awaitables that each branch is waiting for, with the context key of their result
+        self._waiting: List[Dict[asyncio.Future, Optional[str]]] = [{} for _ in self._branches]
+        self._exception: Optional[BaseException] = None
+        self._wakeup: Optional[asyncio.Future] = None
+
+    def save_instance_state(self, out_state: SAVED_STATE_TYPE, save_context: persistence.LoadSaveContext) -> None:
+        super().save_instance_state(out_state, save_context)
+        out_state[self.BRANCHES] = [branch.save() if branch is not None else None for branch in self._branches]
+        out_state[self.WAITING] = [list(waiting.values()) for waiting in self._waiting]
+
+    def load_instance_state(self, saved_state: SAVED_STATE_TYPE, load_context: persistence.LoadSaveContext) -> None:
+        super().load_instance_state(saved_state, load_context)
+        self._parallel_instruction = load_context.parallel_instruction
+        self._branches = [
+            program.recreate_stepper(branch_state, self._workchain) if branch_state is not None else None
+            for program, branch_state in zip(self._parallel_instruction.programs, saved_state[self.BRANCHES])
+        ]
+        self._init_waiting()
+
+        # Awaitables without a key are those that a nested instruction, such as ``map_``, waits for to be stepped again.
+        # They do not have to be restored: the branch is stepped again after loading, so the nested instruction checks
+        # its children itself and waits for them again. The results of awaitables with a key have to be in the context.
+        for index, keys in enumerate(saved_state[self.WAITING]):
+            missing = [key for key in keys if key is not None and not hasattr(self._workchain.ctx, key)]
+            if missing:
+                raise RuntimeError(
+                    f'branch {index} of `{self._parallel_instruction}` was waiting for {missing} when it was saved, '
+                    'but awaitables cannot be restored'
+                )
+
+    def step(self) -> Tuple[bool, Any]:
+        if self._exception is not None:
+            raise self._exception
+
+        for index, branch in enumerate(self._branches):
+            if branch is None or self._waiting[index]:
+                continue
+
+            finished, result = self._step_branch(index, branch)
+
+            if finished:
+                self._branches[index] = None
+            if result is not None:
+                # A step returned an exit code, which ends the workchain, just like it would outside a parallel block
+                return False, result
+
+        # A branch whose last step returned awaitables is only done once they are
+        if not any(self._waiting) and all(branch is None for branch in self._branches):
+            return True, None
+
+        if all(branch is None or waiting for branch, waiting in zip(self._branches, self._waiting)):
+            # No branch can continue, so wait until any of them can
+            self._wakeup = self._workchain.loop.create_future()
+            self._workchain._wait_for(self._wakeup)
+
+        return False, None
+
+    def _step_branch(self, index: int, branch: _ProgramStepper) -> Tuple[bool, Any]:
+        """Step the branch and capture the awaitables that it wants to wait for, as its own."""
+        workchain_awaitables = self._workchain._awaitables
+        self._workchain._awaitables = {}
+        try:
+            finished, result = branch.step()
+            if isinstance(result, ToContext):
+                self._workchain.to_context(**result)
+                result = None
+            waiting = self._workchain._awaitables
+        finally:
+            self._workchain._awaitables = workchain_awaitables
+
+        for awaitable, key in waiting.items():
+            future = cast(asyncio.Future, awaitable)
+            self._waiting[index][future] = key
+            future.add_done_callback(functools.partial(self._awaitable_done, index))
+
+        return finished, result
+
+    def _awaitable_done(self, index: int, awaitable: asyncio.Future) -> None:
+        key = self._waiting[index].pop(awaitable, None)
+        try:
+            result = awaitable.result()
+        except BaseException as exception:
+            if self._exception is None:
+                self._exception = exception
+        else:
+            if key is not None:
+                self._workchain.ctx[key] = result  # type: ignore[index]
+            if self._waiting[index]:
+                return
+
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    def __str__(self) -> str:
+        branches = ', '.join(str(branch) if branch is not None else 'done' for branch in self._branches)
+        return f'{parallel_.__name__}({branches})'
+
+
+class _Parallel(_Instruction):
+    def __init__(self, *branches: BRANCH_TYPE) -> None:
+        super().__init__()
+        if not branches:
+            raise ValueError('at least one branch should be specified')
+
+        self._branches: List[Union[_Instruction, _FunctionCall]] = [
+            _Block(branch) if isinstance(branch, (list, tuple)) else _ensure_instruction(branch) for branch in branches
+        ]
+        self.programs = [_Program(branch) for branch in self._branches]
+
+    def create_stepper(self, workchain: 'WorkChain') -> _ParallelStepper:
+        return _ParallelStepper(self, workchain)
+
+    def recreate_stepper(self, saved_state: SAVED_STATE_TYPE, workchain: 'WorkChain') -> _ParallelStepper:
+        load_context = persistence.LoadSaveContext(workchain=workchain, parallel_instruction=self)
+        return cast(_ParallelStepper, _ParallelStepper.recreate_from(saved_state, load_context))
+
+    def __str__(self) -> str:
+        return f'{parallel_.__name__}({len(self._branches)} branches)'
+
+    def get_description(self) -> Dict[str, Any]:
+        """
+        Get a text description of these instructions.
+        :return: The description
+
+        """
+        return {f'{parallel_.__name__}()': [branch.get_description() for branch in self._branches]}
+
+
+@persistence.auto_persist('_launched', '_pending', '_num_delivered')
+class _AsCompletedStepper(Stepper):
+    def __init__(self, as_completed_instruction: '_AsCompleted', workchain: 'WorkChain') -> None:
+        super().__init__(workchain)
+        self._as_completed_instruction = as_completed_instruction
+        self._launched = False
+        # Pids of the children that have not been delivered yet by key, ``None`` for other awaitables
+        self._pending: Dict[Hashable, Optional[PID_TYPE]] = {}
+        self._num_delivered = 0
+        self._init_futures()
+
+    def _init_futures(self) -> None:
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        # Keys of the children that are done but not delivered yet, in the order in which they completed
+        self._completed: List[Hashable] = []
+        self._wakeup: Optional[asyncio.Future] = None
+
+    def load_instance_state(self, saved_state: SAVED_STATE_TYPE, load_context: persistence.LoadSaveContext) -> None:
+        super().load_instance_state(saved_state, load_context)
+        self._as_completed_instruction = load_context.as_completed_instruction
+        self._init_futures()
+
+        if self._pending:
+            raise RuntimeError(
+                f'`{self._as_completed_instruction}` was waiting for {list(self._pending)} when it was saved, '
+                'but awaitables cannot be restored'
+            )
+
+    def step(self) -> Tuple[bool, Any]:
+        if not self._launched:
+            self._launch()
+
+        result = None
+        if self._completed:
+            batch = {}
+            for key in self._completed:
+                # This raises if the child excepted, which will except the workchain
+                batch[key] = self._futures.pop(key).result()
+                del self._pending[key]
+            self._completed = []
+            self._num_delivered += len(batch)
+            result = self._as_completed_instruction.handle(self._workchain, batch)
+
+        if not self._pending:
+            return True, result
+
+        if result is None:
+            # Wait until the next batch of children is done
+            self._wakeup = self._workchain.loop.create_future()
+            self._workchain._wait_for(self._wakeup)
+            self._notify()
+
+        return False, result
+
+    def _launch(self) -> None:
+        children = self._as_completed_instruction.launch(self._workchain)
+        items = children.items() if isinstance(children, Mapping) else enumerate(children)
+
+        future: asyncio.Future
+        for key, child in items:
+            if isinstance(child, processes.Process):
+                self._pending[key] = child.pid
+                future = child.future()
+            else:
+                self._pending[key] = None
+                future = asyncio.ensure_future(child, loop=self._workchain.loop)
+            self._futures[key] = future
+
+        self._launched = True
+
+        # Callbacks are only added once all children are registered, because futures may already be done
+        for key, future in self._futures.items():
+            future.add_done_callback(functools.partial(self._child_done, key))
+
+    def _child_done(self, key: Hashable, future: asyncio.Future) -> None:
+        self._completed.append(key)
+        if not future.cancelled() and future.exception() is not None:
+            # Deliver the exception straight away, rather than waiting for a full batch
+            self._wake()
+        else:
+            self._notify()
+
+    def _notify(self) -> None:
+        if len(self._completed) >= min(self._as_completed_instruction.batch_size, len(self._futures)):
+            self._wake()
+
+    def _wake(self) -> None:
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    def __str__(self) -> str:
+        return f'{self._as_completed_instruction}[{self._num_delivered} done, {len(self._pending)} running]'
+
+
+class _AsCompleted(_Instruction):
+    def __init__(self, launch: LAUNCH_FUNCTION_TYPE, handle: RESULTS_FUNCTION_TYPE, batch_size: int = 1) -> None:
+        super().__init__()
+        for fn, num_args, message in (
+            (launch, 1, 'Launch function must take one argument: self'),
+            (handle, 2, 'Handle function must take two arguments: self and the results'),
+        ):
+            try:
+                args = inspect.getfullargspec(fn)[0]
+            except TypeError:
+                raise TypeError(f'fn is not a function, got {type(fn)}')
+            if len(args) != num_args:
+                raise TypeError(message)
+        if batch_size < 1:
+            raise ValueError('batch_size should be at least one')
+
+        self.launch = launch
+        self.handle = handle
+        self.batch_size = batch_size
+
+    def create_stepper(self, workchain: 'WorkChain') -> _AsCompletedStepper:
+        return _AsCompletedStepper(self, workchain)
+
+    def recreate_stepper(self, saved_state: SAVED_STATE_TYPE, workchain: 'WorkChain') -> _AsCompletedStepper:
+        load_context = persistence.LoadSaveContext(workchain=workchain, as_completed_instruction=self)
+        return cast(_AsCompletedStepper, _AsCompletedStepper.recreate_from(saved_state, load_context))
+
+    def __str__(self) -> str:
+        return f'{as_completed_.__name__}({self.launch.__name__}, {self.handle.__name__})'
+
+    def get_description(self) -> str:
+        """
+        Get a text description of these instructions.
+        :return: The description
+
+        """
+        return f'{self} in batches of {self.batch_size}'
+
+
+class _InlinedWorkChain:
+    """View of a workchain through which the steps of an inlined workchain are called.
+
+    Attributes that are defined by the inlined workchain class, such as its steps, are bound to the view, while all
+    others are those of the workchain it is inlined in. The context, inputs and outputs are those of its namespace.
+    """
+
+    __slots__ = ('_namespace', '_workchain', '_workchain_class')
+
+    def __init__(self, workchain: 'WorkChain', workchain_class: Type['WorkChain'], namespace: Optional[str]) -> None:
+        object.__setattr__(self, '_workchain', workchain)
+        object.__setattr__(self, '_workchain_class', workchain_class)
+        object.__setattr__(self, '_namespace', namespace)
+
+    @property
+    def ctx(self) -> AttributesDict:
+        ctx = self._workchain.ctx
+        if self._namespace is None:
+            return ctx
+        return ctx.setdefault(self._namespace, AttributesDict())
+
+    @property
+    def inputs(self) -> AttributesFrozendict:
+        inputs: Mapping[str, Any] = self._workchain.inputs or {}
+        if self._namespace is not None:
+            for name in self._namespace.split(self._workchain.spec().namespace_separator):
+                inputs = inputs.get(name, {})
+        return AttributesFrozendict(inputs)
+
+    def spec(self) -> WorkChainSpec:
+        return self._workchain_class.spec()
+
+    def out(self, output_port: str, value: Any) -> None:
+        if self._namespace is not None:
+            output_port = f'{self._namespace}{self._workchain.spec().namespace_separator}{output_port}'
+        self._workchain.out(output_port, value)
+
+    def to_context(self, **kwargs: Union[asyncio.Future, processes.Process]) -> None:
+        for key, awaitable in kwargs.items():
+            future = awaitable.future() if isinstance(awaitable, processes.Process) else awaitable
+            # The callback is added before the workchain waits for the future, so the result is assigned first
+            future.add_done_callback(functools.partial(self._assign, key))
+            self._workchain._wait_for(future)
+
+    def _assign(self, key: str, future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            self.ctx[key] = future.result()
+
+    def __getattr__(self, name: str) -> Any:
+        for cls in self._workchain_class.__mro__:
+            if cls is WorkChain:
+                break
+            if name in cls.__dict__:
+                value = cls.__dict__[name]
+                if isinstance(value, classmethod):
+                    return value.__get__(None, self._workchain_class)
+                if hasattr(value, '__get__'):
+                    return value.__get__(self, type(self))
+                return value
+
+        return getattr(self._workchain, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._workchain, name, value)
+
+
+class _InlineStepper(Stepper):
+    def __init__(self, inline_instruction: '_Inline', workchain: 'WorkChain') -> None:
+        super().__init__(workchain)
+        self._inline_instruction = inline_instruction
+        self._view = inline_instruction.create_view(workchain)
+        self._stepper = inline_instruction.program.create_stepper(self._view)  # type: ignore[arg-type]
+
+    def save_instance_state(self, out_state: SAVED_STATE_TYPE, save_context: persistence.LoadSaveContext) -> None:
+        super().save_instance_state(out_state, save_context)
+        out_state[STEPPER_STATE] = self._stepper.save()
+
+    def load_instance_state(self, saved_state: SAVED_STATE_TYPE, load_context: persistence.LoadSaveContext) -> None:
+        super().load_instance_state(saved_state, load_context)
+        self._inline_instruction = load_context.inline_instruction
+        self._view = self._inline_instruction.create_view(self._workchain)
+        self._stepper = self._inline_instruction.program.recreate_stepper(
+            saved_state[STEPPER_STATE],
+            self._view,  # type: ignore[arg-type]
+        )
+
+    def step(self) -> Tuple[bool, Any]:
+        finished, result = self._stepper.step()
+        if isinstance(result, ToContext):
+            # Results are assigned to the context of the inlined workchain rather than that of the workchain
+            self._view.to_context(**result)
+            result = None
+        return finished, result
+
+    def __str__(self) -> str:
+        return f'{self._inline_instruction}:{self._stepper}'
+
+
+class _Inline(_Instruction):
+    def __init__(self, workchain_class: Type['WorkChain'], namespace: Optional[str] = None) -> None:
+        super().__init__()
+        if not (isinstance(workchain_class, type) and issubclass(workchain_class, WorkChain)):
+            raise TypeError(f'workchain_class should be a WorkChain subclass, got {workchain_class}')
+
+        self.workchain_class = workchain_class
+        self.namespace = namespace
+
+    @property
+    def program(self) -> '_Program':
+        return self.workchain_class.spec().get_program()
+
+    def create_view(self, workchain: 'WorkChain') -> _InlinedWorkChain:
+        return _InlinedWorkChain(workchain, self.workchain_class, self.namespace)
+
+    def create_stepper(self, workchain: 'WorkChain') -> _InlineStepper:
+        return _InlineStepper(self, workchain)
+
+    def recreate_stepper(self, saved_state: SAVED_STATE_TYPE, workchain: 'WorkChain') -> _InlineStepper:
+        load_context = persistence.LoadSaveContext(workchain=workchain, inline_instruction=self)
+        return cast(_InlineStepper, _InlineStepper.recreate_from(saved_state, load_context))
+
+    def __str__(self) -> str:
+        return f'{inline_.__name__}({self.workchain_class.__name__})'
+
+    def get_description(self) -> Dict[str, Any]:
+        """
+        Get a text description of these instructions.
+        :return: The description
+
+        """
+        outline = self.workchain_class.spec().get_outline()
+        return {str(self): outline.get_description()}
+
+
 class _PropagateReturn(BaseException):
     def __init__(self, exit_code: Optional[EXIT_CODE_TYPE]) -> None:
         super().__init__()
@@ -641,6 +1376,320 @@ class _Return(_Instruction):
         return 'Return from the outline immediately'
 
 
+class _Operation(NamedTuple):
+    """An operation of a compiled outline program.
+
+    The ``prefix`` and ``suffix`` surround the description of the operation, ``text``, to describe the position in the
+    outline in the same way as the nested steppers do.
+    """
+
+    code: int
+    argument: Any
+    target: int
+    prefix: str
+    text: str
+    suffix: str
+
+
+class ContextAccess(NamedTuple):
+    """The keys of the context that a step reads and writes, see :func:`context_access`."""
+
+    reads: FrozenSet[str]
+    writes: FrozenSet[str]
+
+
+class _CheckedContext:
+    """Context through which a step can only access the keys that it declares, see :func:`context_access`."""
+
+    __slots__ = ('_access', '_context', '_step')
+
+    def __init__(self, context: AttributesDict, access: ContextAccess, step: str) -> None:
+        object.__setattr__(self, '_context', context)
+        object.__setattr__(self, '_access', access)
+        object.__setattr__(self, '_step', step)
+
+    @staticmethod
+    def check(keys: FrozenSet[str], key: str, step: str, operation: str) -> None:
+        if key not in keys:
+            raise RuntimeError(f'step `{step}` tried to {operation} the context key `{key}` that it does not declare')
+
+    def _check_read(self, key: str) -> None:
+        self.check(self._access.reads | self._access.writes, key, self._step, 'read')
+
+    def __getattr__(self, key: str) -> Any:
+        self._check_read(key)
+        return getattr(self._context, key)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        self.check(self._access.writes, key, self._step, 'write')
+        setattr(self._context, key, value)
+
+    def __delattr__(self, key: str) -> None:
+        self.check(self._access.writes, key, self._step, 'write')
+        delattr(self._context, key)
+
+    def __getitem__(self, key: str) -> Any:
+        self._check_read(key)
+        return self._context[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.__setattr__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.__delattr__(key)
+
+    def get(self, key: str, *args: Any) -> Any:
+        self._check_read(key)
+        return self._context.get(key, *args)
+
+    def setdefault(self, key: str, value: Any) -> Any:
+        self.check(self._access.writes, key, self._step, 'write')
+        return self._context.setdefault(key, value)
+
+
+def _group_independent_steps(
+    instructions: Sequence[Union[_Instruction, _FunctionCall]],
+) -> List[List[Union[_Instruction, _FunctionCall]]]:
+    """Split a block into groups of consecutive steps that declare their context access and are independent."""
+    groups: List[List[Union[_Instruction, _FunctionCall]]] = []
+    group: List[Union[_Instruction, _FunctionCall]] = []
+    reads: FrozenSet[str] = frozenset()
+    writes: FrozenSet[str] = frozenset()
+
+    for instruction in instructions:
+        access: Optional[ContextAccess] = None
+        if type(instruction) is _FunctionCall:
+            access = getattr(instruction._fn, '_context_access', None)
+
+        if access is not None and group and not access.writes & (reads | writes) and not access.reads & writes:
+            group.append(instruction)
+            reads |= access.reads
+            writes |= access.writes
+            continue
+
+        if group:
+            groups.append(group)
+
+        if access is None:
+            groups.append([instruction])
+            group, reads, writes = [], frozenset(), frozenset()
+        else:
+            group, reads, writes = [instruction], access.reads, access.writes
+
+    if group:
+        groups.append(group)
+
+    return groups
+
+
+class _Program:
+    """An outline compiled into a flat list of operations, where conditionals and loops are turned into jumps."""
+
+    CALL = 0
+    # Jump to the target if the conditional is false, ``EXIT_BRANCH`` also ends the step in that case, just like the
+    # stepper of a loop, or a conditional of which no branch is taken, finishes with a step of its own
+    BRANCH = 1
+    EXIT_BRANCH = 2
+    JUMP = 3
+    RETURN = 4
+    STEPPER = 5
+
+    def __init__(self, outline: Union[_Instruction, _FunctionCall]) -> None:
+        self._operations: List[_Operation] = []
+        self._compile(outline, '', '')
+        self.operations: Tuple[_Operation, ...] = tuple(self._operations)
+        self._blocking: Optional[bool] = None
+        del self._operations
+
+        if type(outline) is _Block:
+            self.end_text = f'{len(outline)}:None'
+        else:
+            self.end_text = str(outline)
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def has_blocking_steps(self) -> bool:
+        """Return whether any function of the program is decorated with :func:`plumpy.executors.blocking`.
+
+        Instructions that are not builtin may call any function, so they are assumed to have blocking steps.
+        """
+        if self._blocking is None:
+            self._blocking = any(_is_blocking_operation(operation) for operation in self.operations)
+        return self._blocking
+
+    def create_stepper(self, workchain: 'WorkChain') -> '_ProgramStepper':
+        return _ProgramStepper(self, workchain)
+
+    def recreate_stepper(self, saved_state: SAVED_STATE_TYPE, workchain: 'WorkChain') -> '_ProgramStepper':
+        load_context = persistence.LoadSaveContext(workchain=workchain, program=self)
+        return cast(_ProgramStepper, _ProgramStepper.recreate_from(saved_state, load_context))
+
+    def _emit(self, code: int, argument: Any, text: str, context: Tuple[str, str], target: int = -1) -> int:
+        prefix, suffix = context
+        self._operations.append(_Operation(code, argument, target, prefix, text, suffix))
+        return len(self._operations) - 1
+
+    def _patch(self, index: int, target: int) -> None:
+        self._operations[index] = self._operations[index]._replace(target=target)
+
+    def _compile(self, instruction: Union[_Instruction, _FunctionCall], prefix: str, suffix: str) -> None:
+        # Subclasses of the builtin instructions may step differently, so they run their own stepper
+        instruction_type = type(instruction)
+
+        if instruction_type is _FunctionCall:
+            function_call = cast(_FunctionCall, instruction)
+            self._emit(self.CALL, function_call._fn, function_call._fn.__name__, (prefix, suffix))
+
+        elif instruction_type is _Block:
+            index = 0
+            for group in _group_independent_steps(cast(_Block, instruction)):
+                if len(group) == 1:
+                    self._compile(group[0], f'{prefix}{index}:', suffix)
+                else:
+                    parallel = _Parallel(*group)
+                    self._emit(self.STEPPER, parallel, str(parallel), (f'{prefix}{index}:', suffix))
+                index += len(group)
+
+        elif instruction_type is _If:
+            jumps_to_end = []
+            conditionals = cast(_If, instruction)
+            for index, conditional in enumerate(conditionals):
+                code = self.EXIT_BRANCH if index == len(conditionals) - 1 else self.BRANCH
+                branch = self._emit(code, conditional, str(conditional), (prefix, suffix))
+                self._compile(conditional.body, f'{prefix}{conditional}(', f'){suffix}')
+                jumps_to_end.append(self._emit(self.JUMP, None, str(conditional), (prefix, suffix)))
+                self._patch(branch, len(self._operations))
+            for jump in jumps_to_end:
+                self._patch(jump, len(self._operations))
+
+        elif instruction_type is _While:
+            loop = cast(_While, instruction)
+            branch = self._emit(self.EXIT_BRANCH, loop, str(loop), (prefix, suffix))
+            self._compile(loop.body, f'{prefix}{loop}(', f'){suffix}')
+            self._emit(self.JUMP, None, str(loop), (prefix, suffix), target=branch)
+            self._patch(branch, len(self._operations))
+
+        elif instruction_type is _Return:
+            self._emit(self.RETURN, cast(_Return, instruction)._exit_code, 'return_', (prefix, suffix))
+
+        else:
+            self._emit(self.STEPPER, instruction, str(instruction), (prefix, suffix))
+
+
+def _is_blocking_operation(operation: _Operation) -> bool:
+    """Return whether the operation of a program calls a function decorated with :func:`plumpy.executors.blocking`."""
+    argument = operation.argument
+    argument_type = type(argument)
+
+    if operation.code == _Program.CALL:
+        functions = [argument]
+    elif operation.code in (_Program.BRANCH, _Program.EXIT_BRANCH):
+        functions = [argument._predicate]
+    elif operation.code != _Program.STEPPER:
+        return False
+    elif argument_type is _Parallel:
+        return any(program.has_blocking_steps() for program in argument.programs)
+    elif argument_type is _Inline:
+        return argument.workchain_class.spec().get_program().has_blocking_steps()
+    elif argument_type is _Map:
+        functions = [argument.fn]
+    elif argument_type is _AsCompleted:
+        functions = [argument.launch, argument.handle]
+    else:
+        return True
+
+    return any(hasattr(function, executors.EXECUTOR_ATTRIBUTE) for function in functions)
+
+
+@persistence.auto_persist('_pc')
+class _ProgramStepper(Stepper):
+    """Stepper of a compiled outline, its state is only the program counter and the stepper of the current
+    operation if it is an instruction that has its own stepper."""
+
+    PC = '_pc'
+
+    def __init__(self, program: _Program, workchain: 'WorkChain') -> None:
+        super().__init__(workchain)
+        self._program = program
+        self._pc = 0
+        self._child_stepper: Optional[Stepper] = None
+
+    def step(self) -> Tuple[bool, Any]:
+        operations = self._program.operations
+        end = len(operations)
+        pc = self._pc
+        assert pc < end, "Can't call step after the outline is finished"
+
+        try:
+            while True:
+                operation = operations[pc]
+                code = operation.code
+
+                if code == _Program.CALL:
+                    result = operation.argument(self._workchain)
+                    pc += 1
+                    break
+
+                if code in (_Program.BRANCH, _Program.EXIT_BRANCH):
+                    if operation.argument.is_true(self._workchain):
+                        pc += 1
+                        continue
+                    pc = operation.target
+                    if code == _Program.EXIT_BRANCH:
+                        result = None
+                        break
+                    continue
+
+                if code == _Program.JUMP:
+                    pc = operation.target
+                    if pc == end:
+                        return True, None
+                    continue
+
+                if code == _Program.RETURN:
+                    raise _PropagateReturn(operation.argument)
+
+                if self._child_stepper is None:
+                    self._child_stepper = operation.argument.create_stepper(self._workchain)
+                finished, result = self._child_stepper.step()
+                if not finished:
+                    return False, result
+                self._child_stepper = None
+                pc += 1
+                break
+
+            # Follow unconditional jumps, such that finishing the last step of the outline is reported right away
+            while pc < end and operations[pc].code == _Program.JUMP:
+                pc = operations[pc].target
+
+            return pc == end, result
+        finally:
+            self._pc = pc
+
+    def save_instance_state(self, out_state: SAVED_STATE_TYPE, save_context: persistence.LoadSaveContext) -> None:
+        super().save_instance_state(out_state, save_context)
+        if self._child_stepper is not None:
+            out_state[STEPPER_STATE] = self._child_stepper.save()
+
+    def load_instance_state(self, saved_state: SAVED_STATE_TYPE, load_context: persistence.LoadSaveContext) -> None:
+        super().load_instance_state(saved_state, load_context)
+        self._program = load_context.program
+        stepper_state = saved_state.get(STEPPER_STATE, None)
+        self._child_stepper = None
+        if stepper_state is not None:
+            instruction = self._program.operations[self._pc].argument
+            self._child_stepper = instruction.recreate_stepper(stepper_state, self._workchain)
+
+    def __str__(self) -> str:
+        if self._pc == len(self._program):
+            return self._program.end_text
+
+        operation = self._program.operations[self._pc]
+        text = str(self._child_stepper) if self._child_stepper is not None else operation.text
+        return f'{operation.prefix}{text}{operation.suffix}'
+
+
 def if_(condition: PREDICATE_TYPE) -> _If:
     """
     A conditional that can be used in a workchain outline.
@@ -677,6 +1726,177 @@ def while_(condition: PREDICATE_TYPE) -> _While:
     return _While(condition)
 
 
+def map_(items: str, fn: MAP_FUNCTION_TYPE, target: str, max_concurrent: Optional[int] = None) -> _Map:
+    """
+    An instruction that maps a function over the items of a sequence in the context.
+
+    Use as::
+
+      spec.outline(
+        cls.setup,
+        map_('structures', cls.relax, target='relaxations', max_concurrent=4),
+        cls.inspect_relaxations,
+      )
+
+    The function is called with the workchain and an item, and should return a launched process, e.g. through
+    ``self.launch``, or an awaitable such as a coroutine. At most ``max_concurrent`` of these are in flight at any
+    time. Once all are done, their results are stored as a list, in the order of the items, in the context under
+    ``target``. The result of a process is its outputs. If any of them excepts, the workchain excepts.
+
+    The number of launched items, the results of the items that are done and the pids of the child processes in flight
+    are saved with the workchain. Awaitables that are not processes are launched again when a saved workchain is
+    resumed, but child processes cannot be reattached: a checkpoint taken while a child process is in flight cannot be
+    resumed, the workchain excepts with a ``RuntimeError`` on its next step instead.
+
+    :param items: the key of the sequence in the context
+    :param fn: the workchain method to call for each item
+    :param target: the key in the context to store the results under
+    :param max_concurrent: the maximum number of items in flight, unlimited if ``None``
+    """
+    return _Map(items, fn, target, max_concurrent)
+
+
+def parallel_(*branches: BRANCH_TYPE) -> _Parallel:
+    """
+    An instruction that runs independent branches of the outline concurrently.
+
+    Use as::
+
+      spec.outline(
+        cls.setup,
+        parallel_(
+          (cls.launch_relaxations, cls.inspect_relaxations),
+          (cls.launch_phonons, while_(cls.not_converged)(cls.launch_phonons), cls.inspect_phonons),
+        ),
+        cls.results,
+      )
+
+    Each branch is a step, an instruction, or a tuple or list of these. The branches are stepped in turn. A branch that
+    waits for awaitables, through ``ToContext`` or ``to_context``, only blocks itself while the other branches continue.
+    The instruction finishes once all branches have finished. If a step returns an exit code, the workchain stops.
+
+    Awaitables cannot be persisted, so a checkpoint taken while a branch is waiting can only be loaded if the results
+    of its awaitables were already assigned to the context.
+
+    :param branches: the branches
+    """
+    return _Parallel(*branches)
+
+
+def as_completed_(launch: LAUNCH_FUNCTION_TYPE, handle: RESULTS_FUNCTION_TYPE, batch_size: int = 1) -> _AsCompleted:
+    """
+    An instruction that launches children and handles their results as they complete, rather than all at once.
+
+    Use as::
+
+      spec.outline(
+        cls.setup,
+        as_completed_(cls.launch_relaxations, cls.inspect_relaxations, batch_size=10),
+        cls.results,
+      )
+
+    The launch function is called with the workchain and should return a list or dict of launched processes, e.g.
+    through ``self.launch``, or awaitables such as coroutines. The handle function is called with the workchain and a
+    dict of the results of the children that completed since the last call, keyed by their index or key, as soon as at
+    least ``batch_size`` of them are done. Handling results therefore overlaps with the children that are still
+    running. The result of a process is its outputs. If any of them excepts, the workchain excepts. If the handle
+    function returns an exit code, the workchain stops.
+
+    :param launch: the workchain method that launches the children
+    :param handle: the workchain method to call with each batch of results
+    :param batch_size: the minimum number of completed children to handle at once, except for the last batch
+    """
+    return _AsCompleted(launch, handle, batch_size)
+
+
+def inline_(workchain_class: Type['WorkChain'], namespace: Optional[str] = None) -> _Inline:
+    """
+    An instruction that runs the outline of another workchain as part of this one, rather than as a child process.
+
+    Use as::
+
+      @classmethod
+      def define(cls, spec):
+        super().define(spec)
+        spec.expose_inputs(Relax, namespace='relax')
+        spec.expose_outputs(Relax, namespace='relax')
+        spec.outline(cls.setup, inline_(Relax, namespace='relax'), cls.results)
+
+    This avoids the cost of a process for small reusable workchains: state machine, communicator subscribers,
+    listeners and checkpoints. The steps of the inlined workchain are called with a view of this workchain, in which
+    ``ctx`` is the context under ``namespace`` and ``inputs`` and ``out`` are those of the ``namespace`` inputs and
+    outputs. Its inputs and outputs are therefore validated by the ports exposed with ``expose_inputs`` and
+    ``expose_outputs`` in that namespace. All other attributes, e.g. ``launch`` or ``logger``, are those of this
+    workchain, and an exit code returned by an inlined step stops this workchain.
+
+    The methods of the inlined workchain should not rely on ``super()`` or on the hooks of its process, e.g.
+    ``on_create`` or ``on_finish``, which are not called.
+
+    :param workchain_class: the workchain to inline
+    :param namespace: the namespace of its inputs, outputs and context, if ``None`` those of this workchain are used
+    """
+    return _Inline(workchain_class, namespace)
+
+
+def context_access(
+    reads: Iterable[str] = (), writes: Iterable[str] = ()
+) -> Callable[[WC_COMMAND_TYPE], WC_COMMAND_TYPE]:
+    """
+    A decorator to declare the keys of the context that a step reads and writes.
+
+    Use as::
+
+      @context_access(writes=['relax'])
+      def launch_relax(self):
+        return ToContext(relax=self.launch(Relax))
+
+      @context_access(writes=['phonons'])
+      def launch_phonons(self):
+        return ToContext(phonons=self.launch(Phonons))
+
+      @context_access(reads=['relax', 'phonons'])
+      def inspect(self):
+        ...
+
+    Consecutive steps in an outline that all declare their access, and that do not write keys that the others read or
+    write, are independent and run as a ``parallel_`` block, without changing the outline. In the example above, both
+    children are launched before waiting for either, while ``inspect`` waits for both. The keys that a step assigns
+    through ``ToContext`` or ``to_context`` are writes. Steps that do not declare their access are never reordered.
+
+    Declarations can be verified by setting ``plumpy.settings.check_context_access``, in which case a step that reads or
+    writes a key of the context that it does not declare, or returns it in ``ToContext``, raises a ``RuntimeError``.
+
+    :param reads: the keys of the context that the step reads
+    :param writes: the keys of the context that the step writes
+    """
+
+    access = ContextAccess(frozenset(reads), frozenset(writes))
+
+    def wrapper(fn: WC_COMMAND_TYPE) -> WC_COMMAND_TYPE:
+        @functools.wraps(fn)
+        def step(self: 'WorkChain') -> Any:
+            if not settings.check_context_access or not isinstance(self, WorkChain):
+                return fn(self)
+
+            context = self._context
+            assert context is not None
+            self._context = _CheckedContext(context, access, fn.__name__)  # type: ignore[assignment]
+            try:
+                result = fn(self)
+            finally:
+                self._context = context
+
+            if isinstance(result, ToContext):
+                for key in result:
+                    _CheckedContext.check(access.writes, key, fn.__name__, 'write')
+            return result
+
+        step._context_access = access  # type: ignore[attr-defined]
+        return step
+
+    return wrapper
+
+
 return_ = _Return()
 """
 A global singleton that contains a Return instruction that allows to exit
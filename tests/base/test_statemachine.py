@@ -140,3 +140,11 @@ class TestStateMachine(unittest.TestCase):
         cd_player = CdPlayer()
         with self.assertRaises(AssertionError):
             cd_player.play()
+
+    def test_remove_unknown_state_event_callback(self):
+        class Machine(state_machine.StateMachine):
+            STATES = (Stopped,)
+
+        machine = Machine()
+        with self.assertRaises(ValueError):
+            machine.remove_state_event_callback(state_machine.StateEventHook.ENTERING_STATE, lambda *_: None)
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
+import os
+import pickle
 import tempfile
 import unittest
+from unittest import mock
 
 if getattr(tempfile, 'TemporaryDirectory', None) is None:
     from backports import tempfile
@@ -10,6 +13,16 @@ import plumpy
 from ..utils import ProcessWithCheckpoint
 
 
+class ContextWorkChain(plumpy.WorkChain):
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outline(cls.step)
+
+    def step(self):
+        pass
+
+
 class TestPicklePersister(unittest.TestCase):
     def test_save_load_roundtrip(self):
         """
@@ -147,3 +160,129 @@ class TestPicklePersister(unittest.TestCase):
             retrieved_checkpoints = persister.get_checkpoints()
 
             self.assertSetEqual(set(retrieved_checkpoints), set(checkpoints))
+
+
+class TestPicklePersisterSpill(unittest.TestCase):
+    SPILL_THRESHOLD = 1000
+
+    @staticmethod
+    def spill_files(directory):
+        return sorted(filename for filename in os.listdir(directory) if filename.endswith('.spill'))
+
+    def test_spill_roundtrip(self):
+        """Large context values are spilled to a separate file and restored when the checkpoint is loaded."""
+        workchain = ContextWorkChain()
+        workchain.ctx.large = list(range(1000))
+        workchain.ctx.small = 1
+
+        with tempfile.TemporaryDirectory() as directory:
+            persister = plumpy.PicklePersister(directory, spill_threshold=self.SPILL_THRESHOLD)
+            persister.save_checkpoint(workchain)
+            self.assertEqual(len(self.spill_files(directory)), 1)
+
+            loaded = persister.load_checkpoint(workchain.pid).unbundle()
+            self.assertEqual(loaded.ctx.large, list(range(1000)))
+            self.assertEqual(loaded.ctx.small, 1)
+
+    def test_spill_unchanged(self):
+        """Values that were not assigned since the previous checkpoint are not pickled or written again."""
+        workchain = ContextWorkChain()
+        workchain.ctx.large = list(range(1000))
+
+        with tempfile.TemporaryDirectory() as directory:
+            persister = plumpy.PicklePersister(directory, spill_threshold=self.SPILL_THRESHOLD)
+            persister.save_checkpoint(workchain, tag='1')
+            spilled = self.spill_files(directory)
+
+            workchain.ctx.small = 2
+            os.remove(os.path.join(directory, spilled[0]))
+            with mock.patch('pickle.dumps', wraps=pickle.dumps) as dumps:
+                persister.save_checkpoint(workchain, tag='2')
+            self.assertEqual(self.spill_files(directory), [])
+            self.assertEqual(dumps.call_count, 1)
+
+            workchain.ctx.large = list(range(2000))
+            persister.save_checkpoint(workchain, tag='3')
+            self.assertEqual(len(self.spill_files(directory)), 1)
+            self.assertEqual(persister.load_checkpoint(workchain.pid, '3').unbundle().ctx.large, list(range(2000)))
+
+    def test_spill_copy_on_write(self):
+        """A spilled value that is changed in place is only persisted with the change once its key is assigned."""
+        workchain = ContextWorkChain()
+        workchain.ctx.large = list(range(1000))
+
+        with tempfile.TemporaryDirectory() as directory:
+            persister = plumpy.PicklePersister(directory, spill_threshold=self.SPILL_THRESHOLD)
+            persister.save_checkpoint(workchain, tag='1')
+
+            workchain.ctx.large.append(1000)
+            persister.save_checkpoint(workchain, tag='2')
+            self.assertEqual(persister.load_checkpoint(workchain.pid, '2').unbundle().ctx.large, list(range(1000)))
+
+            workchain.ctx.large = workchain.ctx.large
+            persister.save_checkpoint(workchain, tag='3')
+            self.assertEqual(persister.load_checkpoint(workchain.pid, '1').unbundle().ctx.large, list(range(1000)))
+            self.assertEqual(persister.load_checkpoint(workchain.pid, '3').unbundle().ctx.large, list(range(1001)))
+
+    def test_spill_persisters_independent(self):
+        """Each persister tracks the changes since its own previous checkpoint of a process."""
+        workchain = ContextWorkChain()
+        workchain.ctx.large = list(range(1000))
+
+        with tempfile.TemporaryDirectory() as directory_a, tempfile.TemporaryDirectory() as directory_b:
+            persister_a = plumpy.PicklePersister(directory_a, spill_threshold=self.SPILL_THRESHOLD)
+            persister_b = plumpy.PicklePersister(directory_b, spill_threshold=self.SPILL_THRESHOLD)
+            persister_a.save_checkpoint(workchain)
+            persister_b.save_checkpoint(workchain)
+
+            workchain.ctx.large = list(range(2000))
+            persister_a.save_checkpoint(workchain)
+            persister_b.save_checkpoint(workchain)
+
+            for persister in (persister_a, persister_b):
+                self.assertEqual(persister.load_checkpoint(workchain.pid).unbundle().ctx.large, list(range(2000)))
+
+    def test_spill_loaded_process(self):
+        """A process that is loaded again has all of its context values spilled anew."""
+        workchain = ContextWorkChain()
+        workchain.ctx.large = list(range(1000))
+
+        with tempfile.TemporaryDirectory() as directory:
+            persister = plumpy.PicklePersister(directory, spill_threshold=self.SPILL_THRESHOLD)
+            persister.save_checkpoint(workchain, tag='1')
+            workchain.ctx.large = list(range(2000))
+            persister.save_checkpoint(workchain, tag='2')
+
+            loaded = persister.load_checkpoint(workchain.pid, '1').unbundle()
+            persister.save_checkpoint(loaded, tag='3')
+            self.assertEqual(persister.load_checkpoint(workchain.pid, '3').unbundle().ctx.large, list(range(1000)))
+
+    def test_delete_process_checkpoints(self):
+        workchain = ContextWorkChain()
+        workchain.ctx.large = list(range(1000))
+
+        with tempfile.TemporaryDirectory() as directory:
+            persister = plumpy.PicklePersister(directory, spill_threshold=self.SPILL_THRESHOLD)
+            persister.save_checkpoint(workchain, tag='1')
+            persister.save_checkpoint(workchain, tag='2')
+            self.assertEqual(len(self.spill_files(directory)), 1)
+
+            persister.delete_process_checkpoints(workchain.pid)
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_get_context_changes(self):
+        workchain = ContextWorkChain()
+        workchain.ctx.a = 1
+        workchain.ctx['b'] = 2
+        revision, changed = workchain.get_context_changes()
+        self.assertEqual(changed, {'a', 'b'})
+        self.assertEqual(workchain.get_context_changes(revision)[1], set())
+
+        workchain.ctx.a.__add__(1)
+        del workchain.ctx.b
+        workchain.ctx.setdefault('c', [])
+        later, changed = workchain.get_context_changes(revision)
+        self.assertEqual(changed, {'b', 'c'})
+        # Changes are not consumed, so they are returned again for the same revision
+        self.assertEqual(workchain.get_context_changes(revision)[1], {'b', 'c'})
+        self.assertEqual(workchain.get_context_changes(later)[1], set())
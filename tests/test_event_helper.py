@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Tests for the :mod:`plumpy.event_helper` module."""
+
+import gc
+import weakref
+
+from plumpy import ProcessListener
+from plumpy.event_helper import EventHelper, _overridden_hooks
+
+
+class OutputListener(ProcessListener):
+    def __init__(self):
+        super().__init__()
+        self.outputs = []
+
+    def on_output_emitted(self, process, output_port, value, dynamic):
+        self.outputs.append((output_port, value))
+
+
+class RaisingListener(ProcessListener):
+    def on_process_running(self, process):
+        raise RuntimeError('listener failure')
+
+
+def test_fire_event_only_overridden_hooks():
+    """Only listeners that override a hook, through their class or on the instance, should be dispatched to."""
+    helper = EventHelper(ProcessListener)
+    output_listener = OutputListener()
+    running = []
+    instance_listener = ProcessListener()
+    instance_listener.on_process_running = running.append
+
+    helper.add_listener(output_listener)
+    helper.add_listener(instance_listener)
+
+    assert helper._get_listeners_for_event('on_output_emitted') == (output_listener,)
+    assert helper._get_listeners_for_event('on_process_running') == (instance_listener,)
+    assert helper._get_listeners_for_event('on_process_finished') == ()
+
+    helper.fire_event(ProcessListener.on_output_emitted, None, 'port', 1, False)
+    helper.fire_event(ProcessListener.on_process_running, None)
+    helper.fire_event(ProcessListener.on_process_finished, None, {})
+
+    assert output_listener.outputs == [('port', 1)]
+    assert running == [None]
+
+
+def test_fire_event_listeners_changed():
+    """Changing the listeners should update the dispatch, even when the change happens in a callback."""
+    helper = EventHelper(ProcessListener)
+    first = OutputListener()
+    second = OutputListener()
+
+    def add_second(process, output_port, value, dynamic):
+        helper.add_listener(second)
+
+    first.on_output_emitted = add_second
+    helper.add_listener(first)
+
+    helper.fire_event(ProcessListener.on_output_emitted, None, 'port', 1, False)
+    assert second.outputs == []
+
+    helper.fire_event(ProcessListener.on_output_emitted, None, 'port', 2, False)
+    assert second.outputs == [('port', 2)]
+
+    helper.remove_listener(second)
+    helper.fire_event(ProcessListener.on_output_emitted, None, 'port', 3, False)
+    assert second.outputs == [('port', 2)]
+
+
+def test_fire_event_exception(caplog):
+    """An exception in a listener should be logged and not stop the other listeners."""
+    helper = EventHelper(ProcessListener)
+    running = []
+    listener = ProcessListener()
+    listener.on_process_running = running.append
+
+    helper.add_listener(RaisingListener())
+    helper.add_listener(listener)
+    helper.fire_event(ProcessListener.on_process_running, None)
+
+    assert running == [None]
+    assert 'listener failure' in caplog.text
+
+
+def test_hooks_cache_does_not_keep_classes_alive():
+    """Listener classes that are created dynamically can still be garbage collected once their hooks are cached."""
+
+    class DynamicListener(ProcessListener):
+        def on_process_running(self, process):
+            pass
+
+    assert _overridden_hooks(DynamicListener, ProcessListener) == {'on_process_running'}
+
+    reference = weakref.ref(DynamicListener)
+    del DynamicListener
+    gc.collect()
+    assert reference() is None
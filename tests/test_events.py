@@ -3,7 +3,24 @@
 Specifically, the :func:`get_or_create_event_loop` function."""
 
 import asyncio
-from plumpy.events import get_or_create_event_loop
+
+import pytest
+
+from plumpy import settings
+from plumpy.events import (
+    EVENT_LOOP_ENVIRONMENT_VARIABLE,
+    create_event_loop,
+    get_event_loop_implementation,
+    get_or_create_event_loop,
+)
+
+
+@pytest.fixture
+def event_loop_setting(monkeypatch):
+    """Reset the configured event loop implementation after the test."""
+    monkeypatch.delenv(EVENT_LOOP_ENVIRONMENT_VARIABLE, raising=False)
+    monkeypatch.setattr(settings, 'event_loop', None)
+    return monkeypatch
 
 
 def test_returns_running_loop():
@@ -71,3 +88,50 @@ def test_idempotent():
     finally:
         loop1.close()
         asyncio.set_event_loop(None)
+
+
+def test_event_loop_implementation_default(event_loop_setting):
+    """Without configuration the stock asyncio loop is used."""
+    assert get_event_loop_implementation() == 'asyncio'
+
+
+def test_event_loop_implementation_configured(event_loop_setting):
+    """The setting takes precedence over the environment variable."""
+    event_loop_setting.setenv(EVENT_LOOP_ENVIRONMENT_VARIABLE, 'uvloop')
+    assert get_event_loop_implementation() == 'uvloop'
+
+    event_loop_setting.setattr(settings, 'event_loop', 'asyncio')
+    assert get_event_loop_implementation() == 'asyncio'
+
+
+def test_event_loop_implementation_invalid(event_loop_setting):
+    event_loop_setting.setattr(settings, 'event_loop', 'invalid')
+    with pytest.raises(ValueError):
+        get_event_loop_implementation()
+
+
+def test_create_event_loop_uvloop(event_loop_setting):
+    """When ``uvloop`` is configured, newly created loops are ``uvloop`` loops."""
+    uvloop = pytest.importorskip('uvloop')
+    event_loop_setting.setattr(settings, 'event_loop', 'uvloop')
+    asyncio.set_event_loop(None)
+
+    loop = get_or_create_event_loop()
+    try:
+        assert isinstance(loop, uvloop.Loop)
+    finally:
+        loop.close()
+        asyncio.set_event_loop(None)
+
+
+def test_create_event_loop_uvloop_not_installed(event_loop_setting):
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        pytest.skip('uvloop is installed')
+
+    event_loop_setting.setattr(settings, 'event_loop', 'uvloop')
+    with pytest.raises(ImportError):
+        create_event_loop()
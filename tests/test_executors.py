@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""Tests for the :mod:`plumpy.executors` module."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+import plumpy
+from plumpy import executors
+from plumpy.workchains import WorkChain
+
+from . import utils
+
+
+class BlockingProcess(plumpy.Process):
+    EXECUTOR = executors.DEFAULT_EXECUTOR
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outputs.dynamic = True
+
+    def run(self):
+        time.sleep(0.2)
+        self.out('thread', threading.current_thread().name)
+        self.out('current', plumpy.Process.current() is self)
+
+
+class BlockingStepWorkChain(WorkChain):
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outline(cls.blocking_step, cls.result)
+        spec.outputs.dynamic = True
+
+    @executors.blocking()
+    def blocking_step(self):
+        time.sleep(0.2)
+        self.ctx.thread = threading.current_thread().name
+
+    def result(self):
+        self.out('thread', self.ctx.thread)
+
+
+@pytest.fixture
+def named_executor():
+    executors.register_executor('test', max_workers=1)
+    yield 'test'
+    executors.unregister_executor('test')
+
+
+@pytest.mark.asyncio
+async def test_process_executor_keeps_loop_responsive():
+    """While a blocking ``run`` is executing, other tasks on the event loop should keep running."""
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0.01)
+
+    task = asyncio.ensure_future(ticker())
+    process = BlockingProcess()
+    await process.step_until_terminated()
+    task.cancel()
+
+    assert process.is_successful
+    assert process.outputs['thread'] != threading.current_thread().name
+    assert process.outputs['current']
+    assert len(ticks) > 5
+
+
+@pytest.mark.asyncio
+async def test_blocking_step():
+    """A workchain step decorated with ``blocking`` should be run in the executor."""
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0.01)
+
+    task = asyncio.ensure_future(ticker())
+    process = BlockingStepWorkChain()
+    await process.step_until_terminated()
+    task.cancel()
+
+    assert process.is_successful
+    assert process.outputs['thread'].startswith('plumpy-default')
+    assert len(ticks) > 5
+
+
+@pytest.mark.asyncio
+async def test_pause_during_executor():
+    """A pause requested while the run function is in the executor is honored once it returns."""
+    process = BlockingProcess()
+    asyncio.ensure_future(process.step_until_terminated())
+    await asyncio.sleep(0.05)
+
+    result = process.pause()
+    assert isinstance(result, plumpy.futures.CancellableAction)
+    await utils.run_until_paused(process)
+    assert process.paused
+
+    process.play()
+    await process.future()
+    assert process.is_successful
+
+
+def test_register_executor(named_executor):
+    with pytest.raises(ValueError):
+        executors.register_executor(named_executor)
+
+    with pytest.raises(ValueError):
+        executors.get_executor('unknown')
+
+
+@pytest.mark.asyncio
+async def test_executor_stats(named_executor):
+    event = threading.Event()
+
+    first = asyncio.ensure_future(executors.run_in_executor(named_executor, event.wait))
+    second = asyncio.ensure_future(executors.run_in_executor(named_executor, event.wait))
+    await asyncio.sleep(0.05)
+
+    stats = executors.executor_stats()[named_executor]
+    assert stats.max_workers == 1
+    assert stats.active == 1
+    assert stats.queued == 1
+
+    event.set()
+    await asyncio.gather(first, second)
+
+    stats = executors.executor_stats()[named_executor]
+    assert stats.active == 0
+    assert stats.queued == 0
+    assert stats.completed == 2
+
+
+class LaunchingProcess(plumpy.Process):
+    EXECUTOR = executors.DEFAULT_EXECUTOR
+
+    def run(self):
+        self.child = self.launch(utils.DummyProcess)
+        self.call_soon(self.set_callback_thread)
+
+    def set_callback_thread(self):
+        self.callback_thread = threading.current_thread().name
+
+
+class ExecutorWorkChain(WorkChain):
+    EXECUTOR = executors.DEFAULT_EXECUTOR
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outline(cls.setup, cls.launch_child, cls.result)
+        spec.outputs.dynamic = True
+
+    def setup(self):
+        pass
+
+    def launch_child(self):
+        self.ctx.thread = threading.current_thread().name
+        return plumpy.ToContext(child=self.launch(utils.DummyProcess))
+
+    def result(self):
+        self.out('thread', self.ctx.thread)
+
+
+@pytest.mark.asyncio
+async def test_process_executor_launch():
+    """A run function in the executor can launch processes and schedule callbacks, which run on the event loop."""
+    process = LaunchingProcess()
+    await process.step_until_terminated()
+    await process.child.future()
+
+    assert process.child.is_successful
+    assert process.callback_thread == threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_workchain_executor_steps_on_loop():
+    """The steps of a workchain run on the event loop thread, even if the workchain has an executor."""
+    process = ExecutorWorkChain()
+    await process.step_until_terminated()
+
+    assert process.is_successful
+    assert process.outputs['thread'] == threading.current_thread().name
+
+
+def test_has_blocking_steps():
+    assert BlockingStepWorkChain.spec().get_program().has_blocking_steps()
+    assert not ExecutorWorkChain.spec().get_program().has_blocking_steps()
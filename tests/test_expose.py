@@ -62,8 +62,9 @@ class TestExposeProcess(unittest.TestCase):
         port_namespace_left = process_left.spec().inputs.get_port(namespace_left)
         port_namespace_right = process_right.spec().inputs.get_port(namespace_right)
 
-        left_dict = {k: v for k, v in port_namespace_left.__dict__.items() if k != '_ports'}
-        right_dict = {k: v for k, v in port_namespace_right.__dict__.items() if k != '_ports'}
+        slots = {slot for cls in type(port_namespace_left).__mro__ for slot in getattr(cls, '__slots__', ())}
+        left_dict = {k: getattr(port_namespace_left, k) for k in slots if k != '_ports'}
+        right_dict = {k: getattr(port_namespace_right, k) for k in slots if k != '_ports'}
 
         self.assertEqual(left_dict, right_dict)
 
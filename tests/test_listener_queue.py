@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""Tests for the :mod:`plumpy.listener_queue` module."""
+
+import threading
+
+import pytest
+
+import plumpy
+from plumpy import BatchedProcessListener, ListenerQueue, OverflowPolicy, ProcessListener, executors
+
+from . import utils
+
+
+class OutputListener(ProcessListener):
+    def __init__(self):
+        super().__init__()
+        self.outputs = []
+
+    def on_output_emitted(self, process, output_port, value, dynamic):
+        self.outputs.append((output_port, value))
+
+
+class EventsListener(BatchedProcessListener):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def on_process_events(self, events):
+        self.batches.append([event.name for event in events])
+
+
+class StateListener(ProcessListener):
+    """Listener that records the state of the process at the time the event is delivered."""
+
+    def __init__(self):
+        super().__init__()
+        self.states = []
+
+    def on_process_finished(self, process, outputs):
+        self.states.append(process.state)
+
+
+class BatchesListener(ProcessListener):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def on_outputs_emitted(self, process, outputs):
+        self.batches.append([(output_port, value) for output_port, value, _ in outputs])
+
+
+class ManyOutputs(plumpy.Process):
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outputs.dynamic = True
+
+    def run(self):
+        for index in range(10):
+            self.out(f'output_{index % 2}', index)
+
+
+class ManyOutputsInExecutor(ManyOutputs):
+    EXECUTOR = executors.DEFAULT_EXECUTOR
+
+    def run(self):
+        self.thread = threading.current_thread()
+        super().run()
+
+
+class ManyOutputBatches(ManyOutputs):
+    def run(self):
+        for index in range(10):
+            self.out_many({f'output_{index % 2}': index})
+
+
+@pytest.mark.asyncio
+async def test_delivery():
+    """Events are delivered after they were fired, once the queue is drained."""
+    queue = ListenerQueue()
+    listener = OutputListener()
+    process = ManyOutputs()
+    process.add_process_listener(queue.wrap(listener))
+
+    await process.step_until_terminated()
+    assert listener.outputs == []
+
+    await queue.join()
+    assert listener.outputs == [(f'output_{index % 2}', index) for index in range(10)]
+
+    stats = queue.stats()
+    assert stats.size == 0
+    assert stats.enqueued == stats.delivered == 10
+    assert stats.dropped == 0
+    assert stats.max_lag > 0
+
+
+@pytest.mark.asyncio
+async def test_only_overridden_hooks_queued():
+    """Hooks that the wrapped listener does not override should not be queued."""
+    queue = ListenerQueue()
+    finished = []
+    listener = ProcessListener()
+    listener.on_process_finished = lambda process, outputs: finished.append(outputs)
+    process = utils.DummyProcess()
+    process.add_process_listener(queue.wrap(listener))
+
+    await process.step_until_terminated()
+    await queue.join()
+
+    assert finished == [{}]
+    assert queue.stats().enqueued == 1
+
+
+@pytest.mark.asyncio
+async def test_batched_listener():
+    queue = ListenerQueue(batch_size=4)
+    listener = EventsListener()
+    process = ManyOutputs()
+    process.add_process_listener(queue.wrap(listener))
+
+    await process.step_until_terminated()
+    await queue.join()
+
+    names = [name for batch in listener.batches for name in batch]
+    assert names.count('on_output_emitted') == 10
+    assert names[-1] == 'on_process_finished'
+    assert all(len(batch) <= 4 for batch in listener.batches)
+    assert queue.stats().batches == len(listener.batches)
+
+
+@pytest.mark.asyncio
+async def test_delivery_after_step():
+    """Events are delivered outside of the state transition that fired them."""
+    queue = ListenerQueue()
+    listener = StateListener()
+    process = utils.DummyProcess()
+    process.add_process_listener(queue.wrap(listener))
+
+    await process.step_until_terminated()
+    await queue.join()
+    assert listener.states == [plumpy.ProcessState.FINISHED]
+
+
+@pytest.mark.asyncio
+async def test_overflow_block():
+    """With the block policy the oldest batch is delivered synchronously, so nothing is lost."""
+    queue = ListenerQueue(maxsize=4, batch_size=2, overflow=OverflowPolicy.BLOCK)
+    listener = OutputListener()
+    process = ManyOutputs()
+    process.add_process_listener(queue.wrap(listener))
+
+    await process.step_until_terminated()
+    assert len(listener.outputs) == 6
+
+    await queue.join()
+    assert len(listener.outputs) == 10
+    assert queue.stats().dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_overflow_drop_oldest():
+    queue = ListenerQueue(maxsize=4, overflow=OverflowPolicy.DROP_OLDEST)
+    listener = OutputListener()
+    process = ManyOutputs()
+    process.add_process_listener(queue.wrap(listener))
+
+    await process.step_until_terminated()
+    await queue.join()
+
+    assert listener.outputs == [(f'output_{index % 2}', index) for index in range(6, 10)]
+    assert queue.stats().dropped == 6
+
+
+@pytest.mark.asyncio
+async def test_overflow_coalesce():
+    """With the coalesce policy only the latest output per port is kept once the queue is full."""
+    queue = ListenerQueue(maxsize=2, overflow=OverflowPolicy.COALESCE)
+    listener = OutputListener()
+    process = ManyOutputs()
+    process.add_process_listener(queue.wrap(listener))
+
+    await process.step_until_terminated()
+    await queue.join()
+
+    assert listener.outputs == [('output_0', 8), ('output_1', 9)]
+    stats = queue.stats()
+    assert stats.coalesced == 8
+    assert stats.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_overflow_coalesce_batches():
+    """Batches of outputs carry different outputs, so they are never coalesced."""
+    queue = ListenerQueue(maxsize=2, overflow=OverflowPolicy.COALESCE)
+    listener = BatchesListener()
+    process = ManyOutputBatches()
+    process.add_process_listener(queue.wrap(listener))
+
+    await process.step_until_terminated()
+    await queue.join()
+
+    assert listener.batches == [[(f'output_{index % 2}', index)] for index in range(8, 10)]
+    stats = queue.stats()
+    assert stats.coalesced == 0
+    assert stats.dropped == 8
+
+
+@pytest.mark.asyncio
+async def test_delivery_from_executor():
+    """Events fired on the thread of an executor are queued and delivered on the thread of the event loop."""
+    queue = ListenerQueue()
+    listener = OutputListener()
+    process = ManyOutputsInExecutor()
+    process.add_process_listener(queue.wrap(listener))
+
+    await process.step_until_terminated()
+    await queue.join()
+
+    assert process.thread is not threading.current_thread()
+    assert listener.outputs == [(f'output_{index % 2}', index) for index in range(10)]
+    stats = queue.stats()
+    assert stats.enqueued == stats.delivered == 10
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ListenerQueue(maxsize=0)
+
+    with pytest.raises(ValueError):
+        ListenerQueue(batch_size=0)
+
+    with pytest.raises(ValueError):
+        ListenerQueue(overflow='invalid')
+
+
+def test_save_process_with_queued_listener():
+    """A process with a queued listener can still be saved."""
+    queue = ListenerQueue()
+    process = utils.DummyProcess()
+    process.add_process_listener(queue.wrap(OutputListener()))
+    plumpy.Bundle(process)
+
+
+@pytest.mark.asyncio
+async def test_pickle_checkpoint_with_queued_events(tmp_path):
+    """Queued listeners are not saved with a process, even while they have events on the queue."""
+    queue = ListenerQueue()
+    listener = OutputListener()
+    process = utils.DummyProcess()
+    queued = queue.wrap(listener)
+    process.add_process_listener(queued)
+    process.add_process_listener(OutputListener())
+
+    queued.on_output_emitted(process, 'output', 1, False)
+    assert queue.stats().size == 1
+
+    persister = plumpy.PicklePersister(str(tmp_path))
+    persister.save_checkpoint(process)
+    loaded = persister.load_checkpoint(process.pid).unbundle()
+
+    assert [type(saved) for saved in loaded._event_helper.listeners] == [OutputListener]
+
+    await queue.join()
+    assert listener.outputs == [('output', 1)]
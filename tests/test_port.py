@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
+import copy
+import pickle
 import types
+from unittest import mock
 
 from plumpy.ports import UNSPECIFIED, InputPort, OutputPort, Port, PortNamespace
 
@@ -31,6 +34,33 @@ class TestPort(TestCase):
         self.assertIsNone(spec.validate(5))
         self.assertIsNotNone(spec.validate('s'))
 
+    def test_validator_signature_resolved_once(self):
+        """Verify that the signature of the validator is inspected when it is set and not on every validation."""
+
+        def validate(value, port):
+            return None
+
+        spec = Port('valid_with_validator', validator=validate)
+
+        with mock.patch('inspect.getfullargspec') as getfullargspec:
+            for value in range(3):
+                self.assertIsNone(spec.validate(value))
+
+        getfullargspec.assert_not_called()
+
+    def test_validator_single_argument_deprecated(self):
+        """Verify that a validator that only takes the value still works but warns on each validation."""
+
+        def validate(value):
+            return None if isinstance(value, int) else 'Not int'
+
+        spec = Port('valid_with_validator', validator=validate)
+
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(spec.validate(5))
+        with self.assertWarns(UserWarning):
+            self.assertIsNotNone(spec.validate('s'))
+
     def test_validator_not_required(self):
         """Verify that a validator is not called if no value is specified for a port that is not required."""
 
@@ -41,6 +71,27 @@ class TestPort(TestCase):
 
         self.assertIsNone(spec.validate(UNSPECIFIED))
 
+    def test_slots(self):
+        """Test that ports define slots and can still be copied, pickled and subclassed."""
+        namespace = PortNamespace('base', dynamic=True)
+        namespace['a'] = InputPort('a', valid_type=int, default=1)
+        namespace['b'] = OutputPort('b', help='help')
+
+        for port in (namespace, namespace['a'], namespace['b']):
+            self.assertFalse(hasattr(port, '__dict__'))
+
+        for clone in (copy.deepcopy(namespace), pickle.loads(pickle.dumps(namespace))):
+            self.assertEqual(clone.dynamic, True)
+            self.assertEqual((clone['a'].valid_type, clone['a'].default), (int, 1))
+            self.assertEqual(clone['b'].help, 'help')
+
+        class CustomPort(InputPort):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.custom = True
+
+        self.assertTrue(CustomPort('custom').custom)
+
 
 class TestInputPort(TestCase):
     def test_default(self):
@@ -300,6 +351,74 @@ class TestPortNamespace(TestCase):
             self.port_namespace.NAMESPACE_SEPARATOR.join((self.BASE_PORT_NAMESPACE_NAME, 'sub', 'space', 'output')),
         )
 
+    def test_port_namespace_validate_dynamic_ports(self):
+        """Check the validation of deeply nested and large dynamic namespaces."""
+        port_namespace = PortNamespace(self.BASE_PORT_NAMESPACE_NAME, valid_type=int)
+        separator = port_namespace.NAMESPACE_SEPARATOR
+
+        self.assertIsNone(port_namespace.validate_dynamic_ports({'a': {'b': {}, 'c': {'d': 1}}, 'e': 2}))
+
+        # The breadcrumbs of an invalid value should contain each nested key once
+        validation_error = port_namespace.validate_dynamic_ports({'a': 1, 'b': {'c': {'d': 1, 'e': '1'}}}, ('base',))
+        self.assertEqual(validation_error.port, separator.join(('base', self.BASE_PORT_NAMESPACE_NAME, 'b', 'c', 'e')))
+
+        # Nesting beyond the recursion limit should not be a problem
+        port_values = value = {}
+        for _ in range(5000):
+            value['nested'] = value = {}
+        value['leaf'] = '1'
+        validation_error = port_namespace.validate_dynamic_ports(port_values)
+        self.assertTrue(validation_error.port.endswith(f'{separator}nested{separator}leaf'))
+
+    def test_port_namespace_unexpected_ports_message(self):
+        """Check that the error message for unexpected ports only contains the first few ports."""
+        port_values = {f'key_{index}': index for index in range(10000)}
+        validation_error = self.port_namespace.validate(port_values)
+        self.assertIn("'key_0': 0", validation_error.message)
+        self.assertNotIn('key_10', validation_error.message)
+        self.assertIn('10000 in total', validation_error.message)
+
+        validation_error = self.port_namespace.validate({'key_0': 0})
+        self.assertIn("{'key_0': 0}", validation_error.message)
+
+    def test_port_namespace_compile_validator(self):
+        """Check that the compiled validator of a namespace returns the same result as ``validate``."""
+
+        def validate_positive(value, port):
+            return None if value > 0 else 'not positive'
+
+        def validate_namespace(values, port):
+            return None if 'a' in values or 'b' in values else 'need a or b'
+
+        namespace = PortNamespace('base', validator=validate_namespace)
+        namespace['a'] = InputPort('a', valid_type=int, required=False, validator=validate_positive)
+        namespace['b'] = InputPort('b', valid_type=int, required=False)
+        namespace.create_port_namespace('sub')['c'] = InputPort('c', valid_type=str)
+        namespace.create_port_namespace('dynamic', valid_type=int, required=False)
+
+        validate = namespace.compile_validator()
+
+        for port_values in (
+            5,
+            {},
+            {'a': 1, 'sub': {'c': 'c'}},
+            {'b': 1, 'sub': {'c': 'c'}, 'dynamic': {'x': 1, 'y': {'z': 2}}},
+            {'a': 1},
+            {'a': -1, 'sub': {'c': 'c'}},
+            {'a': '1', 'sub': {'c': 'c'}},
+            {'sub': {'c': 'c'}},
+            {'a': 1, 'sub': {'c': 'c'}, 'dynamic': {'x': 'x'}},
+            {'a': 1, 'sub': {'c': 'c'}, 'unknown': 1},
+            {'a': 1, 'sub': {'c': 'c', 'unknown': 1}},
+        ):
+            expected = namespace.validate(port_values)
+            result = validate(port_values)
+            if expected is None:
+                self.assertIsNone(result, port_values)
+            else:
+                self.assertIsNotNone(result, port_values)
+                self.assertEqual((result.message, result.port), (expected.message, expected.port))
+
     def test_port_namespace_required(self):
         """Verify that validation will fail if required port is not specified."""
         port_namespace_sub = self.port_namespace.create_port_namespace('sub.space')
@@ -353,6 +472,34 @@ class TestPortNamespace(TestCase):
         # Because the namespace is lazy and no inputs were passed, the defaults should not have been populated.
         self.assertEqual(pre_processed, {})
 
+    def test_port_namespace_compile_pre_process(self):
+        """Check that the compiled ``pre_process`` of a namespace returns the same result as ``pre_process``."""
+        port_namespace = PortNamespace('base')
+        port_namespace['static'] = InputPort('static', default=1)
+        port_namespace['lambda'] = InputPort('lambda', default=lambda: 2)
+        port_namespace['no_default'] = InputPort('no_default', required=False)
+        port_namespace.create_port_namespace('normal')['with_default'] = InputPort('with_default', default=3)
+        port_namespace.create_port_namespace('lazy', populate_defaults=False)['with_default'] = InputPort(
+            'with_default', default=4
+        )
+        port_namespace.create_port_namespace('empty', dynamic=True)
+
+        pre_process = port_namespace.compile_pre_process()
+
+        for inputs in (
+            {},
+            {'static': 5, 'no_default': 6},
+            {'lazy': {}},
+            {'normal': {'with_default': 7, 'extra': 8}, 'lazy': {'with_default': 9}},
+            {'empty': {'a': 1}, 'unknown': 10},
+        ):
+            expected = port_namespace.pre_process(copy.deepcopy(inputs))
+            result = pre_process(copy.deepcopy(inputs))
+            self.assertEqual(result, expected)
+            self.assertEqual(list(result), list(expected))
+            for name, value in expected.items():
+                self.assertEqual(type(result[name]), type(value))
+
     def test_port_namespace_lambda_defaults(self):
         """Verify that lambda defaults are accepted and properly evaluated."""
         port_namespace = PortNamespace('base')
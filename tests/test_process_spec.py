@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
+from unittest import mock
+
 from plumpy import ProcessSpec
-from plumpy.ports import InputPort, PortNamespace
+from plumpy.ports import InputPort, OutputPort, PortNamespace, pure
 
 from .utils import TestCase
 
@@ -41,6 +43,34 @@ class TestProcessSpec(TestCase):
         self.assertIsNone(self.spec.outputs.validate({'dummy': StrSubtype('bar')}))
         self.assertIsNotNone(self.spec.outputs.validate({'dummy': 5}))
 
+    def test_resolve_output_port(self):
+        """Test that output ports are resolved once and dynamic namespaces are created once and then cached."""
+        self.spec.output('explicit')
+        self.spec.output_namespace('results', dynamic=True)
+        self.spec.seal()
+
+        outputs = self.spec.outputs
+        self.assertEqual(self.spec.resolve_output_port('explicit'), ((), 'explicit', outputs, outputs['explicit']))
+        self.assertEqual(self.spec.resolve_output_port('dynamic'), ((), 'dynamic', outputs, None))
+
+        get_port_original = PortNamespace.get_port
+        with mock.patch.object(PortNamespace, 'get_port', autospec=True, side_effect=get_port_original) as get_port:
+            for index in range(3):
+                namespace, port_name, port_namespace, port = self.spec.resolve_output_port(f'results.sub.out_{index}')
+                self.assertEqual(namespace, ('results', 'sub'))
+                self.assertEqual(port_name, f'out_{index}')
+                self.assertIs(port_namespace, outputs['results']['sub'])
+                self.assertIsNone(port)
+
+        self.assertEqual([call.args[0] for call in get_port.call_args_list].count(outputs), 1)
+
+        # Adding a port invalidates the cache, so the new port is resolved
+        outputs['results']['sub']['out_0'] = OutputPort('out_0')
+        self.assertIs(self.spec.resolve_output_port('results.sub.out_0')[3], outputs['results']['sub']['out_0'])
+
+        with self.assertRaises(ValueError):
+            self.spec.resolve_output_port('explicit_namespace.out')
+
     def test_get_description(self):
         spec = ProcessSpec()
 
@@ -90,6 +120,98 @@ class TestProcessSpec(TestCase):
 
         self.assertIsNotNone(self.spec.inputs.validate({'dict': {'wrong_key': 'value'}}))
 
+    def test_get_validator(self):
+        """Test that the validator of a sealed spec is compiled once and recompiled when a port is modified."""
+        self.spec.input('a', valid_type=int)
+        self.assertEqual(self.spec.get_validator(self.spec.inputs), self.spec.inputs.validate)
+
+        self.spec.seal()
+        validator = self.spec.get_validator(self.spec.inputs)
+        self.assertIs(self.spec.get_validator(self.spec.inputs), validator)
+        self.assertIsNone(validator({'a': 1}))
+        self.assertIsNotNone(validator({'a': 'a'}))
+        self.assertIsNotNone(validator({'a': 1, 'b': 1}))
+
+        # Dynamically created namespaces, as for example when emitting outputs, can still modify a sealed spec
+        self.spec.inputs.dynamic = True
+        validator = self.spec.get_validator(self.spec.inputs)
+        self.assertIsNone(validator({'a': 1, 'b': 1}))
+
+    def test_get_pre_process(self):
+        """Test that the pre-processing of a sealed spec is compiled once and recompiled when a default is modified."""
+        self.spec.input('a', default=1)
+        self.spec.seal()
+
+        pre_process = self.spec.get_pre_process(self.spec.inputs)
+        self.assertIs(self.spec.get_pre_process(self.spec.inputs), pre_process)
+        self.assertEqual(pre_process({}), {'a': 1})
+
+        self.spec.inputs['a'].default = 2
+        self.assertEqual(self.spec.get_pre_process(self.spec.inputs)({}), {'a': 2})
+
+    @mock.patch('plumpy.settings.validation_cache_size', 2)
+    def test_validate_inputs_cache(self):
+        """Test that successful validations are cached for specs with pure validators."""
+        calls = []
+
+        @pure
+        def validator(value, port):
+            calls.append(value)
+            return None if value > 0 else 'not positive'
+
+        self.spec.input('a', valid_type=(bool, int), validator=validator)
+        self.spec.input('b', required=False, valid_type=bool)
+        self.spec.seal()
+
+        self.assertIsNone(self.spec.validate_inputs({'a': 1}))
+        self.assertIsNone(self.spec.validate_inputs({'a': 1}))
+        self.assertEqual(calls, [1])
+
+        # Failed validations are not cached and values that compare equal but are of a different type are not confused
+        self.assertIsNotNone(self.spec.validate_inputs({'a': 0}))
+        self.assertIsNotNone(self.spec.validate_inputs({'a': 0}))
+        self.assertIsNotNone(self.spec.validate_inputs({'a': 1, 'b': 1}))
+        self.assertIsNone(self.spec.validate_inputs({'a': True}))
+        self.assertEqual(calls, [1, 0, 0, 1, True])
+
+        # The cache is bounded, so the least recently used inputs are evicted
+        self.assertIsNone(self.spec.validate_inputs({'a': 2}))
+        self.assertIsNone(self.spec.validate_inputs({'a': 1}))
+        self.assertEqual(calls, [1, 0, 0, 1, True, 2, 1])
+
+        # Modifying a port clears the cache
+        self.spec.inputs['b'].required = False
+        self.assertIsNone(self.spec.validate_inputs({'a': 2}))
+        self.assertEqual(calls, [1, 0, 0, 1, True, 2, 1, 2])
+
+    @mock.patch('plumpy.settings.validation_cache_size', 2)
+    def test_validate_inputs_cache_impure(self):
+        """Test that validations are not cached if a validator is not pure or the inputs are not hashable."""
+        calls = []
+
+        @pure
+        def validator(value, port):
+            calls.append(value)
+
+        def impure_validator(value, port):
+            calls.append(value)
+
+        self.spec.input('a', validator=validator)
+        self.spec.input('b', required=False, validator=impure_validator)
+        self.spec.seal()
+
+        self.spec.validate_inputs({'a': 1, 'b': 2})
+        self.spec.validate_inputs({'a': 1, 'b': 2})
+        self.assertEqual(calls, [1, 2, 1, 2])
+
+        spec = ProcessSpec()
+        spec.input('a', validator=validator)
+        spec.seal()
+
+        spec.validate_inputs({'a': [1]})
+        spec.validate_inputs({'a': [1]})
+        self.assertEqual(calls, [1, 2, 1, 2, [1], [1]])
+
     def test_validate(self):
         """Test the global spec validator functionality."""
 
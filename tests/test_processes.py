@@ -9,7 +9,7 @@ import kiwipy
 import pytest
 
 import plumpy
-from plumpy import BundleKeys, Process, ProcessState
+from plumpy import BundleKeys, Process, ProcessState, process_states
 from plumpy.process_comms import MESSAGE_TEXT_KEY, MessageBuilder
 from plumpy.utils import AttributesFrozendict
 from tests import utils
@@ -62,6 +62,35 @@ async def test_process_scope():
     await p1task, p2task
 
 
+def _validate_value(value, port):
+    _ValidatedOutputs.calls.append(value)
+
+
+def _validate_outputs(outputs, port):
+    if 'value' in outputs and 'other' not in outputs:
+        return 'other is required if value is specified'
+    return None
+
+
+class _ValidatedOutputs(Process):
+    calls = []
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.input('other', valid_type=bool, default=True)
+        spec.output('value', validator=_validate_value)
+        spec.output('other', required=False)
+        spec.output_namespace('results', valid_type=int, dynamic=True)
+        spec.outputs.validator = _validate_outputs
+
+    def run(self):
+        self.out('value', 1)
+        self.out_many({f'results.value_{index}': index for index in range(3)})
+        if self.inputs.other:
+            self.out('other', 2)
+
+
 class TestProcess(unittest.TestCase):
     def test_spec(self):
         """
@@ -532,6 +561,25 @@ class TestProcess(unittest.TestCase):
 
         self.assertFalse(proc.is_successful)
 
+    def test_output_validation_on_finish(self):
+        """Test that outputs validated when emitted are not validated again, except for constraints across outputs."""
+        _ValidatedOutputs.calls = []
+
+        proc = _ValidatedOutputs()
+        proc.execute()
+        self.assertTrue(proc.is_successful)
+        self.assertEqual(_ValidatedOutputs.calls, [1])
+
+        proc = _ValidatedOutputs(inputs={'other': False})
+        proc.execute()
+        self.assertFalse(proc.is_successful)
+
+        # The outputs of a process that is loaded from a saved state are validated completely
+        loaded = plumpy.Bundle(proc).unbundle()
+        spec = loaded.spec()
+        self.assertIsNotNone(spec.get_validator(spec.outputs, loaded._outputs_validated)(loaded.outputs))
+        self.assertEqual(_ValidatedOutputs.calls, [1, 1, 1])
+
     def test_unsuccessful_result(self):
         ERROR_CODE = 256
 
@@ -892,6 +940,247 @@ class TestProcessSaving(unittest.TestCase):
         utils.compare_dictionaries(None, None, bundle1, bundle2, exclude={'_listeners'})
 
 
+class TestProcessMemory(unittest.TestCase):
+    def test_no_instance_dict(self):
+        """States, commands and helpers define ``__slots__`` and should not carry an instance dictionary."""
+        proc = utils.WaitForSignalProcess()
+        objects = [
+            proc._state,
+            proc._event_helper,
+            proc.future(),
+            plumpy.Continue(proc.run),
+            plumpy.Wait(proc.run),
+            plumpy.Stop(None, True),
+            plumpy.Kill(),
+        ]
+        for obj in objects:
+            self.assertFalse(hasattr(obj, '__dict__'), f'{type(obj)} has an instance dictionary')
+
+    def test_lazy_containers(self):
+        """Containers that most processes never use should only be allocated on first use."""
+        proc = utils.DummyProcess()
+        self.assertIsNone(proc._cleanups)
+        self.assertIsNone(proc._event_helper._listeners)
+        self.assertEqual(proc._event_helper.listeners, set())
+
+        listener = plumpy.ProcessListener()
+        proc.add_process_listener(listener)
+        self.assertEqual(proc._event_helper.listeners, {listener})
+
+        proc.add_cleanup(lambda: None)
+        self.assertEqual(len(proc._cleanups), 1)
+
+        proc.execute()
+        self.assertIsNone(proc._cleanups)
+
+
+class _FusedSteps(plumpy.Process):
+    FUSE_CONTINUE_STEPS = True
+    NUM_STEPS = 10
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outputs.dynamic = True
+
+    def run(self):
+        self.steps = 0
+        self.fused = 0
+        return plumpy.Continue(self.next_step)
+
+    def next_step(self):
+        self.steps += 1
+        if self.steps < self.NUM_STEPS:
+            return plumpy.Continue(self.next_step)
+        self.out('steps', self.steps)
+
+    def on_step_fused(self):
+        super().on_step_fused()
+        self.fused += 1
+
+
+class _SavedFusedSteps(_FusedSteps):
+    """Fused steps whose step counter is part of the saved state, such that they can resume from any checkpoint."""
+
+    def save_instance_state(self, out_state, save_context):
+        super().save_instance_state(out_state, save_context)
+        out_state['steps'] = getattr(self, 'steps', 0)
+
+    def load_instance_state(self, saved_state, load_context):
+        super().load_instance_state(saved_state, load_context)
+        self.steps = saved_state['steps']
+        self.fused = 0
+
+
+class _UnfusedSteps(_FusedSteps):
+    FUSE_CONTINUE_STEPS = False
+
+
+class _PauseInFusedStep(_FusedSteps):
+    def next_step(self):
+        if self.steps == 3:
+            self.pause()
+        return super().next_step()
+
+
+class _KillInFusedStep(_FusedSteps):
+    def next_step(self):
+        if self.steps == 3:
+            self.kill('killed in step')
+        return super().next_step()
+
+
+class TestFusedStepping(unittest.TestCase):
+    def test_fused(self):
+        """Consecutive ``Continue`` commands should be executed within a single RUNNING state."""
+        proc = _FusedSteps()
+        saver = utils.ProcessSaver(proc)
+        proc.execute()
+
+        self.assertEqual(proc.outputs, {'steps': _FusedSteps.NUM_STEPS})
+        self.assertEqual(proc.fused, _FusedSteps.NUM_STEPS)
+        # The listeners are notified of every fused step, so there is still a snapshot for every step
+        self.assertEqual(len(saver.snapshots), _FusedSteps.NUM_STEPS + 2)
+
+    def test_fused_snapshots(self):
+        """The checkpoints taken between fused steps should resume at the next step."""
+        loop = plumpy.get_or_create_event_loop()
+        proc = _SavedFusedSteps()
+        saver = utils.ProcessSaver(proc)
+        saver.capture()
+
+        # The first snapshot is taken by ``capture`` itself and the last one on entering FINISHED
+        run_fns = [bundle['_state'][process_states.Running.RUN_FN] for bundle in saver.snapshots[1:-1]]
+        self.assertEqual(run_fns, ['run'] + ['next_step'] * _FusedSteps.NUM_STEPS)
+        self.assertTrue(utils.check_process_against_snapshots(loop, _SavedFusedSteps, saver.snapshots))
+
+    def test_not_fused_by_default(self):
+        proc = _UnfusedSteps()
+        saver = utils.ProcessSaver(proc)
+        proc.execute()
+
+        self.assertEqual(proc.outputs, {'steps': _FusedSteps.NUM_STEPS})
+        self.assertEqual(proc.fused, 0)
+        self.assertEqual(len(saver.snapshots), _FusedSteps.NUM_STEPS + 2)
+
+    def test_pause_between_fused_steps(self):
+        """A pause requested by a step should be honored before the next step is run."""
+
+        loop = plumpy.get_or_create_event_loop()
+        proc = _PauseInFusedStep()
+
+        async def async_test():
+            await utils.run_until_paused(proc)
+            self.assertEqual(proc.steps, 4)
+            self.assertEqual(proc.state, ProcessState.RUNNING)
+
+            # The checkpoint taken while paused should resume at the next step
+            bundle = plumpy.Bundle(proc)
+            self.assertEqual(bundle['_state'][process_states.Running.RUN_FN], 'next_step')
+
+            proc.play()
+            await proc.future()
+            self.assertEqual(proc.outputs, {'steps': _FusedSteps.NUM_STEPS})
+
+        loop.create_task(proc.step_until_terminated())
+        loop.run_until_complete(async_test())
+
+    def test_kill_between_fused_steps(self):
+        proc = _KillInFusedStep()
+        with self.assertRaises(plumpy.KilledError):
+            proc.execute()
+
+        self.assertEqual(proc.steps, 4)
+        self.assertTrue(proc.killed())
+
+
+class _BudgetedSteps(_UnfusedSteps):
+    STEP_BUDGET = 2
+
+
+class _TimeBudgetedSteps(_UnfusedSteps):
+    STEP_TIME_BUDGET = 0.0
+
+
+class _BudgetedFusedSteps(_FusedSteps):
+    STEP_BUDGET = 3
+
+
+class _TimeBudgetedFusedSteps(_FusedSteps):
+    STEP_TIME_BUDGET = 0.0
+
+
+class TestStepBudget(unittest.TestCase):
+    def _run_with_ticker(self, proc):
+        """Run the process to completion while another task counts how often it gets to run."""
+        loop = plumpy.get_or_create_event_loop()
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(getattr(proc, 'steps', 0))
+                await asyncio.sleep(0)
+
+        async def async_test():
+            task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0)
+            await proc.step_until_terminated()
+            task.cancel()
+
+        loop.run_until_complete(async_test())
+        return ticks
+
+    def test_no_budget(self):
+        """Without a budget, steps that do not suspend run without yielding to the event loop."""
+        proc = _UnfusedSteps()
+        ticks = self._run_with_ticker(proc)
+
+        self.assertEqual(proc.outputs, {'steps': _FusedSteps.NUM_STEPS})
+        self.assertEqual(proc.preemptions, 0)
+        self.assertEqual(len(ticks), 1)
+
+    def test_step_budget(self):
+        """After every ``STEP_BUDGET`` steps the process yields to the event loop."""
+        proc = _BudgetedSteps()
+        ticks = self._run_with_ticker(proc)
+
+        self.assertEqual(proc.outputs, {'steps': _FusedSteps.NUM_STEPS})
+        # Entering RUNNING, running ``run``, ``NUM_STEPS`` times ``next_step``, the last step terminates the process
+        self.assertEqual(proc.preemptions, (_FusedSteps.NUM_STEPS + 2) // _BudgetedSteps.STEP_BUDGET - 1)
+        self.assertEqual(len(ticks), proc.preemptions + 1)
+        self.assertEqual(ticks, sorted(ticks))
+
+    def test_time_budget(self):
+        """With an exhausted time budget the process yields to the event loop after every step."""
+        proc = _TimeBudgetedSteps()
+        ticks = self._run_with_ticker(proc)
+
+        self.assertEqual(proc.outputs, {'steps': _FusedSteps.NUM_STEPS})
+        self.assertEqual(proc.preemptions, _FusedSteps.NUM_STEPS + 1)
+        self.assertEqual(len(ticks), proc.preemptions + 1)
+
+    def test_fused_time_budget(self):
+        """A chain of fused steps is cut once the time budget is exhausted, such that the process can yield."""
+        proc = _TimeBudgetedFusedSteps()
+        ticks = self._run_with_ticker(proc)
+
+        self.assertEqual(proc.outputs, {'steps': _FusedSteps.NUM_STEPS})
+        self.assertEqual(proc.fused, 0)
+        self.assertEqual(proc.preemptions, _FusedSteps.NUM_STEPS + 1)
+        self.assertEqual(len(ticks), proc.preemptions + 1)
+
+    def test_fused_step_budget(self):
+        """A chain of fused steps is cut once it has run ``STEP_BUDGET`` steps."""
+        proc = _BudgetedFusedSteps()
+        ticks = self._run_with_ticker(proc)
+
+        self.assertEqual(proc.outputs, {'steps': _FusedSteps.NUM_STEPS})
+        # ``run`` and the ten calls of ``next_step`` are run in four states of at most three steps each
+        self.assertEqual(proc.fused, 7)
+        self.assertGreater(proc.preemptions, 0)
+        self.assertEqual(ticks, sorted(ticks))
+
+
 class TestProcessNamespace(unittest.TestCase):
     def test_namespaced_process(self):
         """
@@ -1037,6 +1326,64 @@ class TestProcessNamespace(unittest.TestCase):
         self.assertEqual(process.outputs[namespace]['nested']['one'], 1)
         self.assertEqual(process.outputs[namespace]['nested']['two'], 2)
 
+    def test_out_many(self):
+        """Test that ``out_many`` records all outputs at once and fires a single batched listener event."""
+
+        class BatchListener(plumpy.ProcessListener):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def on_outputs_emitted(self, process, outputs):
+                self.batches.append(list(outputs))
+
+        class SingleListener(plumpy.ProcessListener):
+            def __init__(self):
+                super().__init__()
+                self.emitted = []
+
+            def on_output_emitted(self, process, output_port, value, dynamic):
+                self.emitted.append((output_port, value, dynamic))
+
+        class ManyOutputs(Process):
+            @classmethod
+            def define(cls, spec):
+                super().define(spec)
+                spec.input('valid', valid_type=bool, default=True)
+                spec.output('explicit', valid_type=int)
+                spec.output_namespace('results', valid_type=int, dynamic=True)
+
+            def run(self):
+                outputs = {'explicit': 1, 'results.a': 2, 'results.nested.b': 3}
+                if not self.inputs.valid:
+                    outputs['results.c'] = 'invalid'
+                try:
+                    self.out_many(outputs)
+                except ValueError:
+                    pass
+
+        batch_listener = BatchListener()
+        single_listener = SingleListener()
+        process = ManyOutputs()
+        process.add_process_listener(batch_listener)
+        process.add_process_listener(single_listener)
+        process.execute()
+
+        self.assertTrue(process.is_successful)
+        self.assertEqual(process.outputs, {'explicit': 1, 'results': {'a': 2, 'nested': {'b': 3}}})
+        expected = [('explicit', 1, False), ('results.a', 2, True), ('results.nested.b', 3, True)]
+        self.assertEqual(batch_listener.batches, [expected])
+        self.assertEqual(single_listener.emitted, expected)
+
+        # If any of the outputs is invalid, none of them are recorded
+        process = ManyOutputs(inputs={'valid': False})
+        process.add_process_listener(batch_listener)
+        process.execute()
+
+        self.assertFalse(process.is_successful)
+        self.assertEqual(process.outputs, {})
+        self.assertEqual(len(batch_listener.batches), 1)
+
 
 class TestProcessEvents(unittest.TestCase):
     def test_basic_events(self):
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 import asyncio
+import copy
 import functools
 import inspect
+import pickle
 import warnings
 
 import pytest
@@ -29,6 +31,54 @@ class TestAttributesFrozendict:
         with pytest.raises(TypeError):
             d['a'] = 5
 
+    def test_slots(self):
+        d = AttributesFrozendict({'a': 5})
+        assert not hasattr(d, '__dict__')
+
+        with pytest.raises(AttributeError):
+            d.b = 5
+
+    def test_mapping(self):
+        d = AttributesFrozendict({'a': 5, 'b': 6})
+        assert d.get('a') == 5
+        assert d.get('c', 7) == 7
+        assert list(d.keys()) == ['a', 'b']
+        assert list(d.values()) == [5, 6]
+        assert list(d.items()) == [('a', 5), ('b', 6)]
+        assert d == {'a': 5, 'b': 6}
+        assert d == AttributesFrozendict({'a': 5, 'b': 6})
+        assert d != {'a': 5}
+        assert hash(d) == hash(AttributesFrozendict({'b': 6, 'a': 5}))
+
+    def test_copy(self):
+        d = AttributesFrozendict({'a': 5, 'b': {'c': 6}})
+
+        replaced = d.copy(a=7)
+        assert isinstance(replaced, AttributesFrozendict)
+        assert replaced == {'a': 7, 'b': {'c': 6}}
+        assert d.a == 5
+
+        for copied in (copy.copy(d), copy.deepcopy(d)):
+            assert isinstance(copied, AttributesFrozendict)
+            assert copied == d
+            assert copied.b == {'c': 6}
+
+        assert copy.deepcopy(d).b is not d.b
+
+    def test_pickle(self):
+        d = AttributesFrozendict({'a': 5, 'b': AttributesFrozendict({'c': 6})})
+        loaded = pickle.loads(pickle.dumps(d))
+        assert isinstance(loaded, AttributesFrozendict)
+        assert loaded == d
+        assert loaded.b.c == 6
+
+    def test_setstate_without_slots(self):
+        """Test that the state of instances pickled before the class defined ``__slots__`` can be restored."""
+        d = AttributesFrozendict.__new__(AttributesFrozendict)
+        d.__setstate__({'_dict': {'a': 5}, '_hash': None, '_initialised': True})
+        assert d.a == 5
+        assert d == {'a': 5}
+
 
 def fct():
     pass
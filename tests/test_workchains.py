@@ -2,12 +2,15 @@
 import asyncio
 import inspect
 import unittest
+from unittest import mock
 
 import pytest
 
 import plumpy
+from plumpy import persistence
 from plumpy.process_listener import ProcessListener
 from plumpy.workchains import *
+from plumpy.workchains import Waiting, _Program
 
 from . import utils
 
@@ -682,3 +685,842 @@ def test_conditional_return_type(construct, recwarn):
 
     with pytest.warns(UserWarning):
         construct(invalid_conditional)[0].is_true(None)
+
+
+class ReturnIndex(plumpy.Process):
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.input('index')
+        spec.output('index')
+
+    def run(self):
+        self.out('index', self.inputs.index)
+
+
+class FanInWorkChain(WorkChain):
+    NUM_CHILDREN = 200
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outputs.dynamic = True
+        spec.outline(cls.launch_children, cls.collect)
+
+    def launch_children(self):
+        children = [self.launch(ReturnIndex, inputs={'index': index}) for index in range(self.NUM_CHILDREN)]
+        named = {f'child_{index}': self.launch(ReturnIndex, inputs={'index': index}) for index in range(3)}
+        return ToContext(children=FanIn(children), named=FanIn(named))
+
+    def collect(self):
+        self.out('indices', [result['index'] for result in self.ctx.children])
+        self.out('named', {key: result['index'] for key, result in self.ctx.named.items()})
+
+
+class TestFanIn(unittest.TestCase):
+    def test_to_context(self):
+        """The results of all children should be assigned to the context at once, in order."""
+        workchain = FanInWorkChain()
+        workchain.execute()
+
+        self.assertEqual(workchain.outputs['indices'], list(range(FanInWorkChain.NUM_CHILDREN)))
+        self.assertEqual(workchain.outputs['named'], {'child_0': 0, 'child_1': 1, 'child_2': 2})
+
+    def test_empty(self):
+        loop = plumpy.get_or_create_event_loop()
+        self.assertEqual(FanIn([], loop=loop).result(), [])
+        self.assertEqual(FanIn({}, loop=loop).result(), {})
+
+    def test_exception(self):
+        loop = plumpy.get_or_create_event_loop()
+        first, second = loop.create_future(), loop.create_future()
+        fan_in = FanIn([first, second], loop=loop)
+
+        second.set_exception(RuntimeError('child failed'))
+        loop.run_until_complete(asyncio.sleep(0))
+        with self.assertRaises(RuntimeError):
+            fan_in.result()
+
+    def test_save_load(self):
+        """Only the collected results are saved, pending children can be attached after loading."""
+        loop = plumpy.get_or_create_event_loop()
+        children = {'a': loop.create_future(), 'b': loop.create_future(), 'c': loop.create_future()}
+        fan_in = FanIn(children, loop=loop)
+        children['b'].set_result(2)
+        loop.run_until_complete(asyncio.sleep(0))
+        self.assertEqual(fan_in.pending(), ['a', 'c'])
+
+        loaded = plumpy.Savable.load(fan_in.save(), plumpy.LoadSaveContext(loop=loop))
+        self.assertIsInstance(loaded, FanIn)
+        self.assertEqual(loaded.pending(), ['a', 'c'])
+
+        with self.assertRaises(ValueError):
+            loaded.attach('b', loop.create_future())
+
+        child_a, child_c = loop.create_future(), loop.create_future()
+        loaded.attach('a', child_a)
+        loaded.attach('c', child_c)
+        child_a.set_result(1)
+        child_c.set_result(3)
+        loop.run_until_complete(asyncio.sleep(0))
+        self.assertEqual(loaded.result(), {'a': 1, 'b': 2, 'c': 3})
+
+    def test_attach_unknown(self):
+        loop = plumpy.get_or_create_event_loop()
+        fan_in = FanIn([loop.create_future()], loop=loop)
+
+        for key in (1, 'a', -1):
+            with self.assertRaises(ValueError):
+                fan_in.attach(key, loop.create_future())
+
+        fan_in.attach(0, loop.create_future())
+
+    def test_waiting_save_load(self):
+        """A waiting workchain saves the fan-in it waits for, with the results of the children that are done."""
+        loop = plumpy.get_or_create_event_loop()
+        workchain = FanInWorkChain()
+        first, second = loop.create_future(), loop.create_future()
+        fan_in = FanIn([first, second], loop=loop)
+        first.set_result(1)
+        loop.run_until_complete(asyncio.sleep(0))
+
+        waiting = Waiting(workchain, workchain._do_step, awaiting={fan_in: 'children'})
+        saved_state = waiting.save()
+        load_context = plumpy.LoadSaveContext(process=workchain, loop=loop)
+        loaded = plumpy.Savable.load(saved_state, load_context)
+
+        ((loaded_fan_in, key),) = loaded._awaiting.items()
+        self.assertEqual(key, 'children')
+        self.assertIsInstance(loaded_fan_in, FanIn)
+        self.assertEqual(loaded_fan_in.pending(), [1])
+        self.assertIs(loaded.data, loaded._awaiting)
+
+    def test_on_wait(self):
+        """The awaitables that a workchain waits for are passed to ``on_wait``."""
+        loop = plumpy.get_or_create_event_loop()
+        future = loop.create_future()
+        awaited = []
+
+        class Workchain(WorkChain):
+            @classmethod
+            def define(cls, spec):
+                super().define(spec)
+                spec.outline(cls.begin, cls.check)
+
+            def begin(self):
+                return ToContext(result=future)
+
+            def check(self):
+                pass
+
+            def on_wait(self, awaitables):
+                super().on_wait(awaitables)
+                awaited.append(awaitables)
+
+        workchain = Workchain()
+        loop.call_soon(future.set_result, 1)
+        workchain.execute()
+
+        self.assertEqual(awaited, [{future: 'result'}])
+        self.assertEqual(workchain.ctx.result, 1)
+
+
+class MapWorkChain(WorkChain):
+    MAX_CONCURRENT = 3
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outputs.dynamic = True
+        spec.outline(
+            cls.setup,
+            map_('items', cls.launch_child, target='results', max_concurrent=cls.MAX_CONCURRENT),
+            cls.collect,
+        )
+
+    def setup(self):
+        self.ctx.items = list(range(10))
+        self.ctx.running = 0
+        self.ctx.max_running = 0
+
+    def launch_child(self, item):
+        self.ctx.running += 1
+        self.ctx.max_running = max(self.ctx.max_running, self.ctx.running)
+        return self.run_item(item)
+
+    async def run_item(self, item):
+        await asyncio.sleep(0.001 * (item % 3))
+        self.ctx.running -= 1
+        return item * 2
+
+    def collect(self):
+        self.out('results', self.ctx.results)
+        self.out('max_running', self.ctx.max_running)
+
+
+class MapProcessWorkChain(WorkChain):
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outputs.dynamic = True
+        spec.outline(cls.setup, map_('items', cls.launch_child, target='results', max_concurrent=2), cls.collect)
+
+    def setup(self):
+        self.ctx.items = [0, 1, 2, 3]
+
+    def launch_child(self, item):
+        return self.launch(ReturnIndex, inputs={'index': item})
+
+    def collect(self):
+        self.out('indices', [result['index'] for result in self.ctx.results])
+
+
+class MapWaitingWorkChain(MapProcessWorkChain):
+    """Map whose first child finishes, while the second one waits forever."""
+
+    def setup(self):
+        self.ctx.items = [0, 1]
+
+    def launch_child(self, item):
+        if item == 0:
+            return self.launch(ReturnIndex, inputs={'index': item})
+        return self.launch(utils.WaitForSignalProcess)
+
+
+class TestMap(unittest.TestCase):
+    def test_map_coroutines(self):
+        """Results are collected in order, while no more than the maximum number of items are in flight."""
+        workchain = MapWorkChain()
+        workchain.execute()
+
+        self.assertEqual(workchain.outputs['results'], [item * 2 for item in range(10)])
+        self.assertEqual(workchain.outputs['max_running'], MapWorkChain.MAX_CONCURRENT)
+
+    def test_map_processes(self):
+        workchain = MapProcessWorkChain()
+        workchain.execute()
+        self.assertEqual(workchain.outputs['indices'], [0, 1, 2, 3])
+
+    def test_map_exception(self):
+        class MapExceptionWorkChain(MapProcessWorkChain):
+            def launch_child(self, item):
+                return self.launch(utils.ExceptionProcess)
+
+        workchain = MapExceptionWorkChain()
+        with self.assertRaises(RuntimeError):
+            workchain.execute()
+        self.assertTrue(workchain.is_excepted)
+
+    def test_map_invalid(self):
+        with self.assertRaises(TypeError):
+            map_('items', lambda self: None, target='results')
+
+        with self.assertRaises(ValueError):
+            map_('items', lambda self, item: None, target='results', max_concurrent=0)
+
+    def test_map_stepper_persistence(self):
+        """The cursor and completed results are saved, awaitables in flight are launched again after loading."""
+        loop = plumpy.get_or_create_event_loop()
+        workchain = MapWorkChain()
+        workchain.ctx.items = list(range(5))
+        workchain.ctx.running = 0
+        workchain.ctx.max_running = 0
+        instruction = map_('items', MapWorkChain.launch_child, target='results', max_concurrent=2)
+
+        stepper = instruction.create_stepper(workchain)
+        finished, _ = stepper.step()
+        self.assertFalse(finished)
+        loop.run_until_complete(asyncio.sleep(0.01))
+        stepper.step()
+
+        saved_state = stepper.save()
+        self.assertEqual(saved_state['_cursor'], 4)
+        self.assertEqual(saved_state['_results'], {0: 0, 1: 2})
+        self.assertEqual(sorted(saved_state['_in_flight']), [2, 3])
+
+        loaded = instruction.recreate_stepper(saved_state, workchain)
+        while True:
+            workchain._awaitables = {}
+            finished, _ = loaded.step()
+            if finished:
+                break
+            loop.run_until_complete(asyncio.gather(*workchain._awaitables))
+
+        self.assertEqual(workchain.ctx.results, [0, 2, 4, 6, 8])
+
+    def test_map_stepper_persistence_processes(self):
+        """Child processes that were in flight when the stepper was saved are not launched a second time."""
+        workchain = MapProcessWorkChain()
+        workchain.ctx.items = [0, 1, 2]
+        instruction = map_('items', MapProcessWorkChain.launch_child, target='results', max_concurrent=2)
+
+        stepper = instruction.create_stepper(workchain)
+        stepper.step()
+        loaded = instruction.recreate_stepper(stepper.save(), workchain)
+
+        with self.assertRaises(RuntimeError):
+            loaded.step()
+
+    def test_map_resume_processes_in_flight(self):
+        """A workchain saved while child processes of a map are in flight cannot be resumed."""
+        bundles = []
+
+        class BundleListener(plumpy.ProcessListener):
+            def on_process_running(self, process):
+                bundles.append(plumpy.Bundle(process))
+
+        workchain = MapWaitingWorkChain()
+        workchain.add_process_listener(BundleListener())
+        loop = plumpy.get_or_create_event_loop()
+
+        async def async_test():
+            await utils.run_until_waiting(workchain)
+            await asyncio.sleep(0.01)
+            workchain.kill()
+
+            # The last checkpoint is taken once the first child is done, while the second one is still in flight
+            bundle = bundles[-1]
+            self.assertEqual(len(bundle['stepper_state']['stepper_state']['_in_flight']), 2)
+
+            loaded = bundle.unbundle(plumpy.LoadSaveContext(loop=loop))
+            await loaded.step_until_terminated()
+            self.assertTrue(loaded.is_excepted)
+            self.assertIsInstance(loaded.exception(), RuntimeError)
+            self.assertIn('cannot reattach the child process', str(loaded.exception()))
+
+        loop.create_task(workchain.step_until_terminated())  # noqa: RUF006
+        loop.run_until_complete(async_test())
+
+    def test_map_items_not_sequence(self):
+        workchain = MapProcessWorkChain()
+        workchain.ctx.items = {0, 1}
+        stepper = map_('items', MapProcessWorkChain.launch_child, target='results').create_stepper(workchain)
+
+        with self.assertRaises(TypeError):
+            stepper.step()
+
+
+class TestOutlineProgram(unittest.TestCase):
+    def _resume_from_snapshots(self, workchain):
+        saver = utils.ProcessSaver(workchain)
+        workchain.execute()
+        self.assertEqual(workchain.ctx.counter, 3)
+
+        for snapshot in saver.snapshots:
+            loaded = snapshot.unbundle()
+            if not loaded.has_terminated():
+                loaded.execute()
+            self.assertTrue(loaded.is_successful)
+            self.assertEqual(loaded.ctx.counter, 3)
+
+        return saver.snapshots
+
+    def test_compiled_once(self):
+        self.assertIs(Wf.spec().get_program(), Wf.spec().get_program())
+
+    def test_resume_from_checkpoints(self):
+        """The saved stepper state is just the program counter, from which the workchain can resume."""
+        snapshots = self._resume_from_snapshots(Wf(inputs={'value': 'B'}))
+
+        for snapshot in snapshots:
+            stepper_state = snapshot.get(WorkChain._STEPPER_STATE)
+            if stepper_state is not None:
+                self.assertEqual(set(stepper_state) - {persistence.META}, {'_pc'})
+
+    def test_resume_from_legacy_checkpoints(self):
+        """Checkpoints with the stepper state of the nested outline steppers can still be loaded."""
+        workchain = Wf(inputs={'value': 'C'})
+        workchain._stepper = Wf.spec().get_outline().create_stepper(workchain)
+        snapshots = self._resume_from_snapshots(workchain)
+
+        self.assertTrue(any('_pos' in snapshot.get(WorkChain._STEPPER_STATE, {}) for snapshot in snapshots))
+
+
+class ParallelWorkChain(WorkChain):
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outputs.dynamic = True
+        spec.outline(
+            cls.setup,
+            parallel_(
+                (cls.launch_first, cls.inspect_first),
+                (cls.launch_second, cls.inspect_second),
+            ),
+            cls.join,
+        )
+
+    def setup(self):
+        self.ctx.steps = []
+
+    def launch_first(self):
+        self.ctx.steps.append('launch_first')
+        return ToContext(first=self.launch(ReturnIndex, inputs={'index': 1}))
+
+    def inspect_first(self):
+        self.ctx.steps.append('inspect_first')
+
+    def launch_second(self):
+        self.ctx.steps.append('launch_second')
+        self.to_context(second=self.launch(ReturnIndex, inputs={'index': 2}))
+
+    def inspect_second(self):
+        self.ctx.steps.append('inspect_second')
+
+    def join(self):
+        self.ctx.steps.append('join')
+        self.out('indices', [self.ctx.first['index'], self.ctx.second['index']])
+
+
+class ParallelMapWorkChain(WorkChain):
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outputs.dynamic = True
+        spec.outline(
+            cls.setup,
+            parallel_(map_('items', cls.double, target='doubled', max_concurrent=1), cls.launch_other),
+            cls.join,
+        )
+
+    def setup(self):
+        self.ctx.items = [1, 2, 3]
+
+    def double(self, item):
+        return self.double_item(item)
+
+    async def double_item(self, item):
+        await asyncio.sleep(0.001)
+        return item * 2
+
+    def launch_other(self):
+        return ToContext(other=self.launch(ReturnIndex, inputs={'index': 4}))
+
+    def join(self):
+        self.out('doubled', self.ctx.doubled)
+        self.out('other', self.ctx.other['index'])
+
+
+class TestParallel(unittest.TestCase):
+    def test_parallel(self):
+        """Both branches are launched before either is waited for, the join only runs once both have finished."""
+        workchain = ParallelWorkChain()
+        workchain.execute()
+
+        self.assertEqual(workchain.outputs['indices'], [1, 2])
+        self.assertEqual(workchain.ctx.steps[:2], ['launch_first', 'launch_second'])
+        self.assertEqual(sorted(workchain.ctx.steps[2:4]), ['inspect_first', 'inspect_second'])
+        self.assertEqual(workchain.ctx.steps[4:], ['join'])
+
+    def test_last_step_waits(self):
+        """A branch whose last step returns awaitables is only done once they are."""
+
+        class LastStepWorkChain(ParallelWorkChain):
+            @classmethod
+            def define(cls, spec):
+                super().define(spec)
+                spec.outline(cls.setup, parallel_(cls.launch_first, cls.launch_second), cls.join)
+
+        workchain = LastStepWorkChain()
+        workchain.execute()
+        self.assertEqual(workchain.outputs['indices'], [1, 2])
+
+    def test_description(self):
+        parallel = ParallelWorkChain.spec().get_outline()[1]
+        self.assertEqual(str(parallel), 'parallel_(2 branches)')
+        self.assertEqual(
+            parallel.get_description(),
+            {'parallel_()': [['launch_first', 'inspect_first'], ['launch_second', 'inspect_second']]},
+        )
+
+    def test_no_branches(self):
+        with self.assertRaises(ValueError):
+            parallel_()
+
+    def test_exception(self):
+        class ParallelExceptionWorkChain(ParallelWorkChain):
+            def launch_second(self):
+                self.ctx.steps.append('launch_second')
+                return ToContext(second=self.launch(utils.ExceptionProcess))
+
+        workchain = ParallelExceptionWorkChain()
+        with self.assertRaises(RuntimeError):
+            workchain.execute()
+        self.assertTrue(workchain.is_excepted)
+        self.assertNotIn('join', workchain.ctx.steps)
+
+    def test_snapshots(self):
+        """The workchain can be resumed from each snapshot that is taken while it runs."""
+        workchain = ParallelWorkChain()
+        saver = utils.ProcessSaver(workchain)
+        workchain.execute()
+        self.assertTrue(any('stepper_state' in snapshot[WorkChain._STEPPER_STATE] for snapshot in saver.snapshots))
+
+        for snapshot in saver.snapshots:
+            loaded = snapshot.unbundle()
+            if not loaded.has_terminated():
+                loaded.execute()
+            self.assertTrue(loaded.is_successful)
+            self.assertEqual(loaded.outputs['indices'], [1, 2])
+
+    def test_nested_map_persistence(self):
+        """A branch with a nested ``map_`` that waits for its children is stepped again after loading."""
+        loop = plumpy.get_or_create_event_loop()
+        workchain = ParallelMapWorkChain()
+        workchain.ctx.items = [1, 2, 3]
+        parallel = ParallelMapWorkChain.spec().get_outline()[1]
+
+        stepper = parallel.create_stepper(workchain)
+        workchain._awaitables = {}
+        stepper.step()
+        saved_state = stepper.save()
+        self.assertEqual(saved_state[stepper.WAITING], [[None], ['other']])
+
+        # The child of the other branch finishes before the workchain is loaded, so its result is in the context
+        loop.run_until_complete(next(iter(stepper._waiting[1])))
+        self.assertEqual(workchain.ctx.other['index'], 4)
+
+        loaded = parallel.recreate_stepper(saved_state, workchain)
+        while True:
+            workchain._awaitables = {}
+            finished, _ = loaded.step()
+            if finished:
+                break
+            loop.run_until_complete(asyncio.gather(*workchain._awaitables))
+
+        self.assertEqual(workchain.ctx.doubled, [2, 4, 6])
+
+    def test_nested_map(self):
+        workchain = ParallelMapWorkChain()
+        workchain.execute()
+        self.assertEqual(workchain.outputs['doubled'], [2, 4, 6])
+        self.assertEqual(workchain.outputs['other'], 4)
+
+    def test_exit_code(self):
+        class ParallelExitCodeWorkChain(ParallelWorkChain):
+            def inspect_first(self):
+                return 5
+
+        workchain = ParallelExitCodeWorkChain()
+        workchain.execute()
+        self.assertEqual(workchain.state, plumpy.ProcessState.FINISHED)
+        self.assertNotIn('join', workchain.ctx.steps)
+
+
+class AsCompletedWorkChain(WorkChain):
+    NUM_CHILDREN = 6
+    BATCH_SIZE = 1
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outputs.dynamic = True
+        spec.outline(as_completed_(cls.launch_children, cls.handle_results, batch_size=cls.BATCH_SIZE), cls.collect)
+
+    def launch_children(self):
+        self.ctx.batches = []
+        self.ctx.finished = 0
+        return {f'child_{index}': self.run_child(index) for index in reversed(range(self.NUM_CHILDREN))}
+
+    async def run_child(self, index):
+        for _ in range(10 * index):
+            await asyncio.sleep(0)
+        self.ctx.finished += 1
+        return index
+
+    def handle_results(self, results):
+        self.ctx.batches.append((self.ctx.finished, results))
+
+    def collect(self):
+        self.out('results', [result for _, results in self.ctx.batches for result in results.values()])
+        self.out('finished', [finished for finished, _ in self.ctx.batches])
+
+
+class AsCompletedProcessWorkChain(WorkChain):
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outputs.dynamic = True
+        spec.outline(as_completed_(cls.launch_children, cls.handle_results))
+
+    def launch_children(self):
+        return [self.launch(ReturnIndex, inputs={'index': index}) for index in range(3)]
+
+    def handle_results(self, results):
+        for key, result in results.items():
+            self.out(f'index_{key}', result['index'])
+
+
+class TestAsCompleted(unittest.TestCase):
+    def test_as_completed(self):
+        """Results are handled in the order in which the children complete, while other children are still running."""
+        workchain = AsCompletedWorkChain()
+        workchain.execute()
+
+        self.assertEqual(workchain.outputs['results'], list(range(AsCompletedWorkChain.NUM_CHILDREN)))
+        self.assertLess(workchain.outputs['finished'][0], AsCompletedWorkChain.NUM_CHILDREN)
+        for finished, results in workchain.ctx.batches:
+            self.assertEqual(list(results), [f'child_{index}' for index in results.values()])
+
+    def test_batch_size(self):
+        class BatchedWorkChain(AsCompletedWorkChain):
+            BATCH_SIZE = 4
+
+        workchain = BatchedWorkChain()
+        workchain.execute()
+
+        self.assertEqual(workchain.outputs['results'], list(range(BatchedWorkChain.NUM_CHILDREN)))
+        sizes = [len(results) for _, results in workchain.ctx.batches]
+        self.assertGreaterEqual(sizes[0], BatchedWorkChain.BATCH_SIZE)
+        self.assertEqual(sum(sizes), BatchedWorkChain.NUM_CHILDREN)
+
+    def test_processes(self):
+        workchain = AsCompletedProcessWorkChain()
+        workchain.execute()
+        self.assertEqual(workchain.outputs, {'index_0': 0, 'index_1': 1, 'index_2': 2})
+
+    def test_no_children(self):
+        class NoChildrenWorkChain(AsCompletedProcessWorkChain):
+            def launch_children(self):
+                return []
+
+        workchain = NoChildrenWorkChain()
+        workchain.execute()
+        self.assertTrue(workchain.is_successful)
+
+    def test_exception(self):
+        class AsCompletedExceptionWorkChain(AsCompletedProcessWorkChain):
+            def launch_children(self):
+                return [self.launch(utils.ExceptionProcess)]
+
+        workchain = AsCompletedExceptionWorkChain()
+        with self.assertRaises(RuntimeError):
+            workchain.execute()
+        self.assertTrue(workchain.is_excepted)
+
+    def test_exit_code(self):
+        class AsCompletedExitCodeWorkChain(AsCompletedProcessWorkChain):
+            def handle_results(self, results):
+                self.out('handled', len(results))
+                return 5
+
+        workchain = AsCompletedExitCodeWorkChain()
+        workchain.execute()
+        self.assertEqual(workchain.state, plumpy.ProcessState.FINISHED)
+        self.assertEqual(list(workchain.outputs), ['handled'])
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            as_completed_(lambda self, extra: None, lambda self, results: None)
+
+        with self.assertRaises(TypeError):
+            as_completed_(lambda self: None, lambda self: None)
+
+        with self.assertRaises(ValueError):
+            as_completed_(lambda self: None, lambda self, results: None, batch_size=0)
+
+    def test_description(self):
+        instruction = AsCompletedWorkChain.spec().get_outline()[0]
+        self.assertEqual(str(instruction), 'as_completed_(launch_children, handle_results)')
+        self.assertEqual(
+            instruction.get_description(), 'as_completed_(launch_children, handle_results) in batches of 1'
+        )
+
+
+class Accumulate(WorkChain):
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.input('start', default=0)
+        spec.input('increments', default=3)
+        spec.output('total')
+        spec.outline(cls.setup, while_(cls.not_done)(cls.add), cls.finalize)
+
+    def setup(self):
+        self.ctx.total = self.inputs.start
+        self.ctx.count = 0
+
+    def not_done(self):
+        return self.ctx.count < self.inputs.increments
+
+    def add(self):
+        self.ctx.total += self.get_increment()
+        self.ctx.count += 1
+
+    def get_increment(self):
+        return 2
+
+    def finalize(self):
+        self.out('total', self.ctx.total)
+
+
+class LaunchIndex(WorkChain):
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.input('index')
+        spec.output('index')
+        spec.outline(cls.launch_child, cls.finalize)
+
+    def launch_child(self):
+        return ToContext(child=self.launch(ReturnIndex, inputs={'index': self.inputs.index}))
+
+    def finalize(self):
+        self.out('index', self.ctx.child['index'])
+
+
+class InlineWorkChain(WorkChain):
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.expose_inputs(Accumulate, namespace='first')
+        spec.expose_inputs(Accumulate, namespace='second')
+        spec.expose_outputs(Accumulate, namespace='first')
+        spec.expose_outputs(Accumulate, namespace='second')
+        spec.outline(inline_(Accumulate, namespace='first'), inline_(Accumulate, namespace='second'), cls.collect)
+
+    def collect(self):
+        self.ctx.counter = 3
+
+
+class TestInline(unittest.TestCase):
+    def test_inline(self):
+        """Each inlined workchain has the context, inputs and outputs of its namespace."""
+        workchain = InlineWorkChain(inputs={'first': {'start': 1}, 'second': {'increments': 1}})
+        workchain.execute()
+
+        self.assertTrue(workchain.is_successful)
+        self.assertEqual(workchain.outputs, {'first': {'total': 7}, 'second': {'total': 2}})
+        self.assertEqual(workchain.ctx.first.count, 3)
+        self.assertEqual(workchain.ctx.second.count, 1)
+        self.assertNotIn('total', vars(workchain.ctx))
+
+        process = Accumulate(inputs={'start': 1})
+        process.execute()
+        self.assertEqual(process.outputs['total'], workchain.outputs['first']['total'])
+
+    def test_to_context(self):
+        class InlineLaunchWorkChain(WorkChain):
+            @classmethod
+            def define(cls, spec):
+                super().define(spec)
+                spec.expose_inputs(LaunchIndex, namespace='sub')
+                spec.expose_outputs(LaunchIndex, namespace='sub')
+                spec.outline(inline_(LaunchIndex, namespace='sub'))
+
+        workchain = InlineLaunchWorkChain(inputs={'sub': {'index': 4}})
+        workchain.execute()
+
+        self.assertEqual(workchain.outputs, {'sub': {'index': 4}})
+        self.assertEqual(workchain.ctx.sub.child, {'index': 4})
+        self.assertNotIn('child', vars(workchain.ctx))
+
+    def test_resume_from_checkpoints(self):
+        workchain = InlineWorkChain()
+        saver = utils.ProcessSaver(workchain)
+        workchain.execute()
+
+        for snapshot in saver.snapshots:
+            loaded = snapshot.unbundle()
+            if not loaded.has_terminated():
+                loaded.execute()
+            self.assertTrue(loaded.is_successful)
+            self.assertEqual(loaded.outputs, workchain.outputs)
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            inline_(ReturnIndex)
+
+    def test_description(self):
+        instruction = InlineWorkChain.spec().get_outline()[0]
+        self.assertEqual(str(instruction), 'inline_(Accumulate)')
+        self.assertEqual(
+            instruction.get_description(), {'inline_(Accumulate)': Accumulate.spec().get_outline().get_description()}
+        )
+
+
+class ContextAccessWorkChain(WorkChain):
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outputs.dynamic = True
+        spec.outline(cls.setup, cls.launch_first, cls.launch_second, cls.inspect)
+
+    def setup(self):
+        self.children = []
+        self.terminated = None
+
+    @context_access(writes=['first'])
+    def launch_first(self):
+        self.children.append(self.launch(ReturnIndex, inputs={'index': 1}))
+        return ToContext(first=self.children[-1])
+
+    @context_access(writes=['second'])
+    def launch_second(self):
+        # Whether the child of the first step had terminated when this step is called
+        self.terminated = self.children[0].has_terminated()
+        return ToContext(second=self.launch(ReturnIndex, inputs={'index': 2}))
+
+    @context_access(reads=['first', 'second'])
+    def inspect(self):
+        self.out('indices', [self.ctx.first['index'], self.ctx.second['index']])
+
+
+class TestContextAccess(unittest.TestCase):
+    def test_independent_steps(self):
+        """Independent steps are run as a parallel block, so the second child is launched before the first is done."""
+        workchain = ContextAccessWorkChain()
+        workchain.execute()
+
+        self.assertEqual(workchain.outputs['indices'], [1, 2])
+        self.assertFalse(workchain.terminated)
+
+        operations = ContextAccessWorkChain.spec().get_program().operations
+        self.assertEqual([operation.code for operation in operations], [_Program.CALL, _Program.STEPPER, _Program.CALL])
+
+    def test_dependent_steps(self):
+        """A step that reads a key written by the previous one waits for it."""
+
+        class DependentWorkChain(ContextAccessWorkChain):
+            @context_access(reads=['first'], writes=['second'])
+            def launch_second(self):
+                return super().launch_second()
+
+        workchain = DependentWorkChain()
+        workchain.execute()
+
+        self.assertTrue(workchain.terminated)
+        operations = DependentWorkChain.spec().get_program().operations
+        self.assertEqual([operation.code for operation in operations], [_Program.CALL] * 4)
+
+    def test_check_context_access(self):
+        """With the check enabled, correct declarations pass while a step that accesses undeclared keys raises."""
+        with mock.patch.object(plumpy.settings, 'check_context_access', True):
+            workchain = ContextAccessWorkChain()
+            workchain.execute()
+            self.assertEqual(workchain.outputs['indices'], [1, 2])
+
+            class UndeclaredWorkChain(ContextAccessWorkChain):
+                @context_access(reads=['first'])
+                def inspect(self):
+                    self.ctx.second
+
+            workchain = UndeclaredWorkChain()
+            with self.assertRaisesRegex(RuntimeError, 'read the context key `second`'):
+                workchain.execute()
+
+            class UndeclaredToContextWorkChain(ContextAccessWorkChain):
+                @context_access(writes=['first'])
+                def launch_second(self):
+                    return ToContext(second=self.launch(ReturnIndex, inputs={'index': 2}))
+
+            workchain = UndeclaredToContextWorkChain()
+            with self.assertRaisesRegex(RuntimeError, 'write the context key `second`'):
+                workchain.execute()
+
+    def test_description(self):
+        """The grouping is an implementation detail of the compiled program, the outline is unchanged."""
+        self.assertEqual(
+            ContextAccessWorkChain.spec().get_outline().get_description(),
+            ['setup', 'launch_first', 'launch_second', 'inspect'],
+        )